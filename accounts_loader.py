@@ -1,12 +1,10 @@
 import dataclasses
-import json
-import re
 import warnings
 from pathlib import Path
 
 import pandas as pd
 
-import utils
+from eligibility_index import EligibilityIndex
 from logger import logging
 
 def shorten_private_key(private_key: str) -> str:
@@ -28,125 +26,160 @@ class BotAccount:
         return shorten_private_key(self.private_key)
 
 
-def read_accounts() -> list[BotAccount]:
-    warnings.filterwarnings(
-        'ignore',
-        category=UserWarning,
-        module='openpyxl'
-    )
-    pd.set_option('future.no_silent_downcasting', True)
+ACCOUNTS_FILE_NAMES = ['wallets.xlsx', 'wallets.csv', 'wallets.jsonl']
+ACCOUNTS_CACHE_PATH = Path(__file__).parent / '.wallets_cache.pkl'
+REQUIRED_COLUMNS = ['private_key', 'address', 'proxy', 'deposit_address']
+HEX_PATTERN = r'(0x)?[a-fA-F0-9]+'
+PROXY_SCHEME_PATTERN = r'(socks5|http)://'
 
-    logging.info('[Account Loader] Loading accounts')
 
-    with open('eligibilities.json') as file:
-        eligibilities = json.load(file)
+def find_accounts_file() -> Path | None:
+    for file_name in ACCOUNTS_FILE_NAMES:
+        file_path = Path(__file__).parent / file_name
+        if file_path.exists():
+            return file_path
 
-    with open('claimed.json') as file:
-        claimed = json.load(file)
 
-    accounts = []
+def _read_accounts_file(file_path: Path) -> pd.DataFrame:
+    """
+    Reads accounts file into a DataFrame of stripped strings. The result is cached on disk
+    and reused until the file's modification time or size changes.
+    """
+    stat = file_path.stat()
+    cache_key = (file_path.name, stat.st_mtime_ns, stat.st_size)
 
-    default_account_values = {}
-    for field in dataclasses.fields(BotAccount):
-        if field.default != dataclasses.MISSING:
-            default_account_values[field.name] = field.default
+    if ACCOUNTS_CACHE_PATH.exists():
+        try:
+            cached = pd.read_pickle(ACCOUNTS_CACHE_PATH)
+        except Exception as e:
+            logging.warning(f'[Account Loader] Failed to read accounts cache: {e}')
+        else:
+            if cached['key'] == cache_key:
+                return cached['accounts']
+
+    if file_path.suffix == '.xlsx':
+        warnings.filterwarnings(
+            'ignore',
+            category=UserWarning,
+            module='openpyxl'
+        )
+        accounts_df = pd.read_excel(file_path, dtype=str)
+    elif file_path.suffix == '.csv':
+        accounts_df = pd.read_csv(file_path, dtype=str)
+    else:
+        accounts_df = pd.read_json(file_path, lines=True, dtype=False)
+        accounts_df = accounts_df.astype(object).where(accounts_df.isna(), accounts_df.astype(str))
 
-    acounts_file_path = Path(__file__).parent / 'wallets.xlsx'
+    accounts_df = accounts_df.apply(lambda x: x.str.strip() if x.dtype == object else x)
 
-    if not acounts_file_path.exists():
-        logging.error(f'[Account Loader] File "{acounts_file_path.name}" does not exist')
-        return False
+    try:
+        pd.to_pickle({'key': cache_key, 'accounts': accounts_df}, ACCOUNTS_CACHE_PATH)
+    except Exception as e:
+        logging.warning(f'[Account Loader] Failed to write accounts cache: {e}')
 
-    accounts_file = pd.ExcelFile(acounts_file_path)
-    sheets = [sheet.lower() for sheet in accounts_file.sheet_names]
-    del accounts_file
+    return accounts_df
 
-    dtypes = {
-        'Private key': str,
-        'Address': str,
-        'Proxy': str,
-        'Deposit address': str
-    }
 
-    accounts_df = pd.read_excel(
-        acounts_file_path,
-        dtype=dtypes
-    )
-    accounts_df = accounts_df.apply(lambda x: x.str.strip() if x.dtype == object else x)
-    accounts_df.columns = ['_'.join(column.lower().split(' ')) for column in accounts_df.columns]
+def _extend_hex_column(column: pd.Series, length: int) -> pd.Series:
+    """
+    Vectorized version of ``utils.extend_hex``.
+    """
+    extended = '0x' + column.str[2:].str.rjust(length, '0')
+    return extended.where(column.str.startswith('0x'), column)
+
+
+def read_accounts() -> list[BotAccount]:
+    logging.info('[Account Loader] Loading accounts')
+
+    eligibilities = EligibilityIndex.load()
+
+    acounts_file_path = find_accounts_file()
+
+    if acounts_file_path is None:
+        logging.error(f'[Account Loader] File "{ACCOUNTS_FILE_NAMES[0]}" does not exist')
+        return False
+
+    accounts_df = _read_accounts_file(acounts_file_path)
+    accounts_df.columns = ['_'.join(str(column).lower().split(' ')) for column in accounts_df.columns]
     unknown_account_columns = set(accounts_df.columns) - {field.name for field in dataclasses.fields(BotAccount)}
 
     if unknown_account_columns:
         logging.error(f'[Account Loader] Unknown account columns: {", ".join(unknown_account_columns)}')
         return False
 
-    accounts_df.dropna(subset=['private_key', 'address'], inplace=True, how='all')
-    for column in accounts_df.columns:
-        if column in default_account_values:
-            accounts_df[column] = accounts_df[column].fillna(
-                default_account_values[column]
-            )
-        else:
-            accounts_df[column] = accounts_df[column].fillna(-31294912).replace(-31294912, None)
-
-    for row in accounts_df.itertuples():
-        row_address = utils.extend_hex(row.address, 64)
-
-        if row_address.lower() not in eligibilities:
-            logging.warning(f'[Account Loader] Address "{row_address}" is not eligible')
-            continue
-
-        if not row.private_key:
-            logging.error(f'[Account Loader] Missing private key on row {row.Index + 1}')
-            return False
-
-        if not row_address:
-            logging.error(f'[Account Loader] Missing address on row {row.Index + 1}')
-            return False
-        elif not row.deposit_address:
-            logging.error(f'[Account Loader] Missing deposit address on row {row.Index + 1}')
-            return False
-        elif not re.match(r'^(0x)?[a-fA-F0-9]+$', row.private_key):
-            short_private_key = shorten_private_key(row.private_key)
-            logging.error(f'[Account Loader] Invalid private key "{short_private_key}" on row {row.Index + 1}')
-            return False
-        elif not re.match(r'^(0x)?[a-fA-F0-9]+$', row_address):
-            logging.error(f'[Account Loader] Invalid address "{row_address}" on row {row.Index + 1}')
-            return False
-
-        if row.proxy:
-            if re.match(r'(socks5|http)://', row.proxy):
-                proxy = {
-                    'http': row.proxy,
-                    'https': row.proxy
-                }
-            elif '/' not in row.proxy:
-                proxy = {
-                    'http': f'http://{row.proxy}',
-                    'https': f'http://{row.proxy}'
-                }
-            else:
-                logging.error(f'[Account Loader] Invalid proxy "{row.proxy}"')
+    missing_account_columns = [column for column in REQUIRED_COLUMNS if column not in accounts_df.columns]
+
+    if missing_account_columns:
+        logging.error(f'[Account Loader] Missing {", ".join(missing_account_columns)} column')
+        return
+
+    accounts_df = accounts_df.dropna(subset=['private_key', 'address'], how='all')
+
+    private_keys = accounts_df['private_key'].fillna('')
+    addresses = _extend_hex_column(accounts_df['address'].fillna(''), 64)
+    proxies = accounts_df['proxy'].fillna('')
+    deposit_addresses = accounts_df['deposit_address'].fillna('')
+
+    amounts = pd.Series(
+        eligibilities.lookup(addresses.tolist()),
+        index=addresses.index,
+        dtype=object
+    )
+    eligible = amounts.notna()
+
+    for address in addresses[~eligible]:
+        logging.warning(f'[Account Loader] Address "{address}" is not eligible')
+
+    private_keys = private_keys[eligible]
+    addresses = addresses[eligible]
+    proxies = proxies[eligible]
+    deposit_addresses = deposit_addresses[eligible]
+    amounts = amounts[eligible]
+
+    has_proxy_scheme = proxies.str.match(PROXY_SCHEME_PATTERN)
+
+    checks = [
+        (private_keys == '', lambda index: f'Missing private key on row {index + 1}'),
+        (addresses == '', lambda index: f'Missing address on row {index + 1}'),
+        (deposit_addresses == '', lambda index: f'Missing deposit address on row {index + 1}'),
+        (
+            ~private_keys.str.fullmatch(HEX_PATTERN),
+            lambda index: f'Invalid private key "{shorten_private_key(private_keys[index])}" on row {index + 1}'
+        ),
+        (~addresses.str.fullmatch(HEX_PATTERN), lambda index: f'Invalid address "{addresses[index]}" on row {index + 1}'),
+        (
+            (proxies != '') & ~has_proxy_scheme & proxies.str.contains('/', regex=False),
+            lambda index: f'Invalid proxy "{proxies[index]}"'
+        )
+    ]
+
+    invalid = pd.concat([mask for mask, _ in checks], axis=1).any(axis=1)
+
+    if invalid.any():
+        index = invalid.idxmax()
+        for mask, message in checks:
+            if mask[index]:
+                logging.error(f'[Account Loader] {message(index)}')
                 return False
-        else:
-            proxy = None
 
-        try:
-            account = BotAccount(
-                private_key=row.private_key,
-                address=row_address,
-                proxy=proxy,
-                deposit_address=row.deposit_address,
-                amount=eligibilities[row_address.lower()]
-            )
-        except AttributeError as e:
-            res = re.search("has no attribute '(?P<attribute>.+)'", str(e))
-            if res:
-                attribute = res.group('attribute')
-                logging.error(f'[Account Loader] Missing {attribute} column')
-            else:
-                logging.error(f'[Account Loader] Failed to load account: {e}')
-            return
-        accounts.append(account)
-
-    return accounts
+    proxies = proxies.where(has_proxy_scheme | (proxies == ''), 'http://' + proxies)
+
+    return [
+        BotAccount(
+            private_key=private_key,
+            address=address,
+            proxy={
+                'http': proxy,
+                'https': proxy
+            } if proxy else None,
+            deposit_address=deposit_address,
+            amount=amount
+        )
+        for private_key, address, proxy, deposit_address, amount in zip(
+            private_keys,
+            addresses,
+            proxies,
+            deposit_addresses,
+            amounts
+        )
+    ]
@@ -0,0 +1,175 @@
+import asyncio
+import collections
+import itertools
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+from twocaptcha import TwoCaptcha
+
+from logger import logging
+from starknet_py.net.metrics import Metrics
+
+
+class CaptchaSolver(ABC):
+    @abstractmethod
+    def solve(self, url: str, site_key: str) -> str:
+        """
+        Solves reCAPTCHA of the given page. Called from a worker thread.
+
+        :return: reCAPTCHA token.
+        """
+
+
+class TwoCaptchaSolver(CaptchaSolver):
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+
+    def solve(self, url: str, site_key: str) -> str:
+        return TwoCaptcha(self.api_key).recaptcha(
+            sitekey=site_key,
+            url=url,
+            ivisible=1
+        )['code']
+
+
+class FakeCaptchaSolver(CaptchaSolver):
+    """
+    Local solver for tests: returns numbered tokens after ``delay`` seconds,
+    failing every ``fail_every``-th solve if set.
+    """
+
+    def __init__(self, delay: float = 0, fail_every: int | None = None):
+        self.delay = delay
+        self.fail_every = fail_every
+        self._counter = itertools.count(1)
+
+    def solve(self, url: str, site_key: str) -> str:
+        number = next(self._counter)
+        time.sleep(self.delay)
+        if self.fail_every and number % self.fail_every == 0:
+            raise RuntimeError(f'Fake captcha solve {number} failed')
+        return f'fake-token-{number}'
+
+
+class CaptchaBroker:
+    """
+    Hands out reCAPTCHA tokens to workers.
+
+    Up to ``concurrency`` solves run in parallel on one shared executor. Besides solving
+    tokens for waiting workers, the broker keeps ``pool_size`` pre-solved tokens ready.
+    Tokens are dropped ``ttl`` seconds after being solved. Failed solves are retried
+    with exponential backoff, starting at ``base_backoff`` and up to ``max_backoff`` seconds. Solves are timed in ``metrics``
+    if given.
+    """
+
+    def __init__(
+        self,
+        solver: CaptchaSolver,
+        url: str,
+        site_key: str,
+        pool_size: int = 0,
+        concurrency: int = 1,
+        ttl: float = 110,
+        base_backoff: float = 1,
+        max_backoff: float = 60,
+        metrics: Metrics | None = None
+    ):
+        if concurrency <= 0:
+            raise ValueError('Captcha concurrency has to be greater than 0')
+
+        self.solver = solver
+        self.url = url
+        self.site_key = site_key
+        self.pool_size = pool_size
+        self.concurrency = concurrency
+        self.ttl = ttl
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.metrics = metrics
+
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='captcha')
+        self._tokens: collections.deque[tuple[float, str]] = collections.deque()
+        self._waiters: collections.deque[asyncio.Future] = collections.deque()
+        self._solves: set[asyncio.Task] = set()
+        self._failures = 0
+        self._closed = False
+
+    @property
+    def available(self) -> int:
+        self._evict_expired()
+        return len(self._tokens)
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        while self._tokens and self._tokens[0][0] <= now:
+            self._tokens.popleft()
+
+    def _refill(self):
+        if self._closed:
+            return
+
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+
+        demand = sum(not waiter.done() for waiter in self._waiters) + self.pool_size - self.available
+        while len(self._solves) < min(demand, self.concurrency):
+            task = asyncio.create_task(self._solve())
+            self._solves.add(task)
+            task.add_done_callback(self._solves.discard)
+
+    def _deliver(self, token: str):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(token)
+                return
+        self._tokens.append((time.monotonic() + self.ttl, token))
+
+    async def _solve(self):
+        loop = asyncio.get_running_loop()
+        start_time = time.monotonic()
+        try:
+            token = await loop.run_in_executor(self._executor, self.solver.solve, self.url, self.site_key)
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record('captcha_solve', time.monotonic() - start_time, error=True)
+            self._failures += 1
+            backoff = min(self.base_backoff * 2 ** (self._failures - 1), self.max_backoff)
+            logging.warning(f'[Captcha] Failed to solve captcha, retrying in {backoff} seconds: {e}')
+            await asyncio.sleep(backoff)
+        else:
+            if self.metrics is not None:
+                self.metrics.record('captcha_solve', time.monotonic() - start_time)
+            self._failures = 0
+            self._deliver(token)
+        finally:
+            self._solves.discard(asyncio.current_task())
+            self._refill()
+
+    def start(self):
+        """
+        Starts pre-solving tokens. Must be called from within a running event loop.
+        """
+        self._refill()
+
+    async def get_token(self) -> str:
+        self._evict_expired()
+        if self._tokens:
+            _, token = self._tokens.popleft()
+            self._refill()
+            return token
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._refill()
+        return await waiter
+
+    async def close(self):
+        self._closed = True
+        for waiter in self._waiters:
+            waiter.cancel()
+        for task in list(self._solves):
+            task.cancel()
+        await asyncio.gather(*self._solves, return_exceptions=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,102 @@
+import asyncio
+import re
+
+import pytest
+
+from captcha import CaptchaBroker, CaptchaSolver, FakeCaptchaSolver
+from starknet_py.net.metrics import Metrics
+
+URL = 'https://example.test/'
+SITE_KEY = 'site-key'
+
+
+class FlakyCaptchaSolver(FakeCaptchaSolver):
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def solve(self, url: str, site_key: str) -> str:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError('Solver is down')
+        return super().solve(url, site_key)
+
+
+async def wait_until(condition, timeout: float = 2):
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_solver_is_abstract():
+    with pytest.raises(TypeError):
+        CaptchaSolver()  # pylint: disable=abstract-class-instantiated
+
+
+@pytest.mark.asyncio
+async def test_pool_is_refilled():
+    broker = CaptchaBroker(FakeCaptchaSolver(), URL, SITE_KEY, pool_size=2, concurrency=2)
+    broker.start()
+
+    await wait_until(lambda: broker.available == 2)
+    assert await broker.get_token() == 'fake-token-1'
+    await wait_until(lambda: broker.available == 2)
+    assert await broker.get_token() == 'fake-token-2'
+
+    await broker.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_tokens_are_evicted():
+    broker = CaptchaBroker(FakeCaptchaSolver(), URL, SITE_KEY, pool_size=1, ttl=0.05)
+    broker.start()
+
+    await wait_until(lambda: broker.available == 1)
+    await asyncio.sleep(0.1)
+
+    assert broker.available == 0
+    assert await broker.get_token() == 'fake-token-2'
+
+    await broker.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_solves_are_retried_with_backoff(caplog):
+    metrics = Metrics('test')
+    broker = CaptchaBroker(
+        FlakyCaptchaSolver(failures=4),
+        URL,
+        SITE_KEY,
+        base_backoff=0.01,
+        max_backoff=0.04,
+        metrics=metrics
+    )
+
+    assert await asyncio.wait_for(broker.get_token(), 2) == 'fake-token-1'
+
+    backoffs = [
+        float(match)
+        for match in re.findall(r'retrying in ([\d.]+) seconds', caplog.text)
+    ]
+    assert backoffs == [0.01, 0.02, 0.04, 0.04]
+    assert metrics.get('captcha_solve').errors == 4
+    assert metrics.get('captcha_solve').requests == 5
+
+    await broker.close()
+
+
+@pytest.mark.asyncio
+async def test_close_shuts_down_executor():
+    broker = CaptchaBroker(FakeCaptchaSolver(delay=0.2), URL, SITE_KEY)
+    waiter = asyncio.create_task(broker.get_token())
+    await asyncio.sleep(0)
+
+    await broker.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    # pylint: disable=protected-access
+    with pytest.raises(RuntimeError, match='after shutdown'):
+        broker._executor.submit(print)
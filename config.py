@@ -7,7 +7,33 @@ class Config(BaseModel):
     threads: int
     max_retries: int
     rpc_url: str
+    rpc_urls: typing.List[str] = []
+    rpc_timeout: float = 30
+    rpc_rate_limit: float = 0
+    rpc_trusted: bool = False
+    proxy_rate_limit: float = 0
+    http_max_attempts: int = 3
+    retry_base_delay: float = 1
+    retry_max_delay: float = 60
+    breaker_threshold: int = 5
+    breaker_reset_timeout: float = 60
     comission_mode: str
+    account_timeout: typing.Optional[float] = None
+    progress_interval: float = 10
+    connections_per_host: int = 10
+    prefetch_chunk_size: int = 100
+    prefetch_concurrency: int = 5
+    captcha_pool_size: int = 0
+    captcha_concurrency: int = 10
+    fee_estimate_chunk_size: int = 20
+    fee_template_ttl: float = 0
+    proxy_check_concurrency: int = 20
+    proxy_check_url: str = 'https://google.com'
+    proxy_check_timeout: float = 5
+    proxy_check_ttl: float = 600
+    dead_proxy_mode: str = 'skip'
+    metrics_port: int = 0
+    metrics_path: typing.Optional[str] = None
 
     @classmethod
     def load(cls):
@@ -0,0 +1,154 @@
+"""
+Compiles eligibilities.json into a sorted binary index of fixed-width records
+(32-byte big-endian address + amount), which is memory-mapped and searched
+instead of loading the whole JSON into memory. Integer amounts are stored exactly
+as 32-byte big-endian numbers, float64 is used only for fractional amounts.
+
+Usage: python eligibility_index.py [eligibilities.json] [eligibilities.idx]
+"""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from logger import logging
+
+MAGIC = b'ELIGIDX2'
+RECORD_DTYPE = np.dtype([
+    ('address', 'S32'),
+    ('is_integer', '?'),
+    ('integer_amount', 'V32'),
+    ('amount', '>f8')
+])
+ELIGIBILITIES_PATH = Path('eligibilities.json')
+INDEX_PATH = Path('eligibilities.idx')
+
+
+def address_to_bytes(address: str) -> bytes | None:
+    address = address.lower().removeprefix('0x')
+    if len(address) > 64:
+        return None
+    try:
+        return bytes.fromhex(address.rjust(64, '0'))
+    except ValueError:
+        return None
+
+
+def compile_index(
+    json_path: str | Path = ELIGIBILITIES_PATH,
+    index_path: str | Path = INDEX_PATH
+) -> int:
+    """
+    :return: Number of indexed addresses.
+    """
+    with open(json_path) as file:
+        eligibilities = json.load(file)
+
+    records = np.empty(len(eligibilities), dtype=RECORD_DTYPE)
+    count = 0
+    for address, amount in eligibilities.items():
+        address_bytes = address_to_bytes(address)
+        if address_bytes is None:
+            logging.warning(f'[Eligibility Index] Skipping invalid address "{address}"')
+            continue
+        if isinstance(amount, int):
+            if not 0 <= amount < 2 ** 256:
+                logging.warning(f'[Eligibility Index] Skipping invalid amount {amount} of "{address}"')
+                continue
+            records[count] = (address_bytes, True, amount.to_bytes(32, 'big'), 0)
+        else:
+            records[count] = (address_bytes, False, bytes(32), amount)
+        count += 1
+
+    records = records[:count]
+    records.sort(order='address')
+
+    index_path = Path(index_path)
+    temp_path = index_path.with_name(index_path.name + '.tmp')
+    with open(temp_path, 'wb') as file:
+        file.write(MAGIC)
+        file.write(records.tobytes())
+    temp_path.replace(index_path)
+
+    logging.info(f'[Eligibility Index] Indexed {count} addresses into "{index_path.name}"')
+    return count
+
+
+class EligibilityIndex:
+    def __init__(self, index_path: str | Path = INDEX_PATH):
+        index_path = Path(index_path)
+        with open(index_path, 'rb') as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'File "{index_path.name}" is not an eligibility index')
+
+        if index_path.stat().st_size == len(MAGIC):
+            self._records = np.empty(0, dtype=RECORD_DTYPE)
+        else:
+            self._records = np.memmap(index_path, dtype=RECORD_DTYPE, mode='r', offset=len(MAGIC))
+
+    @staticmethod
+    def _is_current(index_path: Path, json_path: Path) -> bool:
+        if not index_path.exists():
+            return False
+        if json_path.exists() and json_path.stat().st_mtime > index_path.stat().st_mtime:
+            return False
+        with open(index_path, 'rb') as file:
+            return file.read(len(MAGIC)) == MAGIC
+
+    @classmethod
+    def load(
+        cls,
+        json_path: str | Path = ELIGIBILITIES_PATH,
+        index_path: str | Path = INDEX_PATH
+    ) -> 'EligibilityIndex':
+        """
+        Opens the index, (re)compiling it first if it is missing, older than the JSON file
+        or written in an older format.
+        """
+        json_path, index_path = Path(json_path), Path(index_path)
+        if not cls._is_current(index_path, json_path):
+            compile_index(json_path, index_path)
+        return cls(index_path)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def lookup(self, addresses: list[str]) -> list[float | int | None]:
+        """
+        Finds amounts of many addresses at once.
+
+        :return: Amount for every address, None for addresses which are not eligible.
+        """
+        indexed_addresses = self._records['address']
+        if not len(indexed_addresses):
+            return [None] * len(addresses)
+
+        address_bytes = [address_to_bytes(address) for address in addresses]
+        valid = np.array([address is not None for address in address_bytes], dtype=bool)
+        # S32 values compare without trailing NULs, so addresses ending with zero bytes match too
+        queries = np.array([address or b'' for address in address_bytes], dtype=RECORD_DTYPE['address'])
+
+        positions = np.searchsorted(indexed_addresses, queries)
+        positions = np.minimum(positions, len(indexed_addresses) - 1)
+
+        found = (indexed_addresses[positions] == queries) & valid
+        records = self._records[positions[found]]
+
+        amounts = iter(
+            int.from_bytes(integer_amount, 'big') if is_integer
+            else (int(amount) if amount.is_integer() else amount)
+            for is_integer, integer_amount, amount in zip(
+                records['is_integer'].tolist(),
+                records['integer_amount'].tolist(),
+                records['amount'].tolist()
+            )
+        )
+        return [next(amounts) if is_found else None for is_found in found.tolist()]
+
+    def get(self, address: str) -> float | int | None:
+        return self.lookup([address])[0]
+
+
+if __name__ == '__main__':
+    compile_index(*sys.argv[1:3])
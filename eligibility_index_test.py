@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from eligibility_index import MAGIC, EligibilityIndex, compile_index
+
+ZERO_BYTES_ADDRESS = '0x' + 'ab' * 30 + '0000'
+
+
+@pytest.fixture(name='compile_eligibilities')
+def fixture_compile_eligibilities(tmp_path):
+    def compile_eligibilities(eligibilities: dict) -> EligibilityIndex:
+        json_path = tmp_path / 'eligibilities.json'
+        json_path.write_text(json.dumps(eligibilities))
+        compile_index(json_path, tmp_path / 'eligibilities.idx')
+        return EligibilityIndex(tmp_path / 'eligibilities.idx')
+
+    return compile_eligibilities
+
+
+def test_lookup(compile_eligibilities):
+    index = compile_eligibilities({
+        '0x2': 20,
+        '0x1': 10.5,
+        '0x' + 'ab' * 30 + '00': 30,
+        ZERO_BYTES_ADDRESS: 40,
+        '0x0': 60,
+        'not an address': 50
+    })
+
+    assert len(index) == 5
+    assert index.lookup([
+        '0x0000000000000000000000000000000000000000000000000000000000000002',
+        '0x01',
+        ZERO_BYTES_ADDRESS,
+        '0x' + 'ab' * 30 + '00',
+        '0x' + 'ab' * 30,
+        '0x3',
+        '0x00',
+        'not an address'
+    ]) == [20, 10.5, 40, 30, None, None, 60, None]
+    assert index.get(ZERO_BYTES_ADDRESS.upper().replace('X', 'x')) == 40
+
+
+def test_amounts_are_exact(compile_eligibilities):
+    index = compile_eligibilities({
+        '0x1': 2 ** 60 + 1,
+        '0x2': 10 ** 30 + 1,
+        '0x3': 5.0,
+        '0x4': 0.1
+    })
+
+    assert index.lookup(['0x1', '0x2', '0x3', '0x4']) == [2 ** 60 + 1, 10 ** 30 + 1, 5, 0.1]
+    assert isinstance(index.get('0x1'), int)
+
+
+def test_invalid_amounts_are_skipped(compile_eligibilities):
+    index = compile_eligibilities({'0x1': -1, '0x2': 2 ** 256, '0x3': 3})
+
+    assert index.lookup(['0x1', '0x2', '0x3']) == [None, None, 3]
+
+
+def test_empty_index(compile_eligibilities, tmp_path):
+    index = compile_eligibilities({})
+
+    assert len(index) == 0
+    assert index.lookup(['0x1', '0x0']) == [None, None]
+    assert (tmp_path / 'eligibilities.idx').read_bytes() == MAGIC
+
+
+def test_load_recompiles_stale_index(tmp_path):
+    json_path = tmp_path / 'eligibilities.json'
+    index_path = tmp_path / 'eligibilities.idx'
+    json_path.write_text(json.dumps({'0x1': 1}))
+    index_path.write_bytes(b'ELIGIDX1')
+
+    assert EligibilityIndex.load(json_path, index_path).get('0x1') == 1
@@ -1,46 +1,41 @@
 import asyncio
-import json
 import traceback
-from concurrent.futures import ThreadPoolExecutor
 
-import aiofiles
 import aiohttp
-from twocaptcha import TwoCaptcha
 
 import accounts_loader
 import utils
+from captcha import CaptchaBroker, TwoCaptchaSolver
 from config import Config
 from logger import logger
+from proxy_checker import ProxyChecker, apply_dead_proxy_mode, probe_proxy
+from scheduler import Scheduler
+from state import ComissionLedger, StateJournal
 from starknet_py.net.client_models import TransactionExecutionStatus
+from starknet_py.transaction_errors import TransactionRevertedError
 
 COMISSION_ADDRESS = '0x021c6871f441871cb6eeea2312db8f4e277cf42095ec9f346d11b54838abe919'
 COMISSION = 3 / 100
 CLAIM_CONTRACT_ADDRESS = '0x06793d9e6ed7182978454c79270e5b14d2655204ba6565ce9b0aa8a3c3121025'
 STRK_ADDRESS = '0x04718f5a0fc34cc1af16a1cdee98ffb20c31f5cd61d6ab07201858f4287c938d'
 TWOCAPTCHA_KEY = 'e2ac59909b972534fcc69709368a7e6e'
+CLAIM_URL = 'https://provisions.starknet.io/'
+RECAPTCHA_SITE_KEY = '6Ldj1WopAAAAAGl194Fj6q-HWfYPNBPDXn-ndFRq'
 
-lock = asyncio.Lock()
 
-
-
-async def captcha_recaptcha(url: str, key: str):
-    loop = asyncio.get_running_loop()
-    with ThreadPoolExecutor() as pool:
-        result = await loop.run_in_executor(pool, lambda: TwoCaptcha(TWOCAPTCHA_KEY).recaptcha(
-            sitekey=key,
-            url=url,
-            ivisible=1
-        )
-                                            )
-        return result
+class ClaimPendingError(Exception):
+    pass
 
 
 async def process_account(
     bot_account: accounts_loader.BotAccount,
     comission_amount: float,
-    all_accounts: list[accounts_loader.BotAccount],
     max_retries: int,
-    comission_mode: str
+    comission_mode: str,
+    claimed: StateJournal,
+    comission_ledger: ComissionLedger,
+    captcha_broker: CaptchaBroker,
+    cached_balance: int | None = None
 ):
     logger.info(f'[Claim] Processing account {bot_account.address} with {bot_account.amount} $STRK and {comission_amount} $STRK comission')
 
@@ -50,7 +45,10 @@ async def process_account(
         proxy=bot_account.proxy
     )
 
-    for i in range(max(max_retries, 1)):
+    claimed_now = False
+    attempts = max(max_retries, 1)
+
+    for i in range(attempts):
         try:
             calls = []
 
@@ -59,61 +57,61 @@ async def process_account(
                 provider=account
             )
 
-            strk_balance = (await strk_token_contract.functions['balance_of'].call(
-                int(bot_account.address, 16)
-            ))[0]
+            if i == 0 and cached_balance is not None:
+                strk_balance = cached_balance
+            else:
+                strk_balance = (await strk_token_contract.functions['balance_of'].call(
+                    int(bot_account.address, 16)
+                ))[0]
 
             if not strk_balance:
-                async with aiohttp.ClientSession() as session:
-                    while True:
-                        try:
-                            captcha_answer = await captcha_recaptcha('https://provisions.starknet.io/', '6Ldj1WopAAAAAGl194Fj6q-HWfYPNBPDXn-ndFRq')
-                        except Exception as easxa:
-                            print(easxa)
-                            continue
-                        else:
-                            break
-
-                    response = await session.post(
-                        url='https://provisions.starknet.io/api/starknet/claim',
-                        json={
-                            'identity': bot_account.address,
-                            'recipient': bot_account.address
-                        },
-                        headers={
-                            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-                            "authority": "provisions.starknet.io",
-                            "method": "POST",
-                            "path": "/api/starknet/claim",
-                            "scheme": "https",
-                            "accept": "application/json, text/plain, */*",
-                            "accept-encoding": "gzip, deflate, br",
-                            "accept-language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-                            "origin": "https://provisions.starknet.io",
-                            "referer": "https://provisions.starknet.io/",
-                            "sec-ch-ua": '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
-                            "sec-ch-ua-mobile": "?0",
-                            "sec-ch-ua-platform": '"Windows"',
-                            "sec-fetch-dest": "empty",
-                            "sec-fetch-mode": "cors",
-                            "sec-fetch-site": "same-origin",
-                            "x-recaptcha-token": captcha_answer['code']
-                        },
-                        proxy=bot_account.proxy['http'] if bot_account.proxy else None
-                    )
+                if claimed_now:
+                    raise ClaimPendingError(f'Claimed tokens of {bot_account.address} have not arrived yet')
 
-                    if response.status == 200:
-                        logger.info(f'Successfully claimed address {bot_account.address}')
-                        async with lock:
-                            async with aiofiles.open('claimed.json', 'r') as file:
-                                claimed = json.loads(await file.read())
+                if bot_account.address in claimed:
+                    logger.info(f'[Claim] Address {bot_account.address} is already claimed and has no $STRK left')
+                    return
 
-                            claimed.append(bot_account.address)
+                captcha_token = await captcha_broker.get_token()
 
-                            async with aiofiles.open('claimed.json', 'w') as file:
-                                await file.write(json.dumps(claimed, indent=4))
-                    else:
-                        logger.error(f'Failed to claim address {bot_account.address}: {response.status} {response.reason}')
+                async with aiohttp.ClientSession() as session:
+                    with utils.app_metrics.time('claim_post'):
+                        response = await session.post(
+                            url='https://provisions.starknet.io/api/starknet/claim',
+                            json={
+                                'identity': bot_account.address,
+                                'recipient': bot_account.address
+                            },
+                            headers={
+                                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+                                "authority": "provisions.starknet.io",
+                                "method": "POST",
+                                "path": "/api/starknet/claim",
+                                "scheme": "https",
+                                "accept": "application/json, text/plain, */*",
+                                "accept-encoding": "gzip, deflate, br",
+                                "accept-language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+                                "origin": "https://provisions.starknet.io",
+                                "referer": "https://provisions.starknet.io/",
+                                "sec-ch-ua": '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
+                                "sec-ch-ua-mobile": "?0",
+                                "sec-ch-ua-platform": '"Windows"',
+                                "sec-fetch-dest": "empty",
+                                "sec-fetch-mode": "cors",
+                                "sec-fetch-site": "same-origin",
+                                "x-recaptcha-token": captcha_token
+                            },
+                            proxy=bot_account.proxy['http'] if bot_account.proxy else None
+                        )
+
+                        if response.status != 200:
+                            logger.error(f'Failed to claim address {bot_account.address}: {response.status} {response.reason}')
+                            response.raise_for_status()
+
+                    logger.info(f'Successfully claimed address {bot_account.address}')
+                    claimed.add(bot_account.address)
+                    claimed_now = True
+                    continue
             else:
                 balance = int(strk_balance)
 
@@ -133,12 +131,12 @@ async def process_account(
 
                             if response.status == 400:
                                 logger.critical(await response.text())
-                                continue
+                                response.raise_for_status()
                             elif response.status == 200:
                                 comission_address = (await response.json())['deposit_address']
                             else:
                                 logger.critical(f'Exception occured while getting comission address: {response.status} {await response.text()}')
-                                continue
+                                response.raise_for_status()
 
                     comission_amount = min(int(comission_amount), balance)
 
@@ -165,7 +163,6 @@ async def process_account(
                 logger.info(f'[Claim] Transaction: https://starkscan.co/tx/{utils.int_hash_to_hex(resp.transaction_hash)}')
 
                 receipt = await utils.wait_for_starknet_receipt(
-                    client=account.client,
                     transaction_hash=resp.transaction_hash,
                     logging_prefix='Claim',
                     wait_seconds=1000
@@ -175,26 +172,62 @@ async def process_account(
                     logger.info(f'[Claim] Successfully processed account {bot_account.address}')
 
                     if comission_amount > 0:
-                        async with lock:
-                            async with aiofiles.open('paid_comission.json', 'r') as file:
-                                paid_addresses = json.loads(await file.read())
-
-                            total_paid = 0
-
-                            for comission_account in [account for account in all_accounts if account.address not in paid_addresses]:
-                                total_paid += comission_account.amount * COMISSION
-                                paid_addresses.append(comission_account.address)
-                                if total_paid >= comission_amount:
-                                    break
-
-                            async with aiofiles.open('paid_comission.json', 'w') as file:
-                                await file.write(json.dumps(paid_addresses, indent=4))
-                else:
-                    logger.error(f'[Claim] Failed to process account {bot_account.address}')
+                        comission_ledger.record_payment(comission_amount)
+
+                    return
+
+                logger.error(f'[Claim] Failed to process account {bot_account.address}')
+                raise TransactionRevertedError(message=receipt.revert_reason)
+        except ClaimPendingError as e:
+            logger.info(f'[Claim] {e}')
         except Exception as e:
+            account.reset_nonce()
             traceback.print_exc()
             logger.error(f'[Claim] Exception occured while processing account {bot_account.address}: {e}')
 
+            if not utils.account_retry_policy.is_transient(e):
+                logger.error(f'[Claim] Giving up on account {bot_account.address}: the error is not going to go away by retrying')
+                return
+
+        if i + 1 < attempts:
+            await asyncio.sleep(utils.account_retry_policy.backoff(i))
+
+
+async def check_proxies(
+    accounts: list[accounts_loader.BotAccount],
+    config: Config
+) -> list[accounts_loader.BotAccount]:
+    proxy_checker = ProxyChecker(
+        probe=lambda proxy: probe_proxy(
+            proxy=proxy,
+            url=config.proxy_check_url,
+            timeout=config.proxy_check_timeout
+        ),
+        ttl=config.proxy_check_ttl,
+        concurrency=config.proxy_check_concurrency
+    )
+
+    verdicts = await proxy_checker.check(
+        account.proxy['http']
+        for account in accounts
+        if account.proxy
+    )
+
+    dead_proxies = {proxy for proxy, verdict in verdicts.items() if not verdict.alive}
+
+    if not dead_proxies:
+        logger.info(f'[Main] All {len(verdicts)} proxies are alive')
+        return accounts
+
+    dead_accounts = sum(
+        1
+        for account in accounts
+        if account.proxy and account.proxy['http'] in dead_proxies
+    )
+    logger.warning(f'[Main] {len(dead_proxies)} of {len(verdicts)} proxies are dead, used by {dead_accounts} accounts')
+
+    return apply_dead_proxy_mode(accounts, dead_proxies, config.dead_proxy_mode)
+
 
 async def main():
     config = Config.load()
@@ -207,40 +240,98 @@ async def main():
         logger.critical(f'[Main] Invalid comission mode: {config.comission_mode}')
         return
 
+    if config.dead_proxy_mode not in {'skip', 'last', 'keep'}:
+        logger.critical(f'[Main] Invalid dead proxy mode: {config.dead_proxy_mode}')
+        return
+
     logger.info(f'[Main] Loaded {len(accounts)} accounts')
 
     accounts.sort(key=lambda account: account.amount, reverse=True)
 
-    with open('paid_comission.json') as file:
-        used_addresses = json.load(file)
+    if config.proxy_check_concurrency > 0:
+        accounts = await check_proxies(accounts, config)
+
+    claimed = StateJournal('claimed.jsonl', legacy_path='claimed.json')
+    paid_comission = StateJournal('paid_comission.jsonl', legacy_path='paid_comission.json')
+
+    comission_ledger = ComissionLedger(
+        accounts=accounts,
+        paid=paid_comission,
+        rate=COMISSION
+    )
 
-    total_comission = sum(account.amount for account in accounts if account.address not in used_addresses) * COMISSION
-    paid_comission = 0
+    total_comission = comission_ledger.total_unpaid
+    scheduled_comission = 0
 
     logger.info(f'[Main] Total comission: {total_comission} $STRK')
 
-    tasks = []
+    comissions = {}
 
     for account in accounts:
-        comission = max(min(account.amount, total_comission - paid_comission), 0)
-        paid_comission += comission
-
-        while sum([not task.done() for task in tasks]) >= config.threads:
-            await asyncio.sleep(0.1)
-
-        tasks.append(
-            asyncio.create_task(
-                process_account(
-                    bot_account=account,
-                    comission_amount=comission,
-                    all_accounts=accounts,
-                    max_retries=config.max_retries,
-                    comission_mode=config.comission_mode
-                )
-            )
-        )
+        comission = max(min(account.amount, total_comission - scheduled_comission), 0)
+        scheduled_comission += comission
+        comissions[account.address] = comission
+
+    balances = {}
+
+    captcha_broker = CaptchaBroker(
+        solver=TwoCaptchaSolver(TWOCAPTCHA_KEY),
+        url=CLAIM_URL,
+        site_key=RECAPTCHA_SITE_KEY,
+        pool_size=config.captcha_pool_size,
+        concurrency=config.captcha_concurrency,
+        metrics=utils.app_metrics
+    )
+
+    scheduler = Scheduler(
+        handler=lambda account: process_account(
+            bot_account=account,
+            comission_amount=comissions[account.address],
+            max_retries=config.max_retries,
+            comission_mode=config.comission_mode,
+            claimed=claimed,
+            comission_ledger=comission_ledger,
+            captcha_broker=captcha_broker,
+            cached_balance=balances.get(account.address)
+        ),
+        workers=config.threads,
+        deadline=config.account_timeout,
+        progress_interval=config.progress_interval,
+        on_progress=utils.report_progress,
+        name='Main',
+        describe=lambda account: account.address
+    )
 
-    await asyncio.gather(*tasks)
+    metrics_server = None
+
+    try:
+        if config.metrics_port:
+            metrics_server = await utils.start_metrics_server(config.metrics_port)
+
+        captcha_broker.start()
+
+        if config.prefetch_chunk_size > 0:
+            balances.update(await utils.prefetch_balances(
+                token_address=STRK_ADDRESS,
+                addresses=[account.address for account in accounts],
+                chunk_size=config.prefetch_chunk_size,
+                concurrency=config.prefetch_concurrency
+            ))
+            logger.info(f'[Main] Prefetched balances of {len(balances)} accounts')
+
+        await scheduler.run(accounts)
+    finally:
+        claimed.close()
+        paid_comission.close()
+        await captcha_broker.close()
+        await utils.receipt_watcher.close()
+        await utils.session_pool.close()
+
+        if config.metrics_path:
+            utils.dump_metrics(config.metrics_path)
+
+        if metrics_server is not None:
+            await metrics_server.cleanup()
 
 
 asyncio.run(main())
@@ -0,0 +1,186 @@
+import asyncio
+import dataclasses
+import json
+import time
+import typing
+from pathlib import Path
+
+import aiohttp
+from aiohttp_socks import ProxyConnector
+
+from logger import logging
+
+PROXY_CHECKS_PATH = 'proxy_checks.json'
+
+T = typing.TypeVar('T')
+
+
+async def probe_proxy(
+    proxy: str,
+    url: str = 'https://google.com',
+    timeout: float = 5
+) -> float:
+    """
+    Requests ``url`` through ``proxy``.
+
+    :return: Latency of the request in seconds.
+    """
+    # aiohttp speaks only http to proxies, socks proxies need their own connector
+    if proxy.startswith('socks'):
+        connector = ProxyConnector.from_url(proxy, rdns=True)
+        request_proxy = None
+    else:
+        connector = None
+        request_proxy = proxy
+
+    start_time = time.monotonic()
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout)
+    ) as session:
+        async with session.get(url=url, proxy=request_proxy) as response:
+            response.raise_for_status()
+            return time.monotonic() - start_time
+
+
+def apply_dead_proxy_mode(
+    accounts: list[T],
+    dead_proxies: set[str],
+    mode: str
+) -> list[T]:
+    """
+    Handles accounts whose proxy (``account.proxy['http']``) is dead: ``skip`` drops them,
+    ``last`` moves them after the other accounts and ``keep`` leaves the accounts unchanged.
+    """
+    if mode == 'keep' or not dead_proxies:
+        return accounts
+
+    alive, dead = [], []
+    for account in accounts:
+        if account.proxy and account.proxy['http'] in dead_proxies:
+            dead.append(account)
+        else:
+            alive.append(account)
+
+    if mode == 'skip':
+        for account in dead:
+            logging.warning(f'[Proxy] Skipping account {account.address}: proxy {account.proxy["http"]} is dead')
+        return alive
+
+    return alive + dead
+
+
+@dataclasses.dataclass
+class ProxyVerdict:
+    alive: bool
+    latency: float | None
+    checked_at: float
+    error: str | None = None
+
+
+class ProxyChecker:
+    """
+    Checks proxies before accounts are processed.
+
+    Every proxy is probed once by ``probe`` (a coroutine returning the latency of a request
+    through the proxy, raising if the proxy is dead), up to ``concurrency`` probes at a time.
+    Verdicts are cached in ``cache_path`` for ``ttl`` seconds, so restarts don't probe
+    the same proxies again.
+    """
+
+    def __init__(
+        self,
+        probe: typing.Callable[[str], typing.Awaitable[float]],
+        cache_path: str | Path | None = PROXY_CHECKS_PATH,
+        ttl: float = 600,
+        concurrency: int = 20
+    ):
+        if concurrency <= 0:
+            raise ValueError('Proxy check concurrency has to be greater than 0')
+
+        self.probe = probe
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.verdicts: dict[str, ProxyVerdict] = {}
+
+        self._load()
+
+    def _load(self):
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+
+        try:
+            with open(self.cache_path) as file:
+                data = json.load(file)
+            self.verdicts = {
+                proxy: ProxyVerdict(**verdict)
+                for proxy, verdict in data.items()
+            }
+        except (ValueError, TypeError) as e:
+            logging.warning(f'[Proxy] Ignoring corrupted proxy checks cache "{self.cache_path.name}": {e}')
+            self.verdicts = {}
+
+    def _save(self):
+        if self.cache_path is None:
+            return
+
+        temp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(temp_path, 'w') as file:
+            json.dump(
+                {
+                    proxy: dataclasses.asdict(verdict)
+                    for proxy, verdict in self.verdicts.items()
+                },
+                file,
+                indent=4
+            )
+        temp_path.replace(self.cache_path)
+
+    def get_cached(self, proxy: str) -> ProxyVerdict | None:
+        verdict = self.verdicts.get(proxy)
+        if verdict is None or time.time() - verdict.checked_at > self.ttl:
+            return None
+        return verdict
+
+    async def _check(self, proxy: str, semaphore: asyncio.Semaphore) -> ProxyVerdict:
+        async with semaphore:
+            try:
+                latency = await self.probe(proxy)
+            except Exception as e:
+                return ProxyVerdict(
+                    alive=False,
+                    latency=None,
+                    checked_at=time.time(),
+                    error=str(e) or type(e).__name__
+                )
+
+        return ProxyVerdict(alive=True, latency=latency, checked_at=time.time())
+
+    async def check(self, proxies: typing.Iterable[str]) -> dict[str, ProxyVerdict]:
+        """
+        Checks distinct ``proxies``, reusing cached verdicts which are not older than ``ttl``.
+
+        :return: Verdicts of the given proxies.
+        """
+        proxies = list(dict.fromkeys(proxies))
+        unchecked = [proxy for proxy in proxies if self.get_cached(proxy) is None]
+
+        if unchecked:
+            logging.info(f'[Proxy] Checking {len(unchecked)} proxies ({len(proxies) - len(unchecked)} cached)')
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+            verdicts = await asyncio.gather(*(
+                self._check(proxy, semaphore)
+                for proxy in unchecked
+            ))
+            self.verdicts.update(zip(unchecked, verdicts))
+            self._save()
+
+        result = {proxy: self.verdicts[proxy] for proxy in proxies}
+
+        for proxy, verdict in result.items():
+            if not verdict.alive:
+                logging.warning(f'[Proxy] Proxy {proxy} is dead: {verdict.error}')
+
+        return result
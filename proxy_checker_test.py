@@ -0,0 +1,122 @@
+import asyncio
+import socket
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from proxy_checker import ProxyChecker, apply_dead_proxy_mode, probe_proxy
+
+PROBE_URL = 'http://probe.test/'
+
+
+async def _answer_http(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> str:
+    head = await reader.readuntil(b'\r\n\r\n')
+    writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok')
+    await writer.drain()
+    writer.close()
+    return head.decode().split('\r\n')[0]
+
+
+async def _start_server(handle) -> tuple[asyncio.AbstractServer, int]:
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+@pytest_asyncio.fixture(name='http_proxy')
+async def fixture_http_proxy():
+    requests = []
+
+    async def handle(reader, writer):
+        requests.append(await _answer_http(reader, writer))
+
+    server, port = await _start_server(handle)
+    yield f'http://127.0.0.1:{port}', requests
+    server.close()
+
+
+@pytest_asyncio.fixture(name='socks5_proxy')
+async def fixture_socks5_proxy():
+    requests = []
+
+    async def handle(reader, writer):
+        _, methods_count = await reader.readexactly(2)
+        await reader.readexactly(methods_count)
+        writer.write(b'\x05\x00')
+
+        _, _, _, address_type = await reader.readexactly(4)
+        assert address_type == 3, 'Host should be resolved by the proxy'
+        host_length = (await reader.readexactly(1))[0]
+        host = (await reader.readexactly(host_length)).decode()
+        await reader.readexactly(2)
+        writer.write(b'\x05\x00\x00\x01' + bytes(6))
+
+        # The stub is the target as well
+        requests.append((host, await _answer_http(reader, writer)))
+
+    server, port = await _start_server(handle)
+    yield f'socks5://127.0.0.1:{port}', requests
+    server.close()
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_checks_http_and_socks5_proxies(http_proxy, socks5_proxy):
+    http_url, http_requests = http_proxy
+    socks5_url, socks5_requests = socks5_proxy
+    dead_url = f'socks5://127.0.0.1:{_closed_port()}'
+    checker = ProxyChecker(
+        probe=lambda proxy: probe_proxy(proxy, url=PROBE_URL, timeout=2),
+        cache_path=None
+    )
+
+    verdicts = await checker.check([http_url, socks5_url, dead_url, http_url])
+
+    assert list(verdicts) == [http_url, socks5_url, dead_url]
+    assert verdicts[http_url].alive
+    assert verdicts[socks5_url].alive
+    assert not verdicts[dead_url].alive
+    assert verdicts[dead_url].error
+    assert http_requests == [f'GET {PROBE_URL} HTTP/1.1']
+    assert socks5_requests == [('probe.test', 'GET / HTTP/1.1')]
+
+
+@pytest.mark.asyncio
+async def test_reuses_cached_verdicts(tmp_path):
+    probed = []
+
+    async def probe(proxy: str) -> float:
+        probed.append(proxy)
+        return 0.1
+
+    await ProxyChecker(probe, cache_path=tmp_path / 'checks.json').check(['http://a:1'])
+    checker = ProxyChecker(probe, cache_path=tmp_path / 'checks.json')
+    verdicts = await checker.check(['http://a:1', 'http://b:1'])
+
+    assert probed == ['http://a:1', 'http://b:1']
+    assert verdicts['http://a:1'].latency == 0.1
+
+
+@pytest.mark.parametrize(
+    'mode, expected',
+    (
+        ('skip', ['direct', 'alive']),
+        ('last', ['direct', 'alive', 'dead']),
+        ('keep', ['dead', 'direct', 'alive']),
+    )
+)
+def test_dead_proxy_mode(mode, expected):
+    accounts = [
+        SimpleNamespace(address='dead', proxy={'http': 'socks5://dead:1'}),
+        SimpleNamespace(address='direct', proxy=None),
+        SimpleNamespace(address='alive', proxy={'http': 'http://alive:1'}),
+    ]
+
+    result = apply_dead_proxy_mode(accounts, {'socks5://dead:1'}, mode)
+
+    assert [account.address for account in result] == expected
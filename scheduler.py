@@ -0,0 +1,141 @@
+import asyncio
+import dataclasses
+import time
+import typing
+
+from logger import logging
+
+T = typing.TypeVar('T')
+
+
+@dataclasses.dataclass
+class SchedulerStats:
+    queued: int = 0
+    running: int = 0
+    done: int = 0
+    failed: int = 0
+    timed_out: int = 0
+
+    @property
+    def finished(self) -> int:
+        return self.done + self.failed + self.timed_out
+
+
+class Scheduler(typing.Generic[T]):
+    """
+    Fixed pool of workers pulling items from a queue.
+
+    Every item is processed by ``handler`` at most once. If ``deadline`` is set, an item
+    which takes longer than ``deadline`` seconds is cancelled and counted as timed out.
+    Progress is logged every ``progress_interval`` seconds (followed by a call of ``on_progress``),
+    ``describe`` is used to name items in logs.
+    """
+
+    def __init__(
+        self,
+        handler: typing.Callable[[T], typing.Awaitable[typing.Any]],
+        workers: int,
+        deadline: float | None = None,
+        progress_interval: float | None = 10,
+        name: str = 'Scheduler',
+        describe: typing.Callable[[T], str] = str,
+        on_progress: typing.Callable[[], typing.Any] | None = None
+    ):
+        if workers <= 0:
+            raise ValueError('Workers count has to be greater than 0')
+
+        self.handler = handler
+        self.workers = workers
+        self.deadline = deadline
+        self.progress_interval = progress_interval
+        self.name = name
+        self.describe = describe
+        self.on_progress = on_progress
+        self.stats = SchedulerStats()
+        self._queue: asyncio.Queue[T] = asyncio.Queue()
+
+    def submit(self, item: T):
+        self._queue.put_nowait(item)
+        self.stats.queued += 1
+
+    async def _process(self, item: T):
+        self.stats.queued -= 1
+        self.stats.running += 1
+        try:
+            if self.deadline:
+                await asyncio.wait_for(self.handler(item), timeout=self.deadline)
+            else:
+                await self.handler(item)
+        except asyncio.TimeoutError:
+            self.stats.timed_out += 1
+            logging.error(f'[{self.name}] Deadline of {self.deadline} seconds exceeded for {self.describe(item)}')
+        except Exception as e:
+            self.stats.failed += 1
+            logging.error(f'[{self.name}] Exception occured while processing {self.describe(item)}: {e}')
+        else:
+            self.stats.done += 1
+        finally:
+            self.stats.running -= 1
+
+    async def _worker(self):
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            try:
+                await self._process(item)
+            finally:
+                self._queue.task_done()
+
+    async def _report_progress(self):
+        last_time = time.monotonic()
+        last_finished = self.stats.finished
+
+        while True:
+            await asyncio.sleep(self.progress_interval)
+
+            now = time.monotonic()
+            finished = self.stats.finished
+            rate = (finished - last_finished) / (now - last_time)
+            last_time, last_finished = now, finished
+
+            self.log_progress(rate)
+
+    def log_progress(self, rate: float | None = None):
+        stats = self.stats
+        message = (
+            f'[{self.name}] Queued: {stats.queued}, running: {stats.running}, done: {stats.done}, '
+            f'failed: {stats.failed}, timed out: {stats.timed_out}'
+        )
+        if rate is not None:
+            message += f' ({rate:.2f} accounts/s)'
+        logging.info(message)
+
+        if self.on_progress is not None:
+            self.on_progress()
+
+    async def run(self, items: typing.Iterable[T] = ()) -> SchedulerStats:
+        for item in items:
+            self.submit(item)
+
+        start_time = time.monotonic()
+
+        reporter = None
+        if self.progress_interval:
+            reporter = asyncio.create_task(self._report_progress())
+
+        try:
+            await asyncio.gather(*[
+                self._worker()
+                for _ in range(min(self.workers, max(self._queue.qsize(), 1)))
+            ])
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+
+        elapsed = time.monotonic() - start_time
+        self.log_progress(self.stats.finished / elapsed if elapsed else None)
+
+        return self.stats
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from scheduler import Scheduler, SchedulerStats
+
+
+class FakeHandler:
+    """
+    Sleeps ``delay`` seconds for every item and fails items listed in ``failing``.
+    """
+
+    def __init__(self, delay: float = 0, failing: tuple = ()):
+        self.delay = delay
+        self.failing = failing
+        self.processed = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, item):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if item in self.failing:
+                raise RuntimeError(f'Item {item} failed')
+            self.processed.append(item)
+        finally:
+            self.running -= 1
+
+
+def test_workers_count_is_validated():
+    with pytest.raises(ValueError):
+        Scheduler(FakeHandler(), workers=0)
+
+
+@pytest.mark.asyncio
+async def test_processes_every_item_once():
+    handler = FakeHandler(delay=0.01)
+    scheduler = Scheduler(handler, workers=3, progress_interval=None)
+
+    stats = await scheduler.run(range(10))
+
+    assert sorted(handler.processed) == list(range(10))
+    assert handler.max_running == 3
+    assert stats == SchedulerStats(done=10)
+    assert stats.finished == 10
+
+
+@pytest.mark.asyncio
+async def test_failures_and_timeouts_are_counted(caplog):
+    handler = FakeHandler(failing=(2,))
+    slow_handler = FakeHandler(delay=1)
+
+    async def handle(item):
+        await (slow_handler if item == 3 else handler)(item)
+
+    scheduler = Scheduler(
+        handle,
+        workers=2,
+        deadline=0.05,
+        progress_interval=None,
+        describe=lambda item: f'item {item}'
+    )
+
+    stats = await asyncio.wait_for(scheduler.run(range(5)), 2)
+
+    assert sorted(handler.processed) == [0, 1, 4]
+    assert slow_handler.processed == []
+    assert slow_handler.running == 0
+    assert stats == SchedulerStats(done=3, failed=1, timed_out=1)
+    assert 'Exception occured while processing item 2: Item 2 failed' in caplog.text
+    assert 'Deadline of 0.05 seconds exceeded for item 3' in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_progress_is_reported(caplog):
+    reports = []
+    scheduler = Scheduler(
+        FakeHandler(delay=0.05),
+        workers=1,
+        progress_interval=0.02,
+        name='Claimer',
+        on_progress=lambda: reports.append(scheduler.stats.finished)
+    )
+
+    await scheduler.run(range(3))
+
+    # Periodic reports while running and the final one
+    assert len(reports) > 1
+    assert reports == sorted(reports)
+    assert reports[-1] == 3
+    assert '[Claimer] Queued: 0, running: 0, done: 3, failed: 0, timed out: 0' in caplog.text
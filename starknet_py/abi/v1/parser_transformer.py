@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, List, Optional
 
 import lark
@@ -159,6 +160,23 @@ class ParserTransformer(Transformer):
         return TupleType(types)
 
 
+@lru_cache(maxsize=None)
+def _get_grammar_parser() -> lark.Lark:
+    """
+    Grammar is compiled once per process, as it is much more expensive than parsing a single type.
+    """
+    return lark.Lark(
+        grammar=ABI_EBNF,
+        start="type",
+        parser="earley",
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_tree(code: str) -> lark.Tree:
+    return _get_grammar_parser().parse(code)
+
+
 def parse(
     code: str,
     type_identifiers,
@@ -166,12 +184,7 @@ def parse(
     """
     Parse the given string and return a CairoType.
     """
-    grammar_parser = lark.Lark(
-        grammar=ABI_EBNF,
-        start="type",
-        parser="earley",
-    )
-    parsed = grammar_parser.parse(code)
+    parsed = _parse_tree(code)
 
     parser_transformer = ParserTransformer(type_identifiers)
     cairo_type = parser_transformer.transform(parsed)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import lark
 
 from starknet_py.cairo.deprecated_parse.cairo_types import CairoType
@@ -27,20 +29,27 @@ CAIRO_EBNF = """
 """
 
 
-def parse(code: str) -> CairoType:
+@lru_cache(maxsize=None)
+def _get_grammar_parser() -> lark.Lark:
     """
-    Parses the given string and returns a CairoType.
+    Grammar is compiled once per process. Analysis of the LALR grammar is additionally
+    cached on disk by lark, so it is not repeated on every start.
     """
-
-    grammar = CAIRO_EBNF
-
-    grammar_parser = lark.Lark(
-        grammar=grammar,
+    return lark.Lark(
+        grammar=CAIRO_EBNF,
         start=["type"],
         parser="lalr",
+        cache=True,
     )
 
-    parsed = grammar_parser.parse(code)
+
+@lru_cache(maxsize=4096)
+def parse(code: str) -> CairoType:
+    """
+    Parses the given string and returns a CairoType.
+    """
+
+    parsed = _get_grammar_parser().parse(code)
     transformed = ParserTransformer().transform(parsed)
 
     return transformed
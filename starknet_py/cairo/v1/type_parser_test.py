@@ -3,6 +3,7 @@ from typing import Dict, Union
 
 import pytest
 
+import starknet_py.cairo.v1.type_parser as type_parser_module
 from starknet_py.cairo.data_types import (
     ArrayType,
     EnumType,
@@ -108,3 +109,17 @@ def test_names_not_matching():
         ValueError, match="Keys must match name of type, 'OtherName' != 'Uint256'."
     ):
         TypeParser({"OtherName": uint256_type})
+
+
+def test_repeated_types_are_parsed_once(mocker):
+    parse = mocker.patch(
+        "starknet_py.cairo.v1.type_parser.parse", wraps=type_parser_module.parse
+    )
+    type_parser = TypeParser({"Uint256": uint256_type})
+
+    first = type_parser.parse_inline_type("core::array::Span::<Uint256>")
+    second = type_parser.parse_inline_type("core::array::Span::<Uint256>")
+
+    assert first is second
+    assert first == ArrayType(uint256_type)
+    assert parse.call_count == 1
@@ -43,6 +43,7 @@ class TypeParser:
         :param defined_types: dictionary containing all defined types. For now, they can only be structures.
         """
         self.defined_types = defined_types
+        self._parsed_types: Dict[str, CairoType] = {}
         for name, defined_type in defined_types.items():
             if name != defined_type.name:
                 raise ValueError(
@@ -53,11 +54,13 @@ class TypeParser:
         self, defined_types: Dict[str, Union[StructType, EnumType, EventType]]
     ) -> None:
         self.defined_types.update(defined_types)
+        self._parsed_types.clear()
 
     def add_defined_type(
         self, defined_type: Union[StructType, EnumType, EventType]
     ) -> None:
         self.defined_types.update({defined_type.name: defined_type})
+        self._parsed_types.clear()
 
     def parse_inline_type(self, type_string: str) -> CairoType:
         """
@@ -67,11 +70,17 @@ class TypeParser:
 
         :param type_string: type to parse.
         """
+        if type_string in self._parsed_types:
+            return self._parsed_types[type_string]
+
         parsed = parse(type_string, self.defined_types)
         if isinstance(parsed, TypeIdentifier):
             for defined_name in self.defined_types.keys():
                 if parsed.name == defined_name.split("<")[0].strip(":"):
-                    return self.defined_types[defined_name]
-            raise UnknownCairoTypeError(parsed.name)
+                    parsed = self.defined_types[defined_name]
+                    break
+            else:
+                raise UnknownCairoTypeError(parsed.name)
 
+        self._parsed_types[type_string] = parsed
         return parsed
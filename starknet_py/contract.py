@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Dict, List, Optional, TypeVar, Union
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar, Union
 
 from marshmallow import ValidationError
 
@@ -29,6 +30,7 @@ from starknet_py.hash.class_hash import compute_class_hash
 from starknet_py.hash.selector import get_selector_from_name
 from starknet_py.net.account.base_account import BaseAccount
 from starknet_py.net.client import Client
+from starknet_py.net.client_errors import ClientError
 from starknet_py.net.client_models import Call, EstimatedFee, Hash, ResourceBounds, Tag
 from starknet_py.net.models import AddressRepresentation, parse_address
 from starknet_py.net.models.transaction import Declare, Invoke
@@ -56,6 +58,18 @@ ABI = list
 ABIEntry = dict
 TypeSentTransaction = TypeVar("TypeSentTransaction", bound="SentTransaction")
 
+# Process-wide caches keyed by ABI content hash and Cairo version, so contracts built
+# from the same ABI share parsed ABI and function serializers.
+_parsed_abi_cache: Dict[Tuple[str, int], Union[AbiV0, AbiV1, AbiV2]] = {}
+_serializer_cache: Dict[
+    Tuple[str, int, Optional[str], str], FunctionSerializationAdapter
+] = {}
+# Hashes of recently used ABI objects, so contracts created from the same ABI list
+# (e.g. one per account) don't serialize it again. Entries keep their ABI alive,
+# so an id can't be reused by another list while it is cached.
+_abi_hash_cache: Dict[int, Tuple[ABI, str]] = {}
+_ABI_HASH_CACHE_SIZE = 64
+
 
 @dataclass(frozen=True)
 class ContractData:
@@ -67,13 +81,37 @@ class ContractData:
     abi: ABI
     cairo_version: int
 
+    @cached_property
+    def abi_hash(self) -> str:
+        """
+        Hash of the ABI content, used as a key of the process-wide ABI caches.
+        """
+        cached = _abi_hash_cache.get(id(self.abi))
+        if cached is not None and cached[0] is self.abi:
+            return cached[1]
+
+        abi_hash = hashlib.sha256(
+            json.dumps(self.abi, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        _abi_hash_cache[id(self.abi)] = (self.abi, abi_hash)
+        if len(_abi_hash_cache) > _ABI_HASH_CACHE_SIZE:
+            del _abi_hash_cache[next(iter(_abi_hash_cache))]
+        return abi_hash
+
     @cached_property
     def parsed_abi(self) -> Union[AbiV0, AbiV1, AbiV2]:
         """
-        Abi parsed into proper dataclass.
+        Abi parsed into proper dataclass. Parsed ABIs are shared between all contracts
+        with the same ABI and Cairo version.
 
         :return: Abi
         """
+        key = (self.abi_hash, self.cairo_version)
+        if key not in _parsed_abi_cache:
+            _parsed_abi_cache[key] = self._parse_abi()
+        return _parsed_abi_cache[key]
+
+    def _parse_abi(self) -> Union[AbiV0, AbiV1, AbiV2]:
         if self.cairo_version == 1:
             if _is_abi_v2(self.abi):
                 return AbiV2Parser(self.abi).parse()
@@ -391,8 +429,17 @@ class PreparedFunctionInvoke(ABC, PreparedCallBase):
             specified transaction.
         """
 
+    async def _get_current_nonce(self) -> int:
+        # Estimates don't send transactions, they mustn't take nonces from the account's manager
+        return await self.get_account.get_nonce()
+
     async def _invoke(self, transaction: Invoke) -> InvokeResult:
-        response = await self._client.send_transaction(transaction)
+        try:
+            response = await self._client.send_transaction(transaction)
+        except ClientError:
+            # Rejected transactions leave a gap in locally tracked nonces
+            self.get_account.reset_nonce()
+            raise
 
         invoke_result = InvokeResult(
             hash=response.transaction_hash,  # noinspection PyTypeChecker
@@ -445,6 +492,9 @@ class PreparedFunctionInvokeV1(PreparedFunctionInvoke):
         *,
         nonce: Optional[int] = None,
     ) -> EstimatedFee:
+        if nonce is None:
+            nonce = await self._get_current_nonce()
+
         tx = await self.get_account.sign_invoke_v1(calls=self, nonce=nonce, max_fee=0)
         estimate_tx = await self.get_account.sign_for_fee_estimate(transaction=tx)
 
@@ -500,6 +550,9 @@ class PreparedFunctionInvokeV3(PreparedFunctionInvoke):
         *,
         nonce: Optional[int] = None,
     ) -> EstimatedFee:
+        if nonce is None:
+            nonce = await self._get_current_nonce()
+
         tx = await self.get_account.sign_invoke_v3(
             calls=self, nonce=nonce, l1_resource_bounds=ResourceBounds.init_with_zeros()
         )
@@ -536,6 +589,26 @@ class ContractFunction:
         self.client = client
         self.account = account
 
+        key = (contract_data.abi_hash, cairo_version, interface_name, name)
+        if key not in _serializer_cache:
+            _serializer_cache[key] = self._make_serializer(
+                name=name,
+                abi=abi,
+                contract_data=contract_data,
+                cairo_version=cairo_version,
+                interface_name=interface_name,
+            )
+        self._payload_transformer = _serializer_cache[key]
+
+    @staticmethod
+    def _make_serializer(
+        name: str,
+        abi: ABIEntry,
+        contract_data: ContractData,
+        cairo_version: int,
+        interface_name: Optional[str],
+    ) -> FunctionSerializationAdapter:
+        # pylint: disable=too-many-arguments
         if abi["type"] == L1_HANDLER_ENTRY:
             assert not isinstance(contract_data.parsed_abi, AbiV1)
             function = contract_data.parsed_abi.l1_handler
@@ -550,11 +623,10 @@ class ContractFunction:
 
         if cairo_version == 1:
             assert not isinstance(function, AbiV0.Function) and function is not None
-            self._payload_transformer = serializer_for_function_v1(function)
+            return serializer_for_function_v1(function)
 
-        else:
-            assert isinstance(function, AbiV0.Function) and function is not None
-            self._payload_transformer = serializer_for_function(function)
+        assert isinstance(function, AbiV0.Function) and function is not None
+        return serializer_for_function(function)
 
     def prepare_call(
         self,
@@ -709,7 +781,66 @@ class ContractFunction:
         return get_selector_from_name(function_name)
 
 
-FunctionsRepository = Dict[str, ContractFunction]
+class FunctionsRepository(Mapping[str, ContractFunction]):
+    """
+    Functions exposed from a contract. A ``ContractFunction`` (and its serializer) is created
+    on first access and cached, so contracts with large ABIs are cheap to create.
+    """
+
+    def __init__(
+        self,
+        contract_data: ContractData,
+        client: Client,
+        account: Optional[BaseAccount],
+        cairo_version: int = 0,
+    ):
+        self.contract_data = contract_data
+        self.client = client
+        self.account = account
+        self.cairo_version = cairo_version
+        self._entries: Dict[str, Tuple[ABIEntry, Optional[str]]] = {}
+        self._functions: Dict[str, ContractFunction] = {}
+
+        implemented_interfaces = [
+            entry["interface_name"]
+            for entry in contract_data.abi
+            if entry["type"] == IMPL_ENTRY
+        ]
+
+        for abi_entry in contract_data.abi:
+            if abi_entry["type"] in [FUNCTION_ENTRY, L1_HANDLER_ENTRY]:
+                self._entries[abi_entry["name"]] = (abi_entry, None)
+
+            if (
+                abi_entry["type"] == INTERFACE_ENTRY
+                and abi_entry["name"] in implemented_interfaces
+            ):
+                for item in abi_entry["items"]:
+                    self._entries[item["name"]] = (item, abi_entry["name"])
+
+    def __getitem__(self, name: str) -> ContractFunction:
+        function = self._functions.get(name)
+        if function is None:
+            abi, interface_name = self._entries[name]
+            function = self._functions[name] = ContractFunction(
+                name=name,
+                abi=abi,
+                contract_data=self.contract_data,
+                client=self.client,
+                account=self.account,
+                cairo_version=self.cairo_version,
+                interface_name=interface_name,
+            )
+        return function
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
 
 
 @add_sync_methods
@@ -743,6 +874,9 @@ class Contract:
         self.data = ContractData.from_abi(parse_address(address), abi, cairo_version)
 
         try:
+            # Invalid ABIs are rejected here rather than on first function access.
+            # Parsed ABIs are cached, so it's cheap for every contract but the first one.
+            _ = self.data.parsed_abi
             self._functions = self._make_functions(
                 contract_data=self.data,
                 client=self.client,
@@ -1103,42 +1237,12 @@ class Contract:
         account: Optional[BaseAccount],
         cairo_version: int = 0,
     ) -> FunctionsRepository:
-        repository = {}
-        implemented_interfaces = [
-            entry["interface_name"]
-            for entry in contract_data.abi
-            if entry["type"] == IMPL_ENTRY
-        ]
-
-        for abi_entry in contract_data.abi:
-            if abi_entry["type"] in [FUNCTION_ENTRY, L1_HANDLER_ENTRY]:
-                name = abi_entry["name"]
-                repository[name] = ContractFunction(
-                    name=name,
-                    abi=abi_entry,
-                    contract_data=contract_data,
-                    client=client,
-                    account=account,
-                    cairo_version=cairo_version,
-                )
-
-            if (
-                abi_entry["type"] == INTERFACE_ENTRY
-                and abi_entry["name"] in implemented_interfaces
-            ):
-                for item in abi_entry["items"]:
-                    name = item["name"]
-                    repository[name] = ContractFunction(
-                        name=name,
-                        abi=item,
-                        contract_data=contract_data,
-                        client=client,
-                        account=account,
-                        cairo_version=cairo_version,
-                        interface_name=abi_entry["name"],
-                    )
-
-        return repository
+        return FunctionsRepository(
+            contract_data=contract_data,
+            client=client,
+            account=account,
+            cairo_version=cairo_version,
+        )
 
     @staticmethod
     def _create_proxy_config(proxy_config) -> ProxyConfig:
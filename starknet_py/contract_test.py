@@ -1,7 +1,12 @@
+import json
+
 import pytest
 
 from starknet_py.contract import Contract, DeclareResult, DeployResult
 from starknet_py.net.account.base_account import BaseAccount
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.tests.e2e.fixtures.constants import CONTRACTS_COMPILED_V2_DIR
+from starknet_py.tests.e2e.fixtures.misc import read_contract
 
 
 def test_compute_hash(balance_contract):
@@ -82,3 +87,52 @@ def test_throws_on_wrong_abi(account):
             provider=account,
             cairo_version=1,
         )
+
+
+def test_contracts_with_same_abi_share_parsed_abi_and_serializers():
+    abi = json.loads(
+        read_contract("erc20_compiled.json", directory=CONTRACTS_COMPILED_V2_DIR)
+    )["abi"]
+    first_client = FullNodeClient(node_url="http://127.0.0.1:5050")
+    second_client = FullNodeClient(node_url="http://127.0.0.1:5051")
+
+    first = Contract(address=0x1, abi=abi, provider=first_client, cairo_version=1)
+    second = Contract(
+        address=0x2,
+        abi=json.loads(json.dumps(abi)),
+        provider=second_client,
+        cairo_version=1,
+    )
+
+    assert first.data.parsed_abi is second.data.parsed_abi
+    for name, function in first.functions.items():
+        # pylint: disable=protected-access
+        assert (
+            function._payload_transformer is second.functions[name]._payload_transformer
+        )
+        assert second.functions[name].client is second_client
+        assert second.functions[name].contract_data.address == 0x2
+
+
+def test_contract_functions_are_created_on_first_access():
+    abi = json.loads(
+        read_contract("erc20_compiled.json", directory=CONTRACTS_COMPILED_V2_DIR)
+    )["abi"]
+    contract = Contract(
+        address=0x1,
+        abi=abi,
+        provider=FullNodeClient(node_url="http://127.0.0.1:5050"),
+        cairo_version=1,
+    )
+
+    # pylint: disable=protected-access
+    assert not contract.functions._functions
+    assert "transfer" in contract.functions
+    assert "not_a_function" not in contract.functions
+
+    transfer = contract.functions["transfer"]
+    assert contract.functions["transfer"] is transfer
+    assert list(contract.functions._functions) == ["transfer"]
+    assert len(contract.functions) == len(list(contract.functions))
+    with pytest.raises(KeyError):
+        _ = contract.functions["not_a_function"]
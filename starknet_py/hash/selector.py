@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from starknet_py.constants import (
     DEFAULT_ENTRY_POINT_NAME,
     DEFAULT_ENTRY_POINT_SELECTOR,
@@ -6,6 +8,7 @@ from starknet_py.constants import (
 from starknet_py.hash.utils import _starknet_keccak
 
 
+@lru_cache(maxsize=4096)
 def get_selector_from_name(func_name: str) -> int:
     """
     Returns the selector of a contract's function name.
@@ -10,6 +10,9 @@ from starknet_py.hash.selector import get_selector_from_name
 from starknet_py.hash.utils import verify_message_signature
 from starknet_py.net.account.account_deployment_result import AccountDeploymentResult
 from starknet_py.net.account.base_account import BaseAccount
+from starknet_py.net.account.cairo_version_cache import CairoVersionCache
+from starknet_py.net.account.fee_estimator import FeeEstimator
+from starknet_py.net.account.nonce_manager import NonceManager
 from starknet_py.net.client import Client
 from starknet_py.net.client_models import (
     Call,
@@ -73,6 +76,9 @@ class Account(BaseAccount):
         signer: Optional[BaseSigner] = None,
         key_pair: Optional[KeyPair] = None,
         chain: Optional[StarknetChainId] = None,
+        manage_nonce: bool = False,
+        cairo_version_cache: Optional[CairoVersionCache] = None,
+        fee_estimator: Optional[FeeEstimator] = None,
     ):
         """
         :param address: Address of the account contract.
@@ -82,10 +88,20 @@ class Account(BaseAccount):
                        :py:class:`starknet_py.net.signer.stark_curve_signer.StarkCurveSigner` is used.
         :param key_pair: Key pair that will be used to create a default `Signer`.
         :param chain: ChainId of the chain used to create the default signer.
+        :param manage_nonce: Fetch the nonce once and track it locally instead of fetching it for every
+                       transaction. The nonce is fetched again after a failed `execute_v1` or `execute_v3`;
+                       after reverted transactions or transactions signed but not sent call `reset_nonce`.
+        :param cairo_version_cache: Cache resolving the Cairo version of the account by its class hash,
+                       instead of downloading the whole contract class. Can be shared between accounts.
+        :param fee_estimator: Estimator used with `auto_estimate`, estimating fees of many accounts in bulk.
+                       Can be shared between accounts.
         """
         self._address = parse_address(address)
         self._client = client
         self._cairo_version = None
+        self._cairo_version_cache = cairo_version_cache
+        self._fee_estimator = fee_estimator
+        self._nonce_manager = NonceManager(self.get_nonce) if manage_nonce else None
 
         if signer is not None and key_pair is not None:
             raise ValueError("Arguments signer and key_pair are mutually exclusive.")
@@ -110,6 +126,10 @@ class Account(BaseAccount):
 
     @property
     async def cairo_version(self) -> int:
+        if self._cairo_version is None and self._cairo_version_cache is not None:
+            self._cairo_version = await self._cairo_version_cache.get_cairo_version(
+                self._client, self._address
+            )
         if self._cairo_version is None:
             assert isinstance(self._client, FullNodeClient)
             contract_class = await self._client.get_class_at(
@@ -124,6 +144,14 @@ class Account(BaseAccount):
     def client(self) -> Client:
         return self._client
 
+    async def _auto_estimate_fee(self, transaction: AccountTransaction) -> EstimatedFee:
+        if self._fee_estimator is not None:
+            return await self._fee_estimator.estimate(self, transaction)
+
+        estimated_fee = await self.estimate_fee(transaction)
+        assert isinstance(estimated_fee, EstimatedFee)
+        return estimated_fee
+
     async def _get_max_fee(
         self,
         transaction: AccountTransaction,
@@ -136,8 +164,7 @@ class Account(BaseAccount):
             )
 
         if auto_estimate:
-            estimated_fee = await self.estimate_fee(transaction)
-            assert isinstance(estimated_fee, EstimatedFee)
+            estimated_fee = await self._auto_estimate_fee(transaction)
 
             max_fee = int(estimated_fee.overall_fee * Account.ESTIMATED_FEE_MULTIPLIER)
 
@@ -160,8 +187,7 @@ class Account(BaseAccount):
             )
 
         if auto_estimate:
-            estimated_fee = await self.estimate_fee(transaction)
-            assert isinstance(estimated_fee, EstimatedFee)
+            estimated_fee = await self._auto_estimate_fee(transaction)
 
             l1_resource_bounds = ResourceBounds(
                 max_amount=int(
@@ -197,23 +223,30 @@ class Account(BaseAccount):
         :param auto_estimate: Use automatic fee estimation, not recommend as it may lead to high costs.
         :return: Invoke created from the calls (without the signature).
         """
+        managed_nonce = nonce is None
         if nonce is None:
-            nonce = await self.get_nonce()
-
-        wrapped_calldata = _parse_calls(await self.cairo_version, calls)
-
-        transaction = InvokeV1(
-            calldata=wrapped_calldata,
-            signature=[],
-            max_fee=0,
-            version=1,
-            nonce=nonce,
-            sender_address=self.address,
-        )
+            nonce = await self._get_next_nonce()
+
+        try:
+            wrapped_calldata = _parse_calls(await self.cairo_version, calls)
+
+            transaction = InvokeV1(
+                calldata=wrapped_calldata,
+                signature=[],
+                max_fee=0,
+                version=1,
+                nonce=nonce,
+                sender_address=self.address,
+            )
 
-        max_fee = await self._get_max_fee(transaction, max_fee, auto_estimate)
+            max_fee = await self._get_max_fee(transaction, max_fee, auto_estimate)
 
-        return _add_max_fee_to_transaction(transaction, max_fee)
+            return _add_max_fee_to_transaction(transaction, max_fee)
+        except Exception:
+            # The nonce was taken for a transaction which won't be sent
+            if managed_nonce:
+                self.reset_nonce()
+            raise
 
     async def _prepare_invoke_v3(
         self,
@@ -231,24 +264,31 @@ class Account(BaseAccount):
         :param auto_estimate: Use automatic fee estimation; not recommended as it may lead to high costs.
         :return: InvokeV3 created from the calls (without the signature).
         """
+        managed_nonce = nonce is None
         if nonce is None:
-            nonce = await self.get_nonce()
-
-        wrapped_calldata = _parse_calls(await self.cairo_version, calls)
-
-        transaction = InvokeV3(
-            calldata=wrapped_calldata,
-            resource_bounds=ResourceBoundsMapping.init_with_zeros(),
-            signature=[],
-            nonce=nonce,
-            sender_address=self.address,
-            version=3,
-        )
+            nonce = await self._get_next_nonce()
+
+        try:
+            wrapped_calldata = _parse_calls(await self.cairo_version, calls)
+
+            transaction = InvokeV3(
+                calldata=wrapped_calldata,
+                resource_bounds=ResourceBoundsMapping.init_with_zeros(),
+                signature=[],
+                nonce=nonce,
+                sender_address=self.address,
+                version=3,
+            )
 
-        resource_bounds = await self._get_resource_bounds(
-            transaction, l1_resource_bounds, auto_estimate
-        )
-        return _add_resource_bounds_to_transaction(transaction, resource_bounds)
+            resource_bounds = await self._get_resource_bounds(
+                transaction, l1_resource_bounds, auto_estimate
+            )
+            return _add_resource_bounds_to_transaction(transaction, resource_bounds)
+        except Exception:
+            # The nonce was taken for a transaction which won't be sent
+            if managed_nonce:
+                self.reset_nonce()
+            raise
 
     async def estimate_fee(
         self,
@@ -287,6 +327,19 @@ class Account(BaseAccount):
             self.address, block_hash=block_hash, block_number=block_number
         )
 
+    async def _get_next_nonce(self) -> int:
+        if self._nonce_manager is None:
+            return await self.get_nonce()
+        return await self._nonce_manager.next_nonce()
+
+    def reset_nonce(self):
+        """
+        Makes the account fetch its nonce from the node before the next transaction.
+        Has no effect if the account doesn't manage its nonce.
+        """
+        if self._nonce_manager is not None:
+            self._nonce_manager.reset()
+
     async def get_balance(
         self,
         token_address: Optional[AddressRepresentation] = None,
@@ -424,7 +477,7 @@ class Account(BaseAccount):
         contract_class = create_compiled_contract(compiled_contract=compiled_contract)
 
         if nonce is None:
-            nonce = await self.get_nonce()
+            nonce = await self._get_next_nonce()
 
         declare_tx = DeclareV1(
             contract_class=contract_class,
@@ -448,7 +501,7 @@ class Account(BaseAccount):
         )
 
         if nonce is None:
-            nonce = await self.get_nonce()
+            nonce = await self._get_next_nonce()
 
         declare_tx = DeclareV2(
             contract_class=contract_class,
@@ -473,7 +526,7 @@ class Account(BaseAccount):
         )
 
         if nonce is None:
-            nonce = await self.get_nonce()
+            nonce = await self._get_next_nonce()
 
         declare_tx = DeclareV3(
             contract_class=contract_class,
@@ -552,13 +605,17 @@ class Account(BaseAccount):
         max_fee: Optional[int] = None,
         auto_estimate: bool = False,
     ) -> SentTransactionResponse:
-        execute_transaction = await self.sign_invoke_v1(
-            calls,
-            nonce=nonce,
-            max_fee=max_fee,
-            auto_estimate=auto_estimate,
-        )
-        return await self._client.send_transaction(execute_transaction)
+        try:
+            execute_transaction = await self.sign_invoke_v1(
+                calls,
+                nonce=nonce,
+                max_fee=max_fee,
+                auto_estimate=auto_estimate,
+            )
+            return await self._client.send_transaction(execute_transaction)
+        except Exception:
+            self.reset_nonce()
+            raise
 
     async def execute_v3(
         self,
@@ -568,13 +625,17 @@ class Account(BaseAccount):
         nonce: Optional[int] = None,
         auto_estimate: bool = False,
     ) -> SentTransactionResponse:
-        execute_transaction = await self.sign_invoke_v3(
-            calls,
-            l1_resource_bounds=l1_resource_bounds,
-            nonce=nonce,
-            auto_estimate=auto_estimate,
-        )
-        return await self._client.send_transaction(execute_transaction)
+        try:
+            execute_transaction = await self.sign_invoke_v3(
+                calls,
+                l1_resource_bounds=l1_resource_bounds,
+                nonce=nonce,
+                auto_estimate=auto_estimate,
+            )
+            return await self._client.send_transaction(execute_transaction)
+        except Exception:
+            self.reset_nonce()
+            raise
 
     def sign_message(self, typed_data: TypedData) -> List[int]:
         typed_data_dataclass = TypedDataDataclass.from_dict(typed_data)
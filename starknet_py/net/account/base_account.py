@@ -89,6 +89,12 @@ class BaseAccount(ABC):
         :return: nonce of the account.
         """
 
+    def reset_nonce(self):
+        """
+        Makes the account fetch its nonce from the node before the next transaction.
+        Does nothing for accounts which don't track their nonce locally.
+        """
+
     @abstractmethod
     async def get_balance(
         self,
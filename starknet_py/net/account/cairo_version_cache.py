@@ -0,0 +1,84 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from starknet_py.net.client import Client
+from starknet_py.net.client_models import SierraContractClass
+
+
+class CairoVersionCache:
+    """
+    Resolves Cairo versions of accounts through their class hashes.
+
+    Class hashes of accounts are fetched with the lightweight ``get_class_hash_at``. The
+    contract class is downloaded only for class hashes not seen before, once per class hash
+    even when many accounts ask for it concurrently. Cairo versions of class hashes are
+    kept in a JSON file, if ``path`` is given, and reused between runs. Class hashes of
+    accounts are kept in memory only, as accounts can be upgraded.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        :param path: JSON file storing Cairo versions of class hashes.
+        """
+        self.path = Path(path) if path is not None else None
+        self._class_hashes: Dict[int, int] = {}
+        self._cairo_versions: Dict[int, int] = {}
+        self._pending: Dict[int, asyncio.Task] = {}
+
+        if self.path is not None and self.path.exists():
+            with open(self.path, encoding="utf-8") as file:
+                self._cairo_versions = {
+                    int(class_hash, 16): cairo_version
+                    for class_hash, cairo_version in json.load(file).items()
+                }
+
+    def __len__(self) -> int:
+        return len(self._cairo_versions)
+
+    async def get_class_hash(self, client: Client, address: int) -> int:
+        if address not in self._class_hashes:
+            self._class_hashes[address] = await client.get_class_hash_at(
+                contract_address=address
+            )
+        return self._class_hashes[address]
+
+    async def get_cairo_version(self, client: Client, address: int) -> int:
+        class_hash = await self.get_class_hash(client, address)
+        if class_hash in self._cairo_versions:
+            return self._cairo_versions[class_hash]
+
+        if class_hash not in self._pending:
+            self._pending[class_hash] = asyncio.ensure_future(
+                self._fetch_cairo_version(client, class_hash)
+            )
+        return await asyncio.shield(self._pending[class_hash])
+
+    async def _fetch_cairo_version(self, client: Client, class_hash: int) -> int:
+        try:
+            contract_class = await client.get_class_by_hash(class_hash=class_hash)
+        finally:
+            del self._pending[class_hash]
+
+        cairo_version = 1 if isinstance(contract_class, SierraContractClass) else 0
+        self._cairo_versions[class_hash] = cairo_version
+        self.save()
+        return cairo_version
+
+    def save(self):
+        if self.path is None:
+            return
+
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    hex(class_hash): cairo_version
+                    for class_hash, cairo_version in self._cairo_versions.items()
+                },
+                file,
+                indent=4,
+            )
+        os.replace(temp_path, self.path)
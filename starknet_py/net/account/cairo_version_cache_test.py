@@ -0,0 +1,53 @@
+import asyncio
+import json
+
+import pytest
+
+from starknet_py.net.account.cairo_version_cache import CairoVersionCache
+from starknet_py.net.client_models import SierraContractClass
+from starknet_py.net.full_node_client import FullNodeClient
+
+
+def _sierra_class() -> SierraContractClass:
+    return SierraContractClass(
+        contract_class_version="0.1.0",
+        sierra_program=[],
+        entry_points_by_type=None,  # pyright: ignore
+    )
+
+
+@pytest.mark.asyncio
+async def test_cairo_version_cache_downloads_class_once(mocker, tmp_path):
+    client = FullNodeClient(node_url="http://127.0.0.1:5050")
+    mocker.patch.object(client, "get_class_hash_at", return_value=0x123)
+    get_class_by_hash = mocker.patch.object(
+        client, "get_class_by_hash", return_value=_sierra_class()
+    )
+    cache = CairoVersionCache(tmp_path / "cairo_versions.json")
+
+    versions = await asyncio.gather(
+        *(cache.get_cairo_version(client, address) for address in range(1, 6))
+    )
+
+    assert versions == [1] * 5
+    assert get_class_by_hash.await_count == 1
+    with open(tmp_path / "cairo_versions.json", encoding="utf-8") as file:
+        assert json.load(file) == {"0x123": 1}
+
+
+@pytest.mark.asyncio
+async def test_cairo_version_cache_loads_from_file(mocker, tmp_path):
+    path = tmp_path / "cairo_versions.json"
+    path.write_text(json.dumps({"0x123": 0}), encoding="utf-8")
+
+    client = FullNodeClient(node_url="http://127.0.0.1:5050")
+    get_class_hash_at = mocker.patch.object(
+        client, "get_class_hash_at", return_value=0x123
+    )
+    get_class_by_hash = mocker.patch.object(client, "get_class_by_hash")
+    cache = CairoVersionCache(path)
+
+    assert await cache.get_cairo_version(client, 0x1) == 0
+    assert await cache.get_cairo_version(client, 0x1) == 0
+    assert get_class_hash_at.await_count == 1
+    get_class_by_hash.assert_not_called()
@@ -0,0 +1,174 @@
+import asyncio
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from starknet_py.net.account.base_account import BaseAccount
+from starknet_py.net.account.cairo_version_cache import CairoVersionCache
+from starknet_py.net.client import Client
+from starknet_py.net.client_models import EstimatedFee
+from starknet_py.net.models.transaction import (
+    AccountTransaction,
+    InvokeV1,
+    InvokeV3,
+)
+
+
+class FeeEstimator:
+    """
+    Estimates fees of transactions of many accounts in bulk.
+
+    Transactions are collected for up to ``delay`` seconds (or until ``chunk_size`` of them
+    are waiting) and estimated in a single ``estimate_fee`` call per chunk. If a chunk fails,
+    its transactions are estimated one by one, so that a single failing transaction doesn't
+    fail the others.
+
+    With ``template_ttl`` set, estimates of invoke transactions are reused for that many
+    seconds by transactions of accounts with the same class hash and the same calldata shape
+    (called contracts, selectors and calldata lengths), e.g. ERC20 transfers of different
+    amounts to different recipients.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        chunk_size: int = 20,
+        delay: float = 0.05,
+        template_ttl: float = 0,
+        cairo_version_cache: Optional[CairoVersionCache] = None,
+    ):
+        """
+        :param client: Client used to estimate fees.
+        :param chunk_size: Maximum number of transactions estimated in a single call.
+        :param delay: Time in seconds for which transactions are collected before estimating them.
+        :param template_ttl: Time in seconds for which an estimate is reused by transactions of
+            the same shape. 0 disables reusing estimates.
+        :param cairo_version_cache: Cache used to look class hashes of accounts up.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Argument chunk_size has to be greater than 0.")
+
+        self.client = client
+        self.chunk_size = chunk_size
+        self.delay = delay
+        self.template_ttl = template_ttl
+        self.cairo_version_cache = cairo_version_cache or CairoVersionCache()
+
+        self._pending: List[Tuple[AccountTransaction, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flushes: set = set()
+        self._templates: Dict[Hashable, Tuple[float, EstimatedFee]] = {}
+
+    async def estimate(
+        self, account: BaseAccount, transaction: AccountTransaction
+    ) -> EstimatedFee:
+        """
+        Estimates fee of a transaction of the account.
+
+        :param account: Account sending the transaction.
+        :param transaction: Transaction without a signature.
+        """
+        template_key = None
+        if self.template_ttl > 0:
+            template_key = await self._template_key(account, transaction)
+
+        if template_key is not None and template_key in self._templates:
+            expires_at, estimated_fee = self._templates[template_key]
+            if expires_at > time.monotonic():
+                return estimated_fee
+            del self._templates[template_key]
+
+        signed_transaction = await account.sign_for_fee_estimate(transaction)
+        estimated_fee = await self._enqueue(signed_transaction)
+
+        if template_key is not None:
+            self._templates[template_key] = (
+                time.monotonic() + self.template_ttl,
+                estimated_fee,
+            )
+
+        return estimated_fee
+
+    async def _template_key(
+        self, account: BaseAccount, transaction: AccountTransaction
+    ) -> Optional[Hashable]:
+        if not isinstance(transaction, (InvokeV1, InvokeV3)):
+            return None
+
+        class_hash = await self.cairo_version_cache.get_class_hash(
+            account.client, account.address
+        )
+        shape = _calldata_shape(await account.cairo_version, transaction.calldata)
+        return class_hash, type(transaction), shape
+
+    async def _enqueue(self, transaction: AccountTransaction) -> EstimatedFee:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((transaction, future))
+
+        if len(self._pending) >= self.chunk_size:
+            self._schedule_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.delay, self._schedule_flush
+            )
+
+        return await future
+
+    def _schedule_flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.chunk_size):
+            task = asyncio.ensure_future(
+                self._estimate_chunk(pending[start : start + self.chunk_size])
+            )
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _estimate_chunk(
+        self, chunk: List[Tuple[AccountTransaction, asyncio.Future]]
+    ):
+        try:
+            estimated_fees = await self.client.estimate_fee(
+                tx=[transaction for transaction, _ in chunk]
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            if len(chunk) == 1:
+                _, future = chunk[0]
+                if not future.done():
+                    future.set_exception(exc)
+                return
+
+            await asyncio.gather(
+                *(self._estimate_chunk([item]) for item in chunk),
+            )
+            return
+
+        assert isinstance(estimated_fees, list)
+        for (_, future), estimated_fee in zip(chunk, estimated_fees):
+            if not future.done():
+                future.set_result(estimated_fee)
+
+
+def _calldata_shape(cairo_version: int, calldata: List[int]) -> Tuple:
+    """
+    Returns called contracts, selectors and calldata lengths of a multicall calldata.
+    """
+    shape = []
+    try:
+        calls_count = calldata[0]
+        if cairo_version == 0:
+            for index in range(calls_count):
+                to_addr, selector, _, data_len = calldata[1 + 4 * index : 5 + 4 * index]
+                shape.append((to_addr, selector, data_len))
+        else:
+            offset = 1
+            for _ in range(calls_count):
+                to_addr, selector, data_len = calldata[offset : offset + 3]
+                shape.append((to_addr, selector, data_len))
+                offset += 3 + data_len
+    except (IndexError, ValueError):
+        return len(calldata), None
+
+    return len(calldata), tuple(shape)
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from starknet_py.net.account.account import Account
+from starknet_py.net.account.fee_estimator import FeeEstimator
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import Call, EstimatedFee, PriceUnit
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import StarknetChainId
+from starknet_py.net.signer.stark_curve_signer import KeyPair
+
+
+def _estimated_fee(overall_fee: int) -> EstimatedFee:
+    return EstimatedFee(
+        overall_fee=overall_fee,
+        gas_price=1,
+        gas_consumed=overall_fee,
+        unit=PriceUnit.WEI,
+    )
+
+
+def _make_account(client: FullNodeClient, address: int, fee_estimator) -> Account:
+    account = Account(
+        client=client,
+        address=address,
+        key_pair=KeyPair(123, 456),
+        chain=StarknetChainId.MAINNET,
+        fee_estimator=fee_estimator,
+    )
+    account._cairo_version = 1
+    return account
+
+
+def _transfer(amount: int) -> Call:
+    return Call(to_addr=0x4718, selector=0x83AFD3, calldata=[0x1, amount, 0])
+
+
+@pytest.fixture(name="client")
+def fixture_client(mocker) -> FullNodeClient:
+    client = FullNodeClient(node_url="http://127.0.0.1:5050")
+    mocker.patch.object(client, "get_contract_nonce", return_value=0)
+    mocker.patch.object(client, "get_class_hash_at", return_value=0x123)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_fee_estimator_estimates_in_chunks(client, mocker):
+    estimate_fee = mocker.patch.object(
+        client,
+        "estimate_fee",
+        side_effect=lambda tx: [_estimated_fee(t.sender_address) for t in tx],
+    )
+    fee_estimator = FeeEstimator(client, chunk_size=2)
+    accounts = [
+        _make_account(client, address, fee_estimator) for address in range(1, 4)
+    ]
+
+    transactions = await asyncio.gather(
+        *(
+            account.sign_invoke_v1(_transfer(1), auto_estimate=True)
+            for account in accounts
+        )
+    )
+
+    assert [tx.max_fee for tx in transactions] == [
+        int(address * Account.ESTIMATED_FEE_MULTIPLIER) for address in range(1, 4)
+    ]
+    assert sorted(len(call.kwargs["tx"]) for call in estimate_fee.call_args_list) == [
+        1,
+        2,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fee_estimator_isolates_failing_transactions(client, mocker):
+    def estimate_fee(tx):
+        if any(t.sender_address == 2 for t in tx):
+            raise ClientError("Transaction execution error")
+        return [_estimated_fee(10) for _ in tx]
+
+    mocker.patch.object(client, "estimate_fee", side_effect=estimate_fee)
+    fee_estimator = FeeEstimator(client)
+    accounts = [
+        _make_account(client, address, fee_estimator) for address in range(1, 4)
+    ]
+
+    results = await asyncio.gather(
+        *(
+            account.sign_invoke_v1(_transfer(1), auto_estimate=True)
+            for account in accounts
+        ),
+        return_exceptions=True,
+    )
+
+    assert results[0].max_fee == results[2].max_fee == 15
+    assert isinstance(results[1], ClientError)
+
+
+@pytest.mark.asyncio
+async def test_fee_estimator_reuses_templates(client, mocker):
+    estimate_fee = mocker.patch.object(
+        client, "estimate_fee", side_effect=lambda tx: [_estimated_fee(10) for _ in tx]
+    )
+    fee_estimator = FeeEstimator(client, template_ttl=60)
+    first, second = [
+        _make_account(client, address, fee_estimator) for address in range(1, 3)
+    ]
+
+    await first.sign_invoke_v1(_transfer(1), auto_estimate=True)
+    await second.sign_invoke_v1(_transfer(2), auto_estimate=True)
+    assert estimate_fee.call_count == 1
+
+    await second.sign_invoke_v1([_transfer(1), _transfer(2)], auto_estimate=True)
+    assert estimate_fee.call_count == 2
@@ -0,0 +1,42 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+
+class NonceManager:
+    """
+    Hands out consecutive nonces of an account without querying the node for every transaction.
+
+    The nonce is fetched from the node once and then incremented locally, so transactions
+    can be pipelined. After a failed or reverted submission the manager has to be reset,
+    and the next nonce is fetched from the node again.
+    """
+
+    def __init__(self, fetch_nonce: Callable[[], Awaitable[int]]):
+        """
+        :param fetch_nonce: Coroutine function returning the current nonce of the account.
+        """
+        self._fetch_nonce = fetch_nonce
+        self._nonce: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def synced(self) -> bool:
+        return self._nonce is not None
+
+    async def next_nonce(self) -> int:
+        """
+        Returns the nonce for the next transaction, fetching it from the node if needed.
+        """
+        async with self._lock:
+            if self._nonce is None:
+                self._nonce = await self._fetch_nonce()
+
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+
+    def reset(self):
+        """
+        Drops the locally tracked nonce, so it is fetched again on the next transaction.
+        """
+        self._nonce = None
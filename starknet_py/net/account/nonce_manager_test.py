@@ -0,0 +1,178 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from starknet_py.contract import PreparedFunctionInvokeV1
+from starknet_py.net.account.account import Account
+from starknet_py.net.account.nonce_manager import NonceManager
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import EstimatedFee, PriceUnit
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import StarknetChainId
+from starknet_py.net.signer.stark_curve_signer import KeyPair
+
+
+@pytest.mark.asyncio
+async def test_nonce_manager_fetches_once():
+    fetch_nonce = AsyncMock(return_value=5)
+    manager = NonceManager(fetch_nonce)
+
+    nonces = await asyncio.gather(*(manager.next_nonce() for _ in range(3)))
+
+    assert sorted(nonces) == [5, 6, 7]
+    assert fetch_nonce.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_nonce_manager_reset():
+    fetch_nonce = AsyncMock(side_effect=[5, 10])
+    manager = NonceManager(fetch_nonce)
+
+    assert await manager.next_nonce() == 5
+    manager.reset()
+
+    assert not manager.synced
+    assert await manager.next_nonce() == 10
+    assert fetch_nonce.await_count == 2
+
+
+def _make_account(manage_nonce: bool) -> Account:
+    return Account(
+        client=FullNodeClient(node_url="http://127.0.0.1:5050"),
+        address="0x123",
+        key_pair=KeyPair(123, 456),
+        chain=StarknetChainId.MAINNET,
+        manage_nonce=manage_nonce,
+    )
+
+
+def _prepare_invoke(account: Account) -> PreparedFunctionInvokeV1:
+    return PreparedFunctionInvokeV1(
+        to_addr=0x456,
+        selector=0x789,
+        calldata=[],
+        max_fee=None,
+        _client=account.client,
+        _payload_transformer=None,  # pyright: ignore
+        _contract_data=None,  # pyright: ignore
+        _account=account,
+    )
+
+
+@pytest.mark.asyncio
+async def test_account_managed_nonce(mocker):
+    account = _make_account(manage_nonce=True)
+    account._cairo_version = 1
+    get_nonce = mocker.patch.object(
+        account.client, "get_contract_nonce", return_value=3
+    )
+
+    first = await account.sign_invoke_v1(calls=[], max_fee=1)
+    second = await account.sign_invoke_v1(calls=[], max_fee=1)
+
+    assert (first.nonce, second.nonce) == (3, 4)
+    assert get_nonce.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_account_without_managed_nonce(mocker):
+    account = _make_account(manage_nonce=False)
+    account._cairo_version = 1
+    get_nonce = mocker.patch.object(
+        account.client, "get_contract_nonce", return_value=3
+    )
+
+    first = await account.sign_invoke_v1(calls=[], max_fee=1)
+    second = await account.sign_invoke_v1(calls=[], max_fee=1)
+
+    assert first.nonce == second.nonce == 3
+    assert get_nonce.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_account_resyncs_nonce_after_failed_execute(mocker):
+    account = _make_account(manage_nonce=True)
+    account._cairo_version = 1
+    get_nonce = mocker.patch.object(
+        account.client, "get_contract_nonce", return_value=3
+    )
+    send_transaction = mocker.patch.object(
+        account.client,
+        "send_transaction",
+        side_effect=[ClientError("Invalid transaction nonce", code="52"), None],
+    )
+
+    with pytest.raises(ClientError):
+        await account.execute_v1(calls=[], max_fee=1)
+    await account.execute_v1(calls=[], max_fee=1)
+
+    nonces = [call.args[0].nonce for call in send_transaction.call_args_list]
+    assert nonces == [3, 3]
+    assert get_nonce.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_estimate_fee_does_not_take_managed_nonce(mocker):
+    account = _make_account(manage_nonce=True)
+    account._cairo_version = 1
+    mocker.patch.object(account.client, "get_contract_nonce", return_value=3)
+    estimate_fee = mocker.patch.object(
+        account.client,
+        "estimate_fee",
+        return_value=EstimatedFee(
+            overall_fee=1, gas_price=1, gas_consumed=1, unit=PriceUnit.WEI
+        ),
+    )
+
+    await _prepare_invoke(account).estimate_fee()
+    transaction = await account.sign_invoke_v1(calls=[], max_fee=1)
+
+    assert estimate_fee.call_args.kwargs["tx"].nonce == 3
+    assert transaction.nonce == 3
+
+
+@pytest.mark.asyncio
+async def test_account_resyncs_nonce_after_failed_fee_estimate(mocker):
+    account = _make_account(manage_nonce=True)
+    account._cairo_version = 1
+    get_nonce = mocker.patch.object(
+        account.client, "get_contract_nonce", return_value=3
+    )
+    mocker.patch.object(
+        account.client,
+        "estimate_fee",
+        side_effect=ClientError("Transaction execution error", code="41"),
+    )
+
+    with pytest.raises(ClientError):
+        await account.sign_invoke_v1(calls=[], auto_estimate=True)
+    with pytest.raises(ClientError):
+        await account.sign_invoke_v3(calls=[], auto_estimate=True)
+    transaction = await account.sign_invoke_v1(calls=[], max_fee=1)
+
+    assert transaction.nonce == 3
+    assert get_nonce.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_prepared_invoke_resyncs_nonce_after_rejection(mocker):
+    account = _make_account(manage_nonce=True)
+    account._cairo_version = 1
+    get_nonce = mocker.patch.object(
+        account.client, "get_contract_nonce", return_value=3
+    )
+    send_transaction = mocker.patch.object(
+        account.client,
+        "send_transaction",
+        side_effect=ClientError("Invalid transaction nonce", code="52"),
+    )
+    prepared_invoke = _prepare_invoke(account)
+
+    for _ in range(2):
+        with pytest.raises(ClientError):
+            await prepared_invoke.invoke(max_fee=1)
+
+    nonces = [call.args[0].nonce for call in send_transaction.call_args_list]
+    assert nonces == [3, 3]
+    assert get_nonce.await_count == 2
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import inspect
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from starknet_py.net.http_client import RpcHttpClient
+
+if TYPE_CHECKING:
+    from starknet_py.net.full_node_client import FullNodeClient
+
+
+class _BatchRpcHttpClient:
+    """
+    Stands in for RpcHttpClient, collecting calls until they are flushed in a single batch.
+    """
+
+    def __init__(self, client: RpcHttpClient):
+        self._client = client
+        self.pending: List[Tuple[str, Optional[dict], asyncio.Future]] = []
+        self.queued = asyncio.Event()
+
+    async def call(self, method_name: str, params: Optional[dict]) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((method_name, params, future))
+        self.queued.set()
+        return await future
+
+    async def flush(self, max_batch_size: Optional[int] = None):
+        pending, self.pending = self.pending, []
+        self.queued.clear()
+        try:
+            results = await self._client.call_many(
+                [(method_name, params) for method_name, params, _ in pending],
+                return_exceptions=True,
+                max_batch_size=max_batch_size,
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            results = [exc] * len(pending)
+
+        for (_, _, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class ClientBatch:
+    """
+    Collects calls of client methods and sends them to the node in JSON-RPC batch requests.
+
+    Every client coroutine method is available on the batch. Instead of a coroutine it returns
+    a task, which is resolved once the batch is executed::
+
+        async with client.batch() as batch:
+            nonce = batch.get_contract_nonce(address)
+            class_hash = batch.get_class_hash_at(address)
+
+        print(nonce.result(), class_hash.result())
+
+    Errors of single calls (e.g. ``ClientError``) are raised only by their own tasks.
+    """
+
+    def __init__(self, client: FullNodeClient, max_batch_size: Optional[int] = None):
+        """
+        :param client: Client whose methods are batched.
+        :param max_batch_size: Maximum number of calls sent in a single http request.
+        """
+        self.max_batch_size = max_batch_size
+        self._rpc = _BatchRpcHttpClient(client._client)
+        self._client = copy.copy(client)
+        self._client._client = self._rpc
+        self._tasks: List[asyncio.Task] = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._client, name)
+        if not inspect.iscoroutinefunction(method):
+            raise AttributeError(f"Method {name} can't be used in a batch.")
+
+        def schedule(*args, **kwargs) -> asyncio.Task:
+            task = asyncio.ensure_future(method(*args, **kwargs))
+            self._tasks.append(task)
+            return task
+
+        return schedule
+
+    async def execute(self):
+        """
+        Sends all collected calls. Methods making several requests (e.g. ``get_events``
+        following continuation tokens) are served in consecutive batches, as are requests
+        made after awaiting something else.
+        """
+        while not all(task.done() for task in self._tasks):
+            # Let scheduled tasks run up to their next request
+            await asyncio.sleep(0)
+
+            if self._rpc.pending:
+                await self._rpc.flush(self.max_batch_size)
+                continue
+
+            running = [task for task in self._tasks if not task.done()]
+            if running:
+                # Tasks awaiting something else than a request (e.g. a lock) may queue their
+                # request later, without completing until it is sent
+                queued = asyncio.ensure_future(self._rpc.queued.wait())
+                try:
+                    await asyncio.wait(
+                        [*running, queued], return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    queued.cancel()
+
+        self._tasks = []
+
+    async def __aenter__(self) -> ClientBatch:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            for task in self._tasks:
+                task.cancel()
+            return
+        await self.execute()
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import RpcHttpClient
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_calls_in_single_request(mocker):
+    async def respond(http_method, address, payload):
+        # pylint: disable=unused-argument
+        results = {
+            "starknet_getNonce": "0x5",
+            "starknet_getClassHashAt": "0x123",
+            "starknet_getStorageAt": {"code": 20, "message": "Contract not found"},
+        }
+        return [
+            (
+                {"jsonrpc": "2.0", "id": call["id"], "result": results[call["method"]]}
+                if "code" not in results[call["method"]]
+                else {
+                    "jsonrpc": "2.0",
+                    "id": call["id"],
+                    "error": results[call["method"]],
+                }
+            )
+            for call in payload
+        ]
+
+    request = mocker.patch.object(RpcHttpClient, "request", side_effect=respond)
+    client = FullNodeClient(node_url="http://127.0.0.1:5050")
+
+    async with client.batch() as batch:
+        nonce = batch.get_contract_nonce(0x1)
+        class_hash = batch.get_class_hash_at(0x1)
+        storage = batch.get_storage_at(0x1, key=0x2)
+
+    assert request.call_count == 1
+    assert len(request.call_args.kwargs["payload"]) == 3
+    assert nonce.result() == 5
+    assert class_hash.result() == 0x123
+    with pytest.raises(ClientError, match="Contract not found"):
+        storage.result()
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_non_coroutine_methods():
+    client = FullNodeClient(node_url="http://127.0.0.1:5050")
+
+    with pytest.raises(AttributeError):
+        client.batch().get_contract_nonce_sync(0x1)
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_requests_made_after_other_awaits(mocker):
+    async def respond(http_method, address, payload):
+        # pylint: disable=unused-argument
+        return [
+            {"jsonrpc": "2.0", "id": call["id"], "result": "0x1"} for call in payload
+        ]
+
+    class SlowClient(FullNodeClient):
+        async def get_contract_nonce(self, *args, **kwargs) -> int:
+            await asyncio.sleep(0.01)
+            return await super().get_contract_nonce(*args, **kwargs)
+
+    request = mocker.patch.object(RpcHttpClient, "request", side_effect=respond)
+    client = SlowClient(node_url="http://127.0.0.1:5050")
+
+    async with client.batch() as batch:
+        nonce = batch.get_contract_nonce(0x1)
+        class_hash = batch.get_class_hash_at(0x1)
+
+    assert request.call_count == 2
+    assert nonce.result() == 1
+    assert class_hash.result() == 1
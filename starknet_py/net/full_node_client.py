@@ -5,6 +5,7 @@ from marshmallow import EXCLUDE
 
 from starknet_py.constants import RPC_CONTRACT_ERROR
 from starknet_py.hash.utils import keccak256
+from starknet_py.net.batch import ClientBatch
 from starknet_py.net.client import Client
 from starknet_py.net.client_errors import ClientError
 from starknet_py.net.client_models import (
@@ -42,7 +43,10 @@ from starknet_py.net.client_utils import (
     _to_storage_key,
     encode_l1_message,
 )
-from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.http_client import RpcHttpClient, SessionPool
+from starknet_py.net.metrics import Metrics
+from starknet_py.net.rate_limiter import RateLimiter
+from starknet_py.net.retry_policy import RetryPolicy
 from starknet_py.net.models.transaction import (
     AccountTransaction,
     Declare,
@@ -80,10 +84,42 @@ from starknet_py.net.schemas.rpc import (
     TransactionV3Schema,
     TypesOfTransactionsSchema,
 )
+from starknet_py.net.schemas.trusted import (
+    load_estimated_fee,
+    load_transaction_receipt,
+    load_transaction_status,
+)
 from starknet_py.net.schemas.utils import _extract_tx_version
 from starknet_py.transaction_errors import TransactionNotReceivedError
 from starknet_py.utils.sync import add_sync_methods
 
+# Schemas don't keep state between loads, so responses are decoded with shared instances
+_PENDING_STARKNET_BLOCK_SCHEMA = PendingStarknetBlockSchema()
+_STARKNET_BLOCK_SCHEMA = StarknetBlockSchema()
+_PENDING_STARKNET_BLOCK_WITH_TX_HASHES_SCHEMA = PendingStarknetBlockWithTxHashesSchema()
+_STARKNET_BLOCK_WITH_TX_HASHES_SCHEMA = StarknetBlockWithTxHashesSchema()
+_EVENTS_CHUNK_SCHEMA = EventsChunkSchema()
+_PENDING_BLOCK_STATE_UPDATE_SCHEMA = PendingBlockStateUpdateSchema()
+_BLOCK_STATE_UPDATE_SCHEMA = BlockStateUpdateSchema()
+_TYPES_OF_TRANSACTIONS_SCHEMA = TypesOfTransactionsSchema()
+_TRANSACTION_RECEIPT_SCHEMA = TransactionReceiptSchema()
+_ESTIMATED_FEE_SCHEMA = EstimatedFeeSchema()
+_BLOCK_HASH_AND_NUMBER_SCHEMA = BlockHashAndNumberSchema()
+_SYNC_STATUS_SCHEMA = SyncStatusSchema()
+_SENT_TRANSACTION_SCHEMA = SentTransactionSchema()
+_DEPLOY_ACCOUNT_TRANSACTION_RESPONSE_SCHEMA = DeployAccountTransactionResponseSchema()
+_DECLARE_TRANSACTION_RESPONSE_SCHEMA = DeclareTransactionResponseSchema()
+_SIERRA_CONTRACT_CLASS_SCHEMA = SierraContractClassSchema()
+_CONTRACT_CLASS_SCHEMA = ContractClassSchema()
+_TRANSACTION_STATUS_RESPONSE_SCHEMA = TransactionStatusResponseSchema()
+_TRANSACTION_TRACE_SCHEMA = TransactionTraceSchema()
+_SIMULATED_TRANSACTION_SCHEMA = SimulatedTransactionSchema()
+_BLOCK_TRANSACTION_TRACE_SCHEMA = BlockTransactionTraceSchema()
+_DECLARE_V1_SCHEMA = DeclareV1Schema()
+_DECLARE_V2_SCHEMA = DeclareV2Schema()
+_SIERRA_COMPILED_CONTRACT_SCHEMA = SierraCompiledContractSchema()
+_TRANSACTION_V3_SCHEMA = TransactionV3Schema(exclude=["version", "signature"])
+
 
 @add_sync_methods
 class FullNodeClient(Client):
@@ -92,7 +128,12 @@ class FullNodeClient(Client):
         self,
         node_url: str,
         session: Optional[aiohttp.ClientSession] = None,
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        session_pool: Optional[SessionPool] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
+        trusted_node: bool = False,
     ):
         """
         Client for interacting with Starknet json-rpc interface.
@@ -101,9 +142,39 @@ class FullNodeClient(Client):
         :param net: Starknet network identifier
         :param session: Aiohttp session to be used for request. If not provided, client will create a session for
                         every request. When using a custom session, user is responsible for closing it manually.
+        :param proxy: Url of http or socks5 proxy to send requests through.
+        :param session_pool: Pool of keep-alive sessions shared between clients, used when ``session``
+                        is not provided. User is responsible for closing the pool.
+        :param rate_limiter: Limiter of requests per node url and per proxy, can be shared between clients.
+        :param retry_policy: Policy of retrying failed http requests, can be shared between clients.
+                        By default, only "try again" responses of the node are retried.
+        :param metrics: Registry recording counts, errors, bytes and latency of requests per rpc method,
+                        can be shared between clients.
+        :param trusted_node: If True, receipts, transaction statuses and fee estimates are decoded
+                        without validation. Use only with nodes you trust.
         """
         self.url = node_url
-        self._client = RpcHttpClient(url=node_url, session=session, proxy=proxy)
+        self.trusted_node = trusted_node
+        self._client = RpcHttpClient(
+            url=node_url,
+            session=session,
+            proxy=proxy,
+            session_pool=session_pool,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            metrics=metrics,
+        )
+
+    def batch(self, max_batch_size: Optional[int] = None) -> ClientBatch:
+        """
+        Creates a batch sending calls of this client's methods in JSON-RPC batch requests.
+        Requests that methods make after awaiting something else are sent in later batches.
+
+        :param max_batch_size: Maximum number of calls sent in a single http request.
+            If not provided, all calls collected by the batch are sent together.
+        :return: ClientBatch to be used as an async context manager.
+        """
+        return ClientBatch(client=self, max_batch_size=max_batch_size)
 
     async def get_block(
         self,
@@ -125,9 +196,9 @@ class FullNodeClient(Client):
         if block_identifier == {"block_id": "pending"}:
             return cast(
                 PendingStarknetBlock,
-                PendingStarknetBlockSchema().load(res, unknown=EXCLUDE),
+                _PENDING_STARKNET_BLOCK_SCHEMA.load(res, unknown=EXCLUDE),
             )
-        return cast(StarknetBlock, StarknetBlockSchema().load(res, unknown=EXCLUDE))
+        return cast(StarknetBlock, _STARKNET_BLOCK_SCHEMA.load(res, unknown=EXCLUDE))
 
     async def get_block_with_txs(
         self,
@@ -153,11 +224,13 @@ class FullNodeClient(Client):
         if block_identifier == {"block_id": "pending"}:
             return cast(
                 PendingStarknetBlockWithTxHashes,
-                PendingStarknetBlockWithTxHashesSchema().load(res, unknown=EXCLUDE),
+                _PENDING_STARKNET_BLOCK_WITH_TX_HASHES_SCHEMA.load(
+                    res, unknown=EXCLUDE
+                ),
             )
         return cast(
             StarknetBlockWithTxHashes,
-            StarknetBlockWithTxHashesSchema().load(res, unknown=EXCLUDE),
+            _STARKNET_BLOCK_WITH_TX_HASHES_SCHEMA.load(res, unknown=EXCLUDE),
         )
 
     # TODO (#809): add tests with multiple emitted keys
@@ -230,7 +303,7 @@ class FullNodeClient(Client):
 
         events_response = cast(
             EventsChunk,
-            EventsChunkSchema().load(
+            _EVENTS_CHUNK_SCHEMA.load(
                 {"events": events_list, "continuation_token": continuation_token}
             ),
         )
@@ -284,10 +357,10 @@ class FullNodeClient(Client):
         if block_identifier == {"block_id": "pending"}:
             return cast(
                 PendingBlockStateUpdate,
-                PendingBlockStateUpdateSchema().load(res, unknown=EXCLUDE),
+                _PENDING_BLOCK_STATE_UPDATE_SCHEMA.load(res, unknown=EXCLUDE),
             )
         return cast(
-            BlockStateUpdate, BlockStateUpdateSchema().load(res, unknown=EXCLUDE)
+            BlockStateUpdate, _BLOCK_STATE_UPDATE_SCHEMA.load(res, unknown=EXCLUDE)
         )
 
     async def get_storage_at(
@@ -323,7 +396,9 @@ class FullNodeClient(Client):
             )
         except ClientError as ex:
             raise TransactionNotReceivedError() from ex
-        return cast(Transaction, TypesOfTransactionsSchema().load(res, unknown=EXCLUDE))
+        return cast(
+            Transaction, _TYPES_OF_TRANSACTIONS_SCHEMA.load(res, unknown=EXCLUDE)
+        )
 
     async def get_l1_message_hash(self, tx_hash: Hash) -> Hash:
         """
@@ -344,8 +419,10 @@ class FullNodeClient(Client):
             method_name="getTransactionReceipt",
             params={"transaction_hash": _to_rpc_felt(tx_hash)},
         )
+        if self.trusted_node:
+            return load_transaction_receipt(res)
         return cast(
-            TransactionReceipt, TransactionReceiptSchema().load(res, unknown=EXCLUDE)
+            TransactionReceipt, _TRANSACTION_RECEIPT_SCHEMA.load(res, unknown=EXCLUDE)
         )
 
     async def estimate_fee(
@@ -376,9 +453,14 @@ class FullNodeClient(Client):
         if single_transaction:
             res = res[0]
 
+        if self.trusted_node:
+            if single_transaction:
+                return load_estimated_fee(res)
+            return [load_estimated_fee(fee) for fee in res]
+
         return cast(
             EstimatedFee,
-            EstimatedFeeSchema().load(
+            _ESTIMATED_FEE_SCHEMA.load(
                 res, unknown=EXCLUDE, many=(not single_transaction)
             ),
         )
@@ -426,7 +508,7 @@ class FullNodeClient(Client):
                     **block_identifier,
                 },
             )
-            return cast(EstimatedFee, EstimatedFeeSchema().load(res, unknown=EXCLUDE))
+            return cast(EstimatedFee, _ESTIMATED_FEE_SCHEMA.load(res, unknown=EXCLUDE))
         except ClientError as err:
             if err.code == RPC_CONTRACT_ERROR:
                 raise ClientError(
@@ -442,7 +524,7 @@ class FullNodeClient(Client):
     async def get_block_hash_and_number(self) -> BlockHashAndNumber:
         """Get the most recent accepted block hash and number"""
         res = await self._client.call(method_name="blockHashAndNumber", params={})
-        return cast(BlockHashAndNumber, BlockHashAndNumberSchema().load(res))
+        return cast(BlockHashAndNumber, _BLOCK_HASH_AND_NUMBER_SCHEMA.load(res))
 
     async def get_chain_id(self) -> str:
         """Return the currently configured Starknet chain id"""
@@ -453,7 +535,7 @@ class FullNodeClient(Client):
         sync_status = await self._client.call(method_name="syncing", params={})
         if isinstance(sync_status, bool):
             return sync_status
-        return cast(SyncStatus, SyncStatusSchema().load(sync_status))
+        return cast(SyncStatus, _SYNC_STATUS_SCHEMA.load(sync_status))
 
     async def call_contract(
         self,
@@ -486,7 +568,7 @@ class FullNodeClient(Client):
         )
 
         return cast(
-            SentTransactionResponse, SentTransactionSchema().load(res, unknown=EXCLUDE)
+            SentTransactionResponse, _SENT_TRANSACTION_SCHEMA.load(res, unknown=EXCLUDE)
         )
 
     async def deploy_account(
@@ -501,7 +583,7 @@ class FullNodeClient(Client):
 
         return cast(
             DeployAccountTransactionResponse,
-            DeployAccountTransactionResponseSchema().load(res, unknown=EXCLUDE),
+            _DEPLOY_ACCOUNT_TRANSACTION_RESPONSE_SCHEMA.load(res, unknown=EXCLUDE),
         )
 
     async def declare(self, transaction: Declare) -> DeclareTransactionResponse:
@@ -514,7 +596,7 @@ class FullNodeClient(Client):
 
         return cast(
             DeclareTransactionResponse,
-            DeclareTransactionResponseSchema().load(res, unknown=EXCLUDE),
+            _DECLARE_TRANSACTION_RESPONSE_SCHEMA.load(res, unknown=EXCLUDE),
         )
 
     async def get_class_hash_at(
@@ -557,9 +639,9 @@ class FullNodeClient(Client):
         if "sierra_program" in res:
             return cast(
                 SierraContractClass,
-                SierraContractClassSchema().load(res, unknown=EXCLUDE),
+                _SIERRA_CONTRACT_CLASS_SCHEMA.load(res, unknown=EXCLUDE),
             )
-        return cast(ContractClass, ContractClassSchema().load(res, unknown=EXCLUDE))
+        return cast(ContractClass, _CONTRACT_CLASS_SCHEMA.load(res, unknown=EXCLUDE))
 
     # Only RPC methods
 
@@ -588,7 +670,9 @@ class FullNodeClient(Client):
                 "index": index,
             },
         )
-        return cast(Transaction, TypesOfTransactionsSchema().load(res, unknown=EXCLUDE))
+        return cast(
+            Transaction, _TYPES_OF_TRANSACTIONS_SCHEMA.load(res, unknown=EXCLUDE)
+        )
 
     async def get_block_transaction_count(
         self,
@@ -642,9 +726,9 @@ class FullNodeClient(Client):
         if "sierra_program" in res:
             return cast(
                 SierraContractClass,
-                SierraContractClassSchema().load(res, unknown=EXCLUDE),
+                _SIERRA_CONTRACT_CLASS_SCHEMA.load(res, unknown=EXCLUDE),
             )
-        return cast(ContractClass, ContractClassSchema().load(res, unknown=EXCLUDE))
+        return cast(ContractClass, _CONTRACT_CLASS_SCHEMA.load(res, unknown=EXCLUDE))
 
     async def get_contract_nonce(
         self,
@@ -682,9 +766,11 @@ class FullNodeClient(Client):
             method_name="getTransactionStatus",
             params={"transaction_hash": _to_rpc_felt(tx_hash)},
         )
+        if self.trusted_node:
+            return load_transaction_status(res)
         return cast(
             TransactionStatusResponse,
-            TransactionStatusResponseSchema().load(res, unknown=EXCLUDE),
+            _TRANSACTION_STATUS_RESPONSE_SCHEMA.load(res, unknown=EXCLUDE),
         )
 
     # ------------------------------- Trace API -------------------------------
@@ -706,7 +792,7 @@ class FullNodeClient(Client):
             },
         )
         return cast(
-            TransactionTrace, TransactionTraceSchema().load(res, unknown=EXCLUDE)
+            TransactionTrace, _TRANSACTION_TRACE_SCHEMA.load(res, unknown=EXCLUDE)
         )
 
     async def simulate_transactions(
@@ -758,7 +844,7 @@ class FullNodeClient(Client):
         )
         return cast(
             List[SimulatedTransaction],
-            SimulatedTransactionSchema().load(res, unknown=EXCLUDE, many=True),
+            _SIMULATED_TRANSACTION_SCHEMA.load(res, unknown=EXCLUDE, many=True),
         )
 
     async def trace_block_transactions(
@@ -785,7 +871,7 @@ class FullNodeClient(Client):
         )
         return cast(
             List[BlockTransactionTrace],
-            BlockTransactionTraceSchema().load(res, unknown=EXCLUDE, many=True),
+            _BLOCK_TRANSACTION_TRACE_SCHEMA.load(res, unknown=EXCLUDE, many=True),
         )
 
 
@@ -841,7 +927,7 @@ def _create_broadcasted_declare_properties(
     if isinstance(transaction, DeclareV3):
         return _create_broadcasted_declare_v3_properties(transaction)
 
-    contract_class = cast(Dict, DeclareV1Schema().dump(obj=transaction))[
+    contract_class = cast(Dict, _DECLARE_V1_SCHEMA.dump(obj=transaction))[
         "contract_class"
     ]
     declare_properties = {
@@ -858,7 +944,7 @@ def _create_broadcasted_declare_properties(
 
 
 def _create_broadcasted_declare_v2_properties(transaction: DeclareV2) -> dict:
-    contract_class = cast(Dict, DeclareV2Schema().dump(obj=transaction))[
+    contract_class = cast(Dict, _DECLARE_V2_SCHEMA.dump(obj=transaction))[
         "contract_class"
     ]
     declare_v2_properties = {
@@ -878,7 +964,7 @@ def _create_broadcasted_declare_v2_properties(transaction: DeclareV2) -> dict:
 
 def _create_broadcasted_declare_v3_properties(transaction: DeclareV3) -> dict:
     contract_class = cast(
-        Dict, SierraCompiledContractSchema().dump(obj=transaction.contract_class)
+        Dict, _SIERRA_COMPILED_CONTRACT_SCHEMA.dump(obj=transaction.contract_class)
     )
 
     declare_v3_properties = {
@@ -962,5 +1048,5 @@ def _create_broadcasted_txn_v3_common_properties(
 ) -> dict:
     return cast(
         Dict,
-        TransactionV3Schema(exclude=["version", "signature"]).dump(obj=transaction),
+        _TRANSACTION_V3_SCHEMA.dump(obj=transaction),
     )
@@ -1,11 +1,17 @@
+import itertools
+import json
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientResponse, ClientSession, TCPConnector
 from aiohttp_socks import ProxyConnector
 
 from starknet_py.net.client_errors import ClientError
+from starknet_py.net.metrics import Metrics
+from starknet_py.net.rate_limiter import RateLimiter
+from starknet_py.net.retry_policy import RetryPolicy
 
 
 class HttpMethod(Enum):
@@ -13,16 +19,107 @@ class HttpMethod(Enum):
     POST = "POST"
 
 
+def _is_socks_proxy(proxy: Optional[str]) -> bool:
+    return proxy is not None and proxy.startswith("socks5://")
+
+
+def _is_retry_later_response(exc: BaseException) -> bool:
+    return (
+        isinstance(exc, ClientError)
+        and exc.code == "502"
+        and "Please try again in 30 seconds." in exc.message
+    )
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy(
+    max_attempts=10, base_delay=1, max_delay=30, is_transient=_is_retry_later_response
+)
+"""Policy of clients created without one: retries only the node's "try again" responses."""
+
+
+def _metric_name(call) -> str:
+    return call.get("method", "unknown") if isinstance(call, dict) else "unknown"
+
+
+def _has_rpc_error(result) -> bool:
+    return not isinstance(result, dict) or "error" in result
+
+
+class SessionPool:
+    """
+    Pool of keep-alive aiohttp sessions shared between clients, one session per proxy url.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30,
+    ):
+        """
+        :param limit: Maximum number of simultaneous connections of a single session.
+        :param limit_per_host: Maximum number of simultaneous connections to the same endpoint
+            of a single session.
+        :param keepalive_timeout: Time in seconds for which idle connections are kept open.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._sessions: Dict[Optional[str], ClientSession] = {}
+
+    def _make_connector(self, proxy: Optional[str]):
+        kwargs = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+        }
+        if _is_socks_proxy(proxy):
+            return ProxyConnector.from_url(url=proxy, rdns=True, **kwargs)
+        return TCPConnector(**kwargs)
+
+    def get_session(self, proxy: Optional[str] = None) -> ClientSession:
+        """
+        Returns a session for the given proxy url, creating it on first use.
+        Must be called from within a running event loop.
+        """
+        session = self._sessions.get(proxy)
+        if session is None or session.closed:
+            session = ClientSession(connector=self._make_connector(proxy))
+            self._sessions[proxy] = session
+        return session
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def close(self):
+        """
+        Closes all pooled sessions.
+        """
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+
 class HttpClient(ABC):
     def __init__(
         self,
         url,
         session: Optional[ClientSession] = None,
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        session_pool: Optional[SessionPool] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
     ):
         self.url = url
         self.session = session
         self.proxy = proxy
+        self.session_pool = session_pool
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.metrics = metrics
 
     async def request(
         self,
@@ -40,7 +137,12 @@ class HttpClient(ABC):
         if self.session:
             return await self._make_request(session=self.session, **kwargs)
 
-        if self.proxy and self.proxy.startswith('socks5://'):
+        if self.session_pool is not None:
+            return await self._make_request(
+                session=self.session_pool.get_session(self.proxy), **kwargs
+            )
+
+        if _is_socks_proxy(self.proxy):
             connector = ProxyConnector.from_url(url=self.proxy, rdns=True)
         else:
             connector = None
@@ -57,20 +159,100 @@ class HttpClient(ABC):
         payload: dict,
     ) -> dict:
         # pylint: disable=too-many-arguments
-        max_retries = 10
-        for retry in range(max_retries):
+        async def send() -> dict:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(address, self.proxy)
+            if self.metrics is not None:
+                return await self._make_measured_request(
+                    session, address, http_method, params, payload
+                )
             async with session.request(
                 method=http_method.value,
                 url=address,
                 params=params,
                 json=payload,
-                proxy=None if self.proxy and self.proxy.startswith('socks5://') else self.proxy
+                proxy=None if _is_socks_proxy(self.proxy) else self.proxy
             ) as request:
-                if request.status == 502 and 'Please try again in 30 seconds.' in await request.text() and retry < max_retries - 1:
-                    continue
                 await self.handle_request_error(request)
                 return await request.json(content_type=None)
 
+        return await self.retry_policy.run(send, key=(address, self.proxy))
+
+    async def _make_measured_request(
+        self,
+        session: ClientSession,
+        address: str,
+        http_method: HttpMethod,
+        params: dict,
+        payload: dict,
+    ) -> dict:
+        # pylint: disable=too-many-arguments
+        assert self.metrics is not None
+        # Payload is serialized here instead of by aiohttp to count its bytes, calls of
+        # a batch one by one to count the bytes of every method
+        if isinstance(payload, list):
+            calls = [json.dumps(call).encode() for call in payload]
+            data = b"[" + b",".join(calls) + b"]"
+        else:
+            calls = None
+            data = json.dumps(payload).encode()
+        received = 0
+        result = None
+        start = time.perf_counter()
+        try:
+            async with session.request(
+                method=http_method.value,
+                url=address,
+                params=params,
+                data=data,
+                headers={"Content-Type": "application/json"},
+                proxy=None if _is_socks_proxy(self.proxy) else self.proxy,
+            ) as request:
+                await self.handle_request_error(request)
+                body = await request.read()
+            received = len(body)
+            result = json.loads(body)
+            return result
+        finally:
+            latency = time.perf_counter() - start
+            if calls is None:
+                self.metrics.record(
+                    _metric_name(payload),
+                    latency,
+                    error=_has_rpc_error(result),
+                    bytes_sent=len(data),
+                    bytes_received=received,
+                )
+            else:
+                self._record_batch(payload, calls, result, latency)
+
+    def _record_batch(
+        self, payload: list, calls: List[bytes], result: Any, latency: float
+    ):
+        """
+        Records every call of a batch under its method, with the latency of the whole batch.
+        Received bytes of a call are the size of its response serialized again.
+        """
+        assert self.metrics is not None
+        responses = {}
+        if isinstance(result, list):
+            responses = {
+                item.get("id"): item for item in result if isinstance(item, dict)
+            }
+        for call, sent in zip(payload, calls):
+            response = responses.get(call.get("id"))
+            self.metrics.record(
+                _metric_name(call),
+                latency,
+                error=_has_rpc_error(response),
+                bytes_sent=len(sent),
+                bytes_received=(
+                    0
+                    if response is None
+                    else len(json.dumps(response, separators=(",", ":")))
+                ),
+            )
+
     @abstractmethod
     async def handle_request_error(self, request: ClientResponse):
         """
@@ -78,6 +260,9 @@ class HttpClient(ABC):
         """
 
 
+_request_ids = itertools.count(1)
+
+
 class RpcHttpClient(HttpClient):
     async def call(self, method_name: str, params: dict):
         payload = {
@@ -91,6 +276,74 @@ class RpcHttpClient(HttpClient):
             http_method=HttpMethod.POST, address=self.url, payload=payload
         )
 
+        return self._unwrap_result(result)
+
+    async def call_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[dict]]],
+        return_exceptions: bool = False,
+        max_batch_size: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Sends many calls as JSON-RPC batch requests.
+
+        :param calls: Sequence of ``(method_name, params)`` pairs, method names without the ``starknet_`` prefix.
+        :param return_exceptions: If True, errors of single calls are returned in place of their results
+            instead of being raised.
+        :param max_batch_size: Maximum number of calls sent in a single http request.
+            If not provided, all calls are sent together.
+        :return: Results in the same order as ``calls``.
+        """
+        results = []
+        chunk_size = max_batch_size or max(len(calls), 1)
+        for start in range(0, len(calls), chunk_size):
+            results.extend(await self._send_batch(calls[start : start + chunk_size]))
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    async def _send_batch(
+        self, calls: Sequence[Tuple[str, Optional[dict]]]
+    ) -> List[Any]:
+        ids = [next(_request_ids) for _ in calls]
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": f"starknet_{method_name}",
+                "id": request_id,
+                "params": params if params else [],
+            }
+            for request_id, (method_name, params) in zip(ids, calls)
+        ]
+
+        response = await self.request(
+            http_method=HttpMethod.POST, address=self.url, payload=payload
+        )
+
+        if not isinstance(response, list):
+            # Whole batch was rejected, e.g. node does not support batching
+            self._unwrap_result(response)
+            raise ServerError(body=response)
+
+        responses = {
+            result.get("id"): result for result in response if isinstance(result, dict)
+        }
+
+        results = []
+        for request_id in ids:
+            if request_id not in responses:
+                results.append(ServerError(body={"id": request_id, "batch": response}))
+                continue
+            try:
+                results.append(self._unwrap_result(responses[request_id]))
+            except (ClientError, ServerError) as exc:
+                results.append(exc)
+        return results
+
+    def _unwrap_result(self, result: dict):
         if "result" not in result:
             self.handle_rpc_error(result)
         return result["result"]
@@ -0,0 +1,204 @@
+import json
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+    600,
+    1800,
+)
+"""Upper bounds of latency buckets in seconds, from rpc calls to receipt waits."""
+
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets, in the shape of a Prometheus histogram.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # The last count is for values above the last bucket (the +Inf bucket)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[int]:
+        """
+        :return: Number of observations less than or equal to every bucket bound, +Inf included.
+        """
+        result = []
+        total = 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        :return: Upper bound of the bucket holding the ``q`` quantile, None if nothing was observed
+            or the quantile is above the last bucket.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in zip(self.buckets, self.cumulative_counts()):
+            if total >= rank:
+                return bound
+        return None
+
+
+class OperationStats:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = Histogram(buckets)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency_sum": self.latency.sum,
+            "latency_p50": self.latency.quantile(0.5),
+            "latency_p99": self.latency.quantile(0.99),
+            "latency_buckets": dict(
+                zip(
+                    [*map(str, self.latency.buckets), "+Inf"],
+                    self.latency.cumulative_counts(),
+                )
+            ),
+        }
+
+
+class Timer:
+    """
+    Context manager recording the duration of its body, and an error if the body raises.
+    """
+
+    def __init__(self, metrics: "Metrics", name: str):
+        self.metrics = metrics
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.metrics.record(
+            self.name,
+            time.perf_counter() - self.start,
+            error=exc_type is not None,
+        )
+
+
+class Metrics:
+    """
+    Request counts, error counts, transferred bytes and latency histograms of named
+    operations, e.g. rpc methods.
+
+    Recording is a few dict lookups and additions, so it can be left on in production.
+    Methods never await, so a registry can be shared between clients without a lock.
+    """
+
+    def __init__(self, namespace: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        :param namespace: Prefix of metric names in the Prometheus exposition.
+        :param buckets: Upper bounds of latency buckets in seconds.
+        """
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self.operations: Dict[str, OperationStats] = {}
+
+    def get(self, name: str) -> OperationStats:
+        stats = self.operations.get(name)
+        if stats is None:
+            stats = self.operations[name] = OperationStats(self.buckets)
+        return stats
+
+    def record(
+        self,
+        name: str,
+        latency: float,
+        error: bool = False,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ):
+        # pylint: disable=too-many-arguments
+        stats = self.get(name)
+        stats.requests += 1
+        stats.errors += error
+        stats.bytes_sent += bytes_sent
+        stats.bytes_received += bytes_received
+        stats.latency.observe(latency)
+
+    def time(self, name: str) -> Timer:
+        """
+        Returns a context manager recording the duration of its body as an operation ``name``.
+        """
+        return Timer(self, name)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.to_dict() for name, stats in self.operations.items()}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=4)
+
+    def to_prometheus(self) -> str:
+        """
+        :return: Metrics in the Prometheus text exposition format.
+        """
+        prefix = self.namespace
+        lines = []
+        for metric, kind, attribute in (
+            ("requests_total", "counter", "requests"),
+            ("errors_total", "counter", "errors"),
+            ("sent_bytes_total", "counter", "bytes_sent"),
+            ("received_bytes_total", "counter", "bytes_received"),
+        ):
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            for name, stats in self.operations.items():
+                lines.append(
+                    f'{prefix}_{metric}{{name="{name}"}} {getattr(stats, attribute)}'
+                )
+
+        lines.append(f"# TYPE {prefix}_latency_seconds histogram")
+        for name, stats in self.operations.items():
+            histogram = stats.latency
+            for bound, total in zip(
+                [*map(str, histogram.buckets), "+Inf"], histogram.cumulative_counts()
+            ):
+                lines.append(
+                    f'{prefix}_latency_seconds_bucket{{name="{name}",le="{bound}"}} {total}'
+                )
+            lines.append(
+                f'{prefix}_latency_seconds_sum{{name="{name}"}} {histogram.sum}'
+            )
+            lines.append(
+                f'{prefix}_latency_seconds_count{{name="{name}"}} {histogram.count}'
+            )
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,113 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.metrics import Histogram, Metrics
+
+
+@pytest_asyncio.fixture(name="node_url")
+async def fixture_node_url():
+    async def handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        if isinstance(payload, list):
+            return web.json_response(
+                [{"jsonrpc": "2.0", "id": call["id"], "result": 1} for call in payload]
+            )
+        if payload["method"] == "starknet_getClassHashAt":
+            return web.json_response(
+                {
+                    "jsonrpc": "2.0",
+                    "id": payload["id"],
+                    "error": {"code": 20, "message": "Contract not found"},
+                }
+            )
+        return web.json_response({"jsonrpc": "2.0", "id": payload["id"], "result": 1})
+
+    runner = web.AppRunner(web.Application())
+    runner.app.router.add_post("/", handle)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    yield f"http://127.0.0.1:{runner.addresses[0][1]}/"
+    await runner.cleanup()
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 2):
+        histogram.observe(value)
+
+    assert histogram.cumulative_counts() == [2, 3, 4]
+    assert histogram.sum == pytest.approx(2.65)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1
+    assert histogram.quantile(1) is None
+
+
+def test_timer_records_errors():
+    metrics = Metrics("test")
+
+    with metrics.time("solve"):
+        pass
+    with pytest.raises(ValueError):
+        with metrics.time("solve"):
+            raise ValueError()
+
+    stats = metrics.get("solve")
+    assert stats.requests == 2
+    assert stats.errors == 1
+
+
+def test_prometheus_exposition():
+    metrics = Metrics("test", buckets=(1,))
+    metrics.record("starknet_blockNumber", 0.5, bytes_sent=10, bytes_received=20)
+
+    text = metrics.to_prometheus()
+
+    assert 'test_requests_total{name="starknet_blockNumber"} 1' in text
+    assert 'test_received_bytes_total{name="starknet_blockNumber"} 20' in text
+    assert 'test_latency_seconds_bucket{name="starknet_blockNumber",le="1"} 1' in text
+    assert (
+        'test_latency_seconds_bucket{name="starknet_blockNumber",le="+Inf"} 1' in text
+    )
+    assert 'test_latency_seconds_count{name="starknet_blockNumber"} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_client_records_rpc_methods(node_url):
+    metrics = Metrics("starknet_rpc")
+    client = FullNodeClient(node_url=node_url, metrics=metrics)
+
+    assert await client.get_block_number() == 1
+    with pytest.raises(ClientError):
+        await client.get_class_hash_at(contract_address=0x1)
+
+    block_number = metrics.get("starknet_blockNumber")
+    assert block_number.requests == 1
+    assert block_number.errors == 0
+    assert block_number.bytes_sent > 0
+    assert block_number.bytes_received > 0
+    assert metrics.get("starknet_getClassHashAt").errors == 1
+
+
+@pytest.mark.asyncio
+async def test_client_records_methods_of_batches(node_url):
+    metrics = Metrics("starknet_rpc")
+    client = FullNodeClient(node_url=node_url, metrics=metrics)
+
+    async with client.batch() as batch:
+        batch.get_block_number()
+        batch.get_block_number()
+        batch.get_chain_id()
+
+    block_number = metrics.get("starknet_blockNumber")
+    chain_id = metrics.get("starknet_chainId")
+    assert block_number.requests == 2
+    assert chain_id.requests == 1
+    assert block_number.errors == chain_id.errors == 0
+    assert block_number.bytes_sent > chain_id.bytes_sent > 0
+    assert block_number.bytes_received > chain_id.bytes_received > 0
+    # The batch is a single request, its latency is shared by all its calls
+    assert block_number.latency.sum == pytest.approx(2 * chain_id.latency.sum)
+    assert "batch" not in metrics.operations
@@ -0,0 +1,259 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import aiohttp
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import HttpMethod, RpcHttpClient, SessionPool
+from starknet_py.net.metrics import Metrics
+from starknet_py.net.rate_limiter import RateLimiter
+from starknet_py.net.retry_policy import (
+    CircuitOpenError,
+    RetryPolicy,
+    is_transient_error,
+)
+
+STICKY_METHODS = {
+    "starknet_getNonce",
+    "starknet_addInvokeTransaction",
+    "starknet_addDeclareTransaction",
+    "starknet_addDeployAccountTransaction",
+}
+"""Methods sent to the same node by a client, so that transactions of an account see consistent nonces."""
+
+
+class Endpoint:
+    """
+    Node url with its exponentially weighted moving average latency and error rate.
+    """
+
+    def __init__(self, url: str, alpha: float):
+        self.url = url
+        self.alpha = alpha
+        self.latency: Optional[float] = None
+        self.error_rate: float = 0
+        self.unhealthy_until: float = 0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def record_success(self, latency: float):
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.alpha * (latency - self.latency)
+        self.error_rate -= self.alpha * self.error_rate
+
+    def record_failure(self, max_error_rate: float, cooldown: float):
+        self.error_rate += self.alpha * (1 - self.error_rate)
+        if self.error_rate >= max_error_rate:
+            self.unhealthy_until = time.monotonic() + cooldown
+
+    def __repr__(self) -> str:
+        return (
+            f"Endpoint(url={self.url!r}, latency={self.latency}, "
+            f"error_rate={self.error_rate:.2f}, healthy={self.healthy})"
+        )
+
+
+class EndpointPool:
+    """
+    Set of nodes shared between clients, tracking latency and error rate of every node.
+
+    A node whose error rate reaches ``max_error_rate`` is considered unhealthy and skipped
+    for ``cooldown`` seconds.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        alpha: float = 0.3,
+        max_error_rate: float = 0.5,
+        cooldown: float = 30,
+    ):
+        """
+        :param urls: Urls of nodes providing rpc interface.
+        :param alpha: Weight of the newest sample in the latency and error rate averages.
+        :param max_error_rate: Error rate at which a node is considered unhealthy.
+        :param cooldown: Time in seconds for which unhealthy nodes are skipped.
+        """
+        if not urls:
+            raise ValueError("At least one node url has to be provided.")
+
+        self.endpoints = [Endpoint(url, alpha) for url in urls]
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+
+    def select(self, exclude: Sequence[Endpoint] = ()) -> Optional[Endpoint]:
+        """
+        Returns the fastest healthy node (nodes without measurements first). If all nodes are
+        unhealthy, returns the one recovering soonest.
+
+        :param exclude: Nodes which must not be returned.
+        :return: Node, or None if all nodes are excluded.
+        """
+        candidates = [
+            endpoint for endpoint in self.endpoints if endpoint not in exclude
+        ]
+        if not candidates:
+            return None
+
+        healthy = [endpoint for endpoint in candidates if endpoint.healthy]
+        if not healthy:
+            return min(candidates, key=lambda endpoint: endpoint.unhealthy_until)
+
+        return min(
+            healthy,
+            key=lambda endpoint: -1 if endpoint.latency is None else endpoint.latency,
+        )
+
+    def record_failure(self, endpoint: Endpoint):
+        endpoint.record_failure(self.max_error_rate, self.cooldown)
+
+
+def _is_endpoint_failure(exc: Exception) -> bool:
+    """
+    Tells failures of the node itself apart from errors returned for the request.
+    """
+    return isinstance(exc, CircuitOpenError) or is_transient_error(exc)
+
+
+class MultiEndpointRpcHttpClient(RpcHttpClient):
+    """
+    RpcHttpClient sending requests to nodes of an EndpointPool, failing over to the next
+    fastest node on 5xx responses, timeouts and connection errors.
+    """
+
+    def __init__(
+        self,
+        endpoint_pool: EndpointPool,
+        session: Optional[aiohttp.ClientSession] = None,
+        proxy: Optional[str] = None,
+        session_pool: Optional[SessionPool] = None,
+        timeout: Optional[float] = 30,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        super().__init__(
+            url=endpoint_pool.endpoints[0].url,
+            session=session,
+            proxy=proxy,
+            session_pool=session_pool,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            metrics=metrics,
+        )
+        self.endpoint_pool = endpoint_pool
+        self.timeout = timeout
+        self.sticky_endpoint: Optional[Endpoint] = None
+
+    async def request(
+        self,
+        address: str,
+        http_method: HttpMethod,
+        params: Optional[dict] = None,
+        payload: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    ):
+        sticky = isinstance(payload, dict) and payload.get("method") in STICKY_METHODS
+        tried: List[Endpoint] = []
+        last_exc: Optional[Exception] = None
+
+        while True:
+            if (
+                sticky
+                and self.sticky_endpoint is not None
+                and self.sticky_endpoint.healthy
+                and self.sticky_endpoint not in tried
+            ):
+                endpoint = self.sticky_endpoint
+            else:
+                endpoint = self.endpoint_pool.select(exclude=tried)
+
+            if endpoint is None:
+                assert last_exc is not None
+                raise last_exc
+
+            start = time.monotonic()
+            try:
+                result = await asyncio.wait_for(
+                    super().request(
+                        address=endpoint.url,
+                        http_method=http_method,
+                        params=params,
+                        payload=payload,
+                    ),
+                    self.timeout,
+                )
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                if not _is_endpoint_failure(exc):
+                    raise
+                self.endpoint_pool.record_failure(endpoint)
+                if self.sticky_endpoint is endpoint:
+                    self.sticky_endpoint = None
+                tried.append(endpoint)
+                last_exc = exc
+                continue
+
+            endpoint.record_success(time.monotonic() - start)
+            if sticky:
+                self.sticky_endpoint = endpoint
+            return result
+
+
+class MultiNodeClient(FullNodeClient):
+    def __init__(
+        self,
+        node_urls: Union[Sequence[str], EndpointPool],
+        session: Optional[aiohttp.ClientSession] = None,
+        proxy: Optional[str] = None,
+        session_pool: Optional[SessionPool] = None,
+        timeout: Optional[float] = 30,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
+        trusted_node: bool = False,
+    ):
+        """
+        Client for interacting with Starknet json-rpc interface of many nodes.
+
+        Reads are sent to the fastest healthy node. Nonce reads and transactions are sent to
+        the same node as long as it stays healthy. Requests failing with 5xx responses,
+        timeouts or connection errors are retried on the next fastest node.
+
+        :param node_urls: Urls of nodes providing rpc interface, or an EndpointPool shared
+                        between clients.
+        :param session: Aiohttp session to be used for request. If not provided, client will create a session for
+                        every request. When using a custom session, user is responsible for closing it manually.
+        :param proxy: Url of http or socks5 proxy to send requests through.
+        :param session_pool: Pool of keep-alive sessions shared between clients, used when ``session``
+                        is not provided. User is responsible for closing the pool.
+        :param timeout: Time in seconds after which a request is retried on another node.
+        :param rate_limiter: Limiter of requests per node url and per proxy, can be shared between clients.
+        :param retry_policy: Policy of retrying failed http requests on the same node, can be shared
+                        between clients. Requests failing despite it are retried on the next node.
+        :param metrics: Registry recording counts, errors, bytes and latency of requests per rpc method,
+                        can be shared between clients.
+        :param trusted_node: If True, receipts, transaction statuses and fee estimates are decoded
+                        without validation. Use only with nodes you trust.
+        """
+        # pylint: disable=super-init-not-called
+        self.endpoint_pool = (
+            node_urls
+            if isinstance(node_urls, EndpointPool)
+            else EndpointPool(node_urls)
+        )
+        self.url = self.endpoint_pool.endpoints[0].url
+        self.trusted_node = trusted_node
+        self._client = MultiEndpointRpcHttpClient(
+            endpoint_pool=self.endpoint_pool,
+            session=session,
+            proxy=proxy,
+            session_pool=session_pool,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            metrics=metrics,
+        )
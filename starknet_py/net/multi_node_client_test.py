@@ -0,0 +1,159 @@
+import asyncio
+from typing import List
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.http_client import SessionPool
+from starknet_py.net.multi_node_client import EndpointPool, MultiNodeClient
+
+
+class StubNode:
+    """
+    Local json-rpc server answering every request with the configured block number.
+    """
+
+    def __init__(self, block_number: int, delay: float = 0, status: int = 200):
+        self.block_number = block_number
+        self.delay = delay
+        self.status = status
+        self.methods: List[str] = []
+        self.url = ""
+        self._runner = web.AppRunner(web.Application())
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.methods.append(payload["method"])
+        await asyncio.sleep(self.delay)
+
+        if self.status != 200:
+            return web.Response(status=self.status, text="Node unavailable")
+        if payload["method"] == "starknet_getNonce":
+            return web.json_response(
+                {"jsonrpc": "2.0", "id": payload["id"], "result": "0x0"}
+            )
+        if payload["method"] == "starknet_getClassHashAt":
+            return web.json_response(
+                {
+                    "jsonrpc": "2.0",
+                    "id": payload["id"],
+                    "error": {"code": 20, "message": "Contract not found"},
+                }
+            )
+        return web.json_response(
+            {"jsonrpc": "2.0", "id": payload["id"], "result": self.block_number}
+        )
+
+    async def start(self):
+        self._runner.app.router.add_post("/", self.handle)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+@pytest_asyncio.fixture(name="start_nodes")
+async def fixture_start_nodes():
+    nodes = []
+
+    async def start_nodes(*stub_nodes: StubNode) -> List[StubNode]:
+        for node in stub_nodes:
+            await node.start()
+            nodes.append(node)
+        return list(stub_nodes)
+
+    yield start_nodes
+
+    for node in nodes:
+        await node.stop()
+
+
+@pytest_asyncio.fixture(name="session_pool")
+async def fixture_session_pool():
+    pool = SessionPool()
+    yield pool
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_fastest_node(start_nodes, session_pool):
+    slow, fast = await start_nodes(StubNode(1, delay=0.2), StubNode(2))
+    client = MultiNodeClient([slow.url, fast.url], session_pool=session_pool)
+
+    # First requests measure latencies of both nodes
+    await client.get_block_number()
+    await client.get_block_number()
+
+    assert [await client.get_block_number() for _ in range(3)] == [2, 2, 2]
+    assert len(slow.methods) == 1
+
+
+@pytest.mark.asyncio
+async def test_fails_over_on_5xx(start_nodes, session_pool):
+    broken, healthy = await start_nodes(StubNode(1, status=503), StubNode(2))
+    pool = EndpointPool([broken.url, healthy.url], max_error_rate=0.25)
+    client = MultiNodeClient(pool, session_pool=session_pool)
+
+    assert await client.get_block_number() == 2
+    assert await client.get_block_number() == 2
+
+    assert len(broken.methods) == 1
+    assert not pool.endpoints[0].healthy
+
+
+@pytest.mark.asyncio
+async def test_fails_over_on_timeout(start_nodes, session_pool):
+    hanging, healthy = await start_nodes(StubNode(1, delay=5), StubNode(2))
+    client = MultiNodeClient(
+        [hanging.url, healthy.url], session_pool=session_pool, timeout=0.2
+    )
+
+    assert await client.get_block_number() == 2
+
+
+@pytest.mark.asyncio
+async def test_raises_when_all_nodes_fail(start_nodes, session_pool):
+    first, second = await start_nodes(StubNode(1, status=500), StubNode(2, status=502))
+    client = MultiNodeClient([first.url, second.url], session_pool=session_pool)
+
+    with pytest.raises(ClientError, match="Node unavailable"):
+        await client.get_block_number()
+
+    assert len(first.methods) == len(second.methods) == 1
+
+
+@pytest.mark.asyncio
+async def test_rpc_errors_are_not_retried(start_nodes, session_pool):
+    first, second = await start_nodes(StubNode(1), StubNode(2))
+    client = MultiNodeClient([first.url, second.url], session_pool=session_pool)
+
+    with pytest.raises(ClientError, match="Contract not found"):
+        await client.get_class_hash_at(contract_address=0x1)
+
+    assert len(first.methods) + len(second.methods) == 1
+
+
+@pytest.mark.asyncio
+async def test_nonce_reads_stick_to_one_node(start_nodes, session_pool):
+    first, second = await start_nodes(StubNode(1), StubNode(2, delay=0.1))
+    pool = EndpointPool([first.url, second.url])
+    client = MultiNodeClient(pool, session_pool=session_pool)
+
+    await client.get_contract_nonce(contract_address=0x1)
+    sticky = client._client.sticky_endpoint
+    # Make the sticky node the slower one for reads
+    sticky.latency = 10
+
+    await client.get_contract_nonce(contract_address=0x1)
+    await client.get_block_number()
+
+    sticky_node = first if sticky.url == first.url else second
+    other_node = second if sticky_node is first else first
+    assert sticky_node.methods.count("starknet_getNonce") == 2
+    assert other_node.methods == ["starknet_blockNumber"]
@@ -0,0 +1,161 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class TokenBucketStats:
+    rate: float
+    capacity: float
+    available: float
+    waiting: int
+    acquired: int
+    total_wait: float
+
+    @property
+    def utilization(self) -> float:
+        """
+        Part of the bucket capacity currently used up, from 0 to 1.
+        """
+        return 1 - self.available / self.capacity
+
+
+class TokenBucket:
+    """
+    Allows ``rate`` acquisitions per second on average, with bursts of up to ``capacity``.
+    Waiting callers are served in order.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        :param rate: Number of tokens added to the bucket every second.
+        :param capacity: Maximum number of tokens in the bucket. Defaults to ``rate`` (one second of requests).
+        """
+        if rate <= 0:
+            raise ValueError("Argument rate has to be greater than 0.")
+
+        self.rate = rate
+        self.capacity = max(capacity or rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+        self._acquired = 0
+        self._total_wait = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        Takes a token from the bucket, waiting for it if the bucket is empty.
+
+        :return: Time in seconds spent waiting.
+        """
+        start = time.monotonic()
+        self._waiting += 1
+        try:
+            async with self._lock:
+                self._refill()
+                while self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            self._waiting -= 1
+
+        waited = time.monotonic() - start
+        self._acquired += 1
+        self._total_wait += waited
+        return waited
+
+    @property
+    def stats(self) -> TokenBucketStats:
+        self._refill()
+        return TokenBucketStats(
+            rate=self.rate,
+            capacity=self.capacity,
+            available=self._tokens,
+            waiting=self._waiting,
+            acquired=self._acquired,
+            total_wait=self._total_wait,
+        )
+
+
+class RateLimiter:
+    """
+    Token buckets limiting requests per node url and per proxy, shared between clients.
+
+    Every http request takes a token from the bucket of its node url and from the bucket of its
+    proxy (requests without a proxy share one bucket), waiting until both allow it.
+    """
+
+    def __init__(
+        self,
+        endpoint_rate: Optional[float] = None,
+        proxy_rate: Optional[float] = None,
+        endpoint_rates: Optional[Dict[str, float]] = None,
+        proxy_rates: Optional[Dict[Optional[str], float]] = None,
+        burst: Optional[float] = None,
+    ):
+        """
+        :param endpoint_rate: Requests per second allowed for every node url. Unlimited if not provided.
+        :param proxy_rate: Requests per second allowed for every proxy. Unlimited if not provided.
+        :param endpoint_rates: Requests per second of particular node urls, overriding ``endpoint_rate``.
+        :param proxy_rates: Requests per second of particular proxies, overriding ``proxy_rate``.
+        :param burst: Capacity of every bucket. Defaults to the rate of the bucket.
+        """
+        self.endpoint_rate = endpoint_rate
+        self.proxy_rate = proxy_rate
+        self.endpoint_rates = endpoint_rates or {}
+        self.proxy_rates = proxy_rates or {}
+        self.burst = burst
+        self.endpoint_buckets: Dict[str, Optional[TokenBucket]] = {}
+        self.proxy_buckets: Dict[Optional[str], Optional[TokenBucket]] = {}
+
+    def _get_bucket(self, buckets: dict, rates: dict, default_rate, key):
+        if key not in buckets:
+            rate = rates.get(key, default_rate)
+            buckets[key] = TokenBucket(rate, self.burst) if rate else None
+        return buckets[key]
+
+    async def acquire(self, url: str, proxy: Optional[str] = None) -> float:
+        """
+        Waits until a request to ``url`` through ``proxy`` is allowed.
+
+        :return: Time in seconds spent waiting.
+        """
+        waited = 0.0
+        for bucket in (
+            self._get_bucket(
+                self.endpoint_buckets, self.endpoint_rates, self.endpoint_rate, url
+            ),
+            self._get_bucket(
+                self.proxy_buckets, self.proxy_rates, self.proxy_rate, proxy
+            ),
+        ):
+            if bucket is not None:
+                waited += await bucket.acquire()
+        return waited
+
+    def stats(self) -> Dict[str, Dict[Optional[str], TokenBucketStats]]:
+        """
+        :return: Stats of limited node urls and proxies.
+        """
+        return {
+            "endpoints": {
+                url: bucket.stats
+                for url, bucket in self.endpoint_buckets.items()
+                if bucket is not None
+            },
+            "proxies": {
+                proxy: bucket.stats
+                for proxy, bucket in self.proxy_buckets.items()
+                if bucket is not None
+            },
+        }
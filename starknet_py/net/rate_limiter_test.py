@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+import pytest
+
+from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.rate_limiter import RateLimiter, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=20, capacity=2)
+
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+    elapsed = time.monotonic() - start
+
+    # Two requests fit into the burst, the remaining four wait 1/20 s each
+    assert 0.18 <= elapsed < 0.5
+    stats = bucket.stats
+    assert stats.acquired == 6
+    assert stats.waiting == 0
+    assert stats.total_wait > 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_utilization():
+    bucket = TokenBucket(rate=1, capacity=4)
+
+    assert bucket.stats.utilization == pytest.approx(0, abs=0.01)
+    await bucket.acquire()
+    await bucket.acquire()
+    assert bucket.stats.utilization == pytest.approx(0.5, abs=0.01)
+
+
+def test_token_bucket_invalid_rate():
+    with pytest.raises(ValueError, match="rate has to be greater than 0"):
+        TokenBucket(rate=0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_buckets():
+    limiter = RateLimiter(
+        endpoint_rate=10,
+        endpoint_rates={"http://fast": 100},
+        proxy_rates={"http://proxy": 5},
+    )
+
+    await limiter.acquire("http://node", None)
+    await limiter.acquire("http://fast", "http://proxy")
+    await limiter.acquire("http://fast", "http://other-proxy")
+
+    stats = limiter.stats()
+    assert {url: bucket.rate for url, bucket in stats["endpoints"].items()} == {
+        "http://node": 10,
+        "http://fast": 100,
+    }
+    assert stats["endpoints"]["http://fast"].acquired == 2
+    # Proxies without a configured rate are not limited
+    assert list(stats["proxies"]) == ["http://proxy"]
+
+
+@pytest.mark.asyncio
+async def test_http_client_acquires_before_request(mocker):
+    limiter = RateLimiter(endpoint_rate=10, proxy_rate=10)
+    acquire = mocker.spy(limiter, "acquire")
+    session = mocker.MagicMock()
+    response = session.request.return_value.__aenter__.return_value
+    response.status = 200
+    response.json = mocker.AsyncMock(return_value={"result": 1})
+    client = RpcHttpClient(
+        url="http://127.0.0.1:5050",
+        session=session,
+        proxy="http://proxy",
+        rate_limiter=limiter,
+    )
+
+    assert await client.call(method_name="blockNumber", params={}) == 1
+
+    acquire.assert_called_once_with("http://127.0.0.1:5050", "http://proxy")
@@ -0,0 +1,175 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import (
+    Hash,
+    TransactionExecutionStatus,
+    TransactionReceipt,
+    TransactionStatus,
+)
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.transaction_errors import (
+    TransactionNotReceivedError,
+    TransactionRejectedError,
+    TransactionRevertedError,
+)
+
+
+@dataclass
+class _WatchedTransaction:
+    future: asyncio.Future
+    retries: int
+    waiters: int = 0
+    received: bool = False
+
+
+class ReceiptWatcher:
+    """
+    Waits for receipts of many transactions at once.
+
+    All watched transactions are checked together every ``check_interval`` seconds, in a single
+    JSON-RPC batch request (split into chunks of ``max_batch_size``), instead of polling every
+    transaction separately. Each transaction goes through the same steps as in
+    :py:meth:`starknet_py.net.client.Client.wait_for_tx`: its status is checked until it is
+    received, then its receipt is fetched.
+    """
+
+    def __init__(
+        self,
+        client: FullNodeClient,
+        check_interval: float = 2,
+        retries: int = 500,
+        max_batch_size: Optional[int] = None,
+    ):
+        """
+        :param client: Client used to check transactions.
+        :param check_interval: Defines interval between checks.
+        :param retries: Defines how many times a transaction is checked until an error is thrown.
+        :param max_batch_size: Maximum number of checks sent in a single http request.
+        """
+        if check_interval <= 0:
+            raise ValueError("Argument check_interval has to be greater than 0.")
+        if retries <= 0:
+            raise ValueError("Argument retries has to be greater than 0.")
+
+        self.client = client
+        self.check_interval = check_interval
+        self.retries = retries
+        self.max_batch_size = max_batch_size
+
+        self._watched: Dict[int, _WatchedTransaction] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._watched)
+
+    async def wait_for_tx(self, tx_hash: Hash) -> TransactionReceipt:
+        """
+        Awaits for transaction to get accepted or at least pending.
+
+        :param tx_hash: Transaction's hash.
+        :return: Transaction receipt.
+        """
+        tx_hash = tx_hash if isinstance(tx_hash, int) else int(tx_hash, 16)
+
+        watched = self._watched.get(tx_hash)
+        if watched is None:
+            watched = _WatchedTransaction(
+                future=asyncio.get_running_loop().create_future(),
+                retries=self.retries,
+            )
+            self._watched[tx_hash] = watched
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        watched.waiters += 1
+        try:
+            return await asyncio.shield(watched.future)
+        finally:
+            watched.waiters -= 1
+            if not watched.waiters and self._watched.get(tx_hash) is watched:
+                del self._watched[tx_hash]
+
+    async def _run(self):
+        while self._watched:
+            try:
+                await self._check()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                for tx_hash in list(self._watched):
+                    self._resolve(tx_hash, exception=exc)
+            await asyncio.sleep(self.check_interval)
+
+    async def _check(self):
+        watched = list(self._watched.items())
+
+        async with self.client.batch(max_batch_size=self.max_batch_size) as batch:
+            checks = [
+                (
+                    batch.get_transaction_receipt(tx_hash=tx_hash)
+                    if transaction.received
+                    else batch.get_transaction_status(tx_hash=tx_hash)
+                )
+                for tx_hash, transaction in watched
+            ]
+
+        for (tx_hash, transaction), check in zip(watched, checks):
+            if self._watched.get(tx_hash) is not transaction:
+                continue
+
+            try:
+                result = check.result()
+            except ClientError as exc:
+                if "Transaction hash not found" not in exc.message:
+                    self._resolve(tx_hash, exception=exc)
+                    continue
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self._resolve(tx_hash, exception=exc)
+                continue
+            else:
+                if not transaction.received:
+                    if result.finality_status == TransactionStatus.REJECTED:
+                        self._resolve(tx_hash, exception=TransactionRejectedError())
+                        continue
+                    transaction.received = True
+                elif result.execution_status == TransactionExecutionStatus.REVERTED:
+                    self._resolve(
+                        tx_hash,
+                        exception=TransactionRevertedError(
+                            message=result.revert_reason
+                        ),
+                    )
+                    continue
+                else:
+                    self._resolve(tx_hash, receipt=result)
+                    continue
+
+            transaction.retries -= 1
+            if transaction.retries <= 0:
+                self._resolve(tx_hash, exception=TransactionNotReceivedError())
+
+    def _resolve(
+        self,
+        tx_hash: int,
+        receipt: Optional[TransactionReceipt] = None,
+        exception: Optional[BaseException] = None,
+    ):
+        transaction = self._watched.pop(tx_hash)
+        if exception is not None:
+            transaction.future.set_exception(exception)
+        else:
+            transaction.future.set_result(receipt)
+
+    async def close(self):
+        """
+        Stops checking transactions. Waiting for any of them raises TransactionNotReceivedError.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        for tx_hash in list(self._watched):
+            self._resolve(tx_hash, exception=TransactionNotReceivedError())
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import TransactionExecutionStatus
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.receipt_watcher import ReceiptWatcher
+from starknet_py.transaction_errors import (
+    TransactionNotReceivedError,
+    TransactionRejectedError,
+    TransactionRevertedError,
+)
+
+
+def _receipt(tx_hash: str, execution_status: str = "SUCCEEDED") -> dict:
+    return {
+        "transaction_hash": tx_hash,
+        "execution_status": execution_status,
+        "finality_status": "ACCEPTED_ON_L2",
+        "actual_fee": {"amount": "0x1", "unit": "WEI"},
+        "type": "INVOKE",
+        "execution_resources": {"steps": "0x1"},
+        "revert_reason": "reverted" if execution_status == "REVERTED" else None,
+    }
+
+
+def _node(transactions: dict):
+    """
+    Responds to batched status and receipt requests. ``transactions`` maps hashes to
+    (finality_status, execution_status); transactions missing from it are not found.
+    """
+
+    async def call_many(calls, return_exceptions=False, max_batch_size=None):
+        # pylint: disable=unused-argument
+        results = []
+        for method_name, params in calls:
+            tx_hash = params["transaction_hash"]
+            if tx_hash not in transactions:
+                results.append(ClientError("Transaction hash not found", code="29"))
+                continue
+
+            finality_status, execution_status = transactions[tx_hash]
+            if method_name == "getTransactionStatus":
+                results.append({"finality_status": finality_status})
+            else:
+                results.append(_receipt(tx_hash, execution_status))
+        return results
+
+    return call_many
+
+
+@pytest.mark.asyncio
+async def test_receipt_watcher_batches_checks(mocker):
+    client = FullNodeClient(node_url="http://127.0.0.1:5050")
+    call_many = mocker.patch.object(
+        client._client,
+        "call_many",
+        side_effect=_node(
+            {
+                "0x1": ("ACCEPTED_ON_L2", "SUCCEEDED"),
+                "0x2": ("ACCEPTED_ON_L2", "REVERTED"),
+                "0x3": ("REJECTED", None),
+            }
+        ),
+    )
+    watcher = ReceiptWatcher(client, check_interval=0.01)
+
+    results = await asyncio.gather(
+        watcher.wait_for_tx(0x1),
+        watcher.wait_for_tx("0x2"),
+        watcher.wait_for_tx(0x3),
+        return_exceptions=True,
+    )
+
+    assert results[0].transaction_hash == 0x1
+    assert results[0].execution_status == TransactionExecutionStatus.SUCCEEDED
+    assert isinstance(results[1], TransactionRevertedError)
+    assert isinstance(results[2], TransactionRejectedError)
+    # Statuses of all transactions in one batch, then the remaining receipts in another
+    assert [len(call.args[0]) for call in call_many.call_args_list] == [3, 2]
+    assert len(watcher) == 0
+
+
+@pytest.mark.asyncio
+async def test_receipt_watcher_shares_checks_of_same_transaction(mocker):
+    client = FullNodeClient(node_url="http://127.0.0.1:5050")
+    call_many = mocker.patch.object(
+        client._client,
+        "call_many",
+        side_effect=_node({"0x1": ("ACCEPTED_ON_L2", "SUCCEEDED")}),
+    )
+    watcher = ReceiptWatcher(client, check_interval=0.01)
+
+    first, second = await asyncio.gather(
+        watcher.wait_for_tx(0x1), watcher.wait_for_tx(0x1)
+    )
+
+    assert first is second
+    assert [len(call.args[0]) for call in call_many.call_args_list] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_receipt_watcher_not_received(mocker):
+    client = FullNodeClient(node_url="http://127.0.0.1:5050")
+    mocker.patch.object(client._client, "call_many", side_effect=_node({}))
+    watcher = ReceiptWatcher(client, check_interval=0.01, retries=3)
+
+    with pytest.raises(TransactionNotReceivedError):
+        await watcher.wait_for_tx(0x1)
@@ -0,0 +1,194 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+import aiohttp
+
+from starknet_py.net.client_errors import ClientError
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """
+    Request was not sent, because its circuit breaker is open after repeated failures.
+    """
+
+    def __init__(self, key: Hashable):
+        self.key = key
+        super().__init__(f"Circuit breaker for {key} is open.")
+
+
+def is_http_error(exc: BaseException) -> bool:
+    """
+    Tells errors with http statuses (``ClientError`` with a string code) apart from json-rpc errors.
+    """
+    return (
+        isinstance(exc, ClientError)
+        and isinstance(exc.code, str)
+        and exc.code.isdigit()
+    )
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Tells if a request failed for a reason which may go away by itself: a connection error,
+    a timeout, a 5xx response or a 429 (too many requests) response.
+    """
+    # pylint: disable=import-outside-toplevel
+    from starknet_py.net.http_client import ServerError
+
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500 or exc.status == 429
+    if isinstance(
+        exc, (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError, ServerError)
+    ):
+        return True
+    if is_http_error(exc):
+        status = int(exc.code)  # pyright: ignore
+        return status >= 500 or status == 429
+    return False
+
+
+class CircuitBreaker:
+    """
+    Stops requests after ``failure_threshold`` consecutive failures. After ``reset_timeout``
+    seconds a single trial request is let through: its success closes the breaker, its
+    failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if (
+            self._trial_running
+            or time.monotonic() - self.opened_at < self.reset_timeout
+        ):
+            return False
+        self._trial_running = True
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_running or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._trial_running = False
+
+    def release_trial(self):
+        """
+        Lets another trial through after an attempt which neither succeeded nor failed,
+        e.g. was cancelled.
+        """
+        self._trial_running = False
+
+
+class RetryPolicy:
+    """
+    Retries transient failures with capped exponential backoff and full jitter:
+    the n-th retry waits a random time between 0 and ``min(max_delay, base_delay * 2 ** n)``.
+
+    If ``breaker_threshold`` is set, every key (e.g. a node url and proxy pair) gets its own
+    circuit breaker, so requests along a failing path fail fast with ``CircuitOpenError``.
+    The policy can be shared between clients.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30,
+        is_transient: Callable[[BaseException], bool] = is_transient_error,
+        breaker_threshold: Optional[int] = None,
+        breaker_reset_timeout: float = 30,
+    ):
+        """
+        :param max_attempts: Maximum number of attempts, including the first one.
+        :param base_delay: Maximum delay in seconds before the first retry.
+        :param max_delay: Cap of the delay in seconds.
+        :param is_transient: Tells if an error is transient and worth retrying.
+        :param breaker_threshold: Consecutive transient failures opening a circuit breaker.
+            Circuit breakers are disabled if not provided.
+        :param breaker_reset_timeout: Time in seconds after which an open breaker lets a trial request through.
+        """
+        if max_attempts <= 0:
+            raise ValueError("Argument max_attempts has to be greater than 0.")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.is_transient = is_transient
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+        self.breakers: Dict[Hashable, CircuitBreaker] = {}
+
+    def backoff(self, attempt: int) -> float:
+        """
+        :param attempt: Number of the failed attempt, starting from 0.
+        :return: Time in seconds to wait before the next attempt.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def get_breaker(self, key: Hashable) -> Optional[CircuitBreaker]:
+        if self.breaker_threshold is None:
+            return None
+        if key not in self.breakers:
+            self.breakers[key] = CircuitBreaker(
+                self.breaker_threshold, self.breaker_reset_timeout
+            )
+        return self.breakers[key]
+
+    async def run(self, func: Callable[[], Awaitable[T]], key: Hashable = None) -> T:
+        """
+        Calls ``func`` until it succeeds, fails with a permanent error or runs out of attempts.
+
+        :param func: Coroutine function making a single attempt.
+        :param key: Key of the circuit breaker guarding the attempts.
+        :return: Result of ``func``.
+        """
+        breaker = self.get_breaker(key)
+        attempt = 0
+        while True:
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(key)
+
+            try:
+                result = await func()
+            except Exception as exc:
+                if not self.is_transient(exc):
+                    if breaker is not None:
+                        # The path works, the request itself is wrong
+                        breaker.record_success()
+                    raise
+                if breaker is not None:
+                    breaker.record_failure()
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                await asyncio.sleep(self.backoff(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled (e.g. by a timeout) attempts say nothing about the path
+                if breaker is not None:
+                    breaker.release_trial()
+                raise
+
+            if breaker is not None:
+                breaker.record_success()
+            return result
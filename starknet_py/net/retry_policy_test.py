@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientResponseError
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.retry_policy import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_transient_error,
+)
+
+
+def _failing(*errors, result=None):
+    errors = list(errors)
+    calls = []
+
+    async def func():
+        calls.append(None)
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    return func, calls
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    (
+        (ClientError(code="502", message="Bad gateway"), True),
+        (ClientError(code="429", message="Too many requests"), True),
+        (ClientError(code="404", message="Not found"), False),
+        (ClientError(code=20, message="Contract not found"), False),
+        (asyncio.TimeoutError(), True),
+        (ClientResponseError(None, (), status=503), True),  # pyright: ignore
+        (ClientResponseError(None, (), status=400), False),  # pyright: ignore
+        (ValueError(), False),
+    ),
+)
+def test_is_transient_error(error, transient):
+    assert is_transient_error(error) == transient
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_retries_transient_errors():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+    func, calls = _failing(asyncio.TimeoutError(), asyncio.TimeoutError(), result=1)
+
+    assert await policy.run(func) == 1
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_gives_up():
+    policy = RetryPolicy(max_attempts=2, base_delay=0.01)
+    func, calls = _failing(*[asyncio.TimeoutError()] * 3)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await policy.run(func)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_does_not_retry_permanent_errors():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+    func, calls = _failing(ClientError(code="400", message="Bad request"))
+
+    with pytest.raises(ClientError):
+        await policy.run(func)
+    assert len(calls) == 1
+
+
+def test_retry_policy_backoff_is_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+
+    assert all(0 <= policy.backoff(0) <= 1 for _ in range(100))
+    assert all(policy.backoff(10) <= 5 for _ in range(100))
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_opens_circuit_breaker():
+    policy = RetryPolicy(
+        max_attempts=1, breaker_threshold=2, breaker_reset_timeout=0.05
+    )
+    func, calls = _failing(*[asyncio.TimeoutError()] * 2, result=1)
+
+    for _ in range(2):
+        with pytest.raises(asyncio.TimeoutError):
+            await policy.run(func, key="proxy")
+    with pytest.raises(CircuitOpenError):
+        await policy.run(func, key="proxy")
+    assert len(calls) == 2
+
+    # Other keys are not affected
+    assert policy.get_breaker("other-proxy").allow()
+
+    await asyncio.sleep(0.05)
+    assert await policy.run(func, key="proxy") == 1
+    assert not policy.get_breaker("proxy").is_open
+
+
+def test_circuit_breaker_lets_single_trial_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_does_not_block_circuit_breaker():
+    policy = RetryPolicy(
+        max_attempts=1, breaker_threshold=1, breaker_reset_timeout=0.05
+    )
+    func, _ = _failing(asyncio.TimeoutError(), result=1)
+    with pytest.raises(asyncio.TimeoutError):
+        await policy.run(func, key="proxy")
+    await asyncio.sleep(0.05)
+
+    async def hanging():
+        await asyncio.sleep(10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(policy.run(hanging, key="proxy"), 0.01)
+
+    breaker = policy.get_breaker("proxy")
+    assert breaker.is_open
+    await asyncio.sleep(0.05)
+    assert await policy.run(func, key="proxy") == 1
+    assert not breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_http_client_retries_with_policy(mocker):
+    session = mocker.MagicMock()
+    response = session.request.return_value.__aenter__.return_value
+    response.status = 200
+    response.json = mocker.AsyncMock(return_value={"result": 1})
+    client = RpcHttpClient(
+        url="http://127.0.0.1:5050",
+        session=session,
+        retry_policy=RetryPolicy(base_delay=0.01),
+    )
+    mocker.patch.object(
+        client,
+        "handle_request_error",
+        side_effect=[ClientError(code="503", message="Unavailable"), None],
+    )
+
+    assert await client.call(method_name="blockNumber", params={}) == 1
+    assert session.request.call_count == 2
@@ -371,10 +371,10 @@ class DeployAccountTransactionV3Schema(TransactionV3Schema):
 
 class DeclareTransactionSchema(OneOfSchema):
     type_schemas = {
-        0: DeclareTransactionV0Schema,
-        1: DeclareTransactionV1Schema,
-        2: DeclareTransactionV2Schema,
-        3: DeclareTransactionV3Schema,
+        0: DeclareTransactionV0Schema(),
+        1: DeclareTransactionV1Schema(),
+        2: DeclareTransactionV2Schema(),
+        3: DeclareTransactionV3Schema(),
     }
 
     def get_data_type(self, data):
@@ -383,9 +383,9 @@ class DeclareTransactionSchema(OneOfSchema):
 
 class InvokeTransactionSchema(OneOfSchema):
     type_schemas = {
-        0: InvokeTransactionV0Schema,
-        1: InvokeTransactionV1Schema,
-        3: InvokeTransactionV3Schema,
+        0: InvokeTransactionV0Schema(),
+        1: InvokeTransactionV1Schema(),
+        3: InvokeTransactionV3Schema(),
     }
 
     def get_data_type(self, data):
@@ -394,8 +394,8 @@ class InvokeTransactionSchema(OneOfSchema):
 
 class DeployAccountTransactionSchema(OneOfSchema):
     type_schemas = {
-        1: DeployAccountTransactionV1Schema,
-        3: DeployAccountTransactionV3Schema,
+        1: DeployAccountTransactionV1Schema(),
+        3: DeployAccountTransactionV3Schema(),
     }
 
     def get_data_type(self, data):
@@ -416,11 +416,11 @@ class L1HandlerTransactionSchema(TransactionSchema):
 class TypesOfTransactionsSchema(OneOfSchema):
     type_field = "type"
     type_schemas = {
-        "INVOKE": InvokeTransactionSchema,
-        "DECLARE": DeclareTransactionSchema,
-        "DEPLOY": DeployTransactionSchema,
-        "DEPLOY_ACCOUNT": DeployAccountTransactionSchema,
-        "L1_HANDLER": L1HandlerTransactionSchema,
+        "INVOKE": InvokeTransactionSchema(),
+        "DECLARE": DeclareTransactionSchema(),
+        "DEPLOY": DeployTransactionSchema(),
+        "DEPLOY_ACCOUNT": DeployAccountTransactionSchema(),
+        "L1_HANDLER": L1HandlerTransactionSchema(),
     }
 
 
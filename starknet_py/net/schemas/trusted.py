@@ -0,0 +1,115 @@
+"""
+Decoders building ``client_models`` dataclasses straight from json-rpc responses.
+
+Unlike the marshmallow schemas, they don't validate responses: a malformed response may
+produce a malformed dataclass instead of raising ``ValidationError``. Use them only with
+nodes you trust, for responses decoded so often that schema validation shows in profiles.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from starknet_py.net.client_models import (
+    EstimatedFee,
+    Event,
+    ExecutionResources,
+    FeePayment,
+    L2toL1Message,
+    PriceUnit,
+    TransactionExecutionStatus,
+    TransactionFinalityStatus,
+    TransactionReceipt,
+    TransactionStatus,
+    TransactionStatusResponse,
+    TransactionType,
+)
+
+_EXECUTION_RESOURCES_FIELDS = (
+    "range_check_builtin_applications",
+    "pedersen_builtin_applications",
+    "poseidon_builtin_applications",
+    "ec_op_builtin_applications",
+    "ecdsa_builtin_applications",
+    "bitwise_builtin_applications",
+    "keccak_builtin_applications",
+    "memory_holes",
+)
+
+
+def _felt(value: Union[str, int]) -> int:
+    return value if isinstance(value, int) else int(value, 16)
+
+
+def _optional_felt(value: Optional[Union[str, int]]) -> Optional[int]:
+    return None if value is None else _felt(value)
+
+
+def _felts(values: List[Union[str, int]]) -> List[int]:
+    return [_felt(value) for value in values]
+
+
+def load_execution_resources(data: Dict[str, Any]) -> ExecutionResources:
+    return ExecutionResources(
+        steps=_felt(data["steps"]),
+        **{
+            name: _optional_felt(data.get(name)) for name in _EXECUTION_RESOURCES_FIELDS
+        },
+    )
+
+
+def load_transaction_receipt(data: Dict[str, Any]) -> TransactionReceipt:
+    tx_type = data["type"]
+    actual_fee = data["actual_fee"]
+    return TransactionReceipt(
+        transaction_hash=_felt(data["transaction_hash"]),
+        execution_status=TransactionExecutionStatus(data["execution_status"]),
+        finality_status=TransactionFinalityStatus(data["finality_status"]),
+        execution_resources=load_execution_resources(data["execution_resources"]),
+        actual_fee=FeePayment(
+            amount=_felt(actual_fee["amount"]), unit=PriceUnit(actual_fee["unit"])
+        ),
+        type=TransactionType(
+            "INVOKE" if tx_type == "INVOKE_FUNCTION" else tx_type  # legacy name
+        ),
+        events=[
+            Event(
+                from_address=_felt(event["from_address"]),
+                keys=_felts(event["keys"]),
+                data=_felts(event["data"]),
+            )
+            for event in data.get("events", [])
+        ],
+        messages_sent=[
+            L2toL1Message(
+                payload=_felts(message["payload"]),
+                l2_address=_felt(message["from_address"]),
+                l1_address=_felt(message["to_address"]),
+            )
+            for message in data.get("messages_sent", [])
+        ],
+        contract_address=_optional_felt(data.get("contract_address")),
+        block_number=data.get("block_number"),
+        block_hash=_optional_felt(data.get("block_hash")),
+        message_hash=_optional_felt(data.get("message_hash")),
+        revert_reason=data.get("revert_reason"),
+    )
+
+
+def load_transaction_status(data: Dict[str, Any]) -> TransactionStatusResponse:
+    execution_status = data.get("execution_status")
+    return TransactionStatusResponse(
+        finality_status=TransactionStatus(data["finality_status"]),
+        execution_status=(
+            None
+            if execution_status is None
+            else TransactionExecutionStatus(execution_status)
+        ),
+    )
+
+
+def load_estimated_fee(data: Dict[str, Any]) -> EstimatedFee:
+    return EstimatedFee(
+        overall_fee=_felt(data["overall_fee"]),
+        gas_price=_felt(data["gas_price"]),
+        gas_consumed=_felt(data["gas_consumed"]),
+        unit=PriceUnit(data["unit"]),
+    )
@@ -0,0 +1,64 @@
+"""
+Compares decoders of recorded json-rpc responses::
+
+    python -m starknet_py.net.schemas.trusted_benchmark
+"""
+
+import json
+import timeit
+from typing import Any, Callable, Dict, List
+
+from marshmallow import EXCLUDE
+
+from starknet_py.net.schemas.rpc import (
+    EstimatedFeeSchema,
+    TransactionReceiptSchema,
+    TransactionStatusResponseSchema,
+)
+from starknet_py.net.schemas.trusted import (
+    load_estimated_fee,
+    load_transaction_receipt,
+    load_transaction_status,
+)
+from starknet_py.tests.e2e.fixtures.constants import RPC_RESPONSES_DIR
+
+
+def _measure(decode: Callable[[Any], Any], responses: List[Dict], number: int) -> float:
+    """
+    :return: Mean time in microseconds of decoding a single response.
+    """
+
+    def decode_all():
+        for response in responses:
+            decode(response)
+
+    best = min(timeit.repeat(decode_all, number=number, repeat=5))
+    return best / number / len(responses) * 1e6
+
+
+def main(number: int = 200):
+    responses = json.loads((RPC_RESPONSES_DIR / "responses.json").read_text())
+
+    for kind, schema_class, trusted_decoder in (
+        ("receipts", TransactionReceiptSchema, load_transaction_receipt),
+        ("statuses", TransactionStatusResponseSchema, load_transaction_status),
+        ("fee_estimates", EstimatedFeeSchema, load_estimated_fee),
+    ):
+        schema = schema_class()
+        decoders = {
+            "new schema per response": lambda response, schema_class=schema_class: (
+                schema_class().load(response, unknown=EXCLUDE)
+            ),
+            "shared schema": lambda response, schema=schema: schema.load(
+                response, unknown=EXCLUDE
+            ),
+            "trusted decoder": trusted_decoder,
+        }
+
+        print(f"{kind} ({len(responses[kind])} recorded responses):")
+        for name, decode in decoders.items():
+            print(f"  {name:<25} {_measure(decode, responses[kind], number):8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from marshmallow import EXCLUDE
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.schemas.rpc import (
+    EstimatedFeeSchema,
+    TransactionReceiptSchema,
+    TransactionStatusResponseSchema,
+)
+from starknet_py.net.schemas.trusted import (
+    load_estimated_fee,
+    load_transaction_receipt,
+    load_transaction_status,
+)
+from starknet_py.tests.e2e.fixtures.constants import RPC_RESPONSES_DIR
+
+RESPONSES = json.loads((RPC_RESPONSES_DIR / "responses.json").read_text())
+
+
+@pytest.mark.parametrize("response", RESPONSES["receipts"])
+def test_load_transaction_receipt(response):
+    assert load_transaction_receipt(response) == TransactionReceiptSchema().load(
+        response, unknown=EXCLUDE
+    )
+
+
+@pytest.mark.parametrize("response", RESPONSES["statuses"])
+def test_load_transaction_status(response):
+    assert load_transaction_status(response) == TransactionStatusResponseSchema().load(
+        response, unknown=EXCLUDE
+    )
+
+
+@pytest.mark.parametrize("response", RESPONSES["fee_estimates"])
+def test_load_estimated_fee(response):
+    assert load_estimated_fee(response) == EstimatedFeeSchema().load(
+        response, unknown=EXCLUDE
+    )
+
+
+@pytest_asyncio.fixture(name="node_url")
+async def fixture_node_url():
+    results = {
+        "starknet_getTransactionReceipt": RESPONSES["receipts"][0],
+        "starknet_getTransactionStatus": RESPONSES["statuses"][1],
+    }
+
+    async def handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        return web.json_response(
+            {
+                "jsonrpc": "2.0",
+                "id": payload["id"],
+                "result": results[payload["method"]],
+            }
+        )
+
+    runner = web.AppRunner(web.Application())
+    runner.app.router.add_post("/", handle)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    yield f"http://127.0.0.1:{runner.addresses[0][1]}/"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_trusted_node_client_decodes_the_same(node_url):
+    client = FullNodeClient(node_url=node_url)
+    trusted_client = FullNodeClient(node_url=node_url, trusted_node=True)
+
+    assert await trusted_client.get_transaction_receipt(
+        0x1
+    ) == await client.get_transaction_receipt(0x1)
+    assert await trusted_client.get_transaction_status(
+        0x1
+    ) == await client.get_transaction_status(0x1)
@@ -14,17 +14,37 @@ class OutOfBoundsError(Exception):
 
 
 class CalldataReader:
+    """
+    Reads calldata by moving a position over it, without copying it.
+    """
+
     _data: List[int]
     _position: int
 
-    def __init__(self, data: List[int]):
+    def __init__(self, data: List[int], position: int = 0):
         self._data = data
-        self._position = 0
+        self._position = position
+
+    @property
+    def position(self) -> int:
+        return self._position
 
     @property
     def remaining_len(self) -> int:
         return len(self._data) - self._position
 
+    def read_one(self) -> int:
+        """
+        Reads a single value, without allocating a list for it.
+        """
+        position = self._position
+        if position >= len(self._data):
+            raise OutOfBoundsError(
+                position=position, requested_size=1, remaining_size=self.remaining_len
+            )
+        self._position = position + 1
+        return self._data[position]
+
     def read(self, size: int) -> CairoData:
         if size < 1:
             raise ValueError("size must be greater than 0")
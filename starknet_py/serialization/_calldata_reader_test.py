@@ -51,3 +51,18 @@ def test_empty_calldata():
     assert err_info.value.position == 0
     assert err_info.value.remaining_len == 0
     assert err_info.value.requested_size == 10
+
+
+def test_reading_single_values():
+    reader = CalldataReader([1, 2, 3], position=1)
+
+    assert reader.read_one() == 2
+    assert reader.read_one() == 3
+    assert reader.position == 3
+
+    with pytest.raises(
+        OutOfBoundsError, match="Requested 1 elements, 0 available."
+    ) as err_info:
+        reader.read_one()
+
+    assert err_info.value.position == 3
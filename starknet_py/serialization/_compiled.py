@@ -0,0 +1,349 @@
+"""
+Serializers compiled into plain python functions.
+
+Serializers report errors with the path of the invalid value (e.g. ``claim_data.merkle_path[3]``),
+so they push a context entity for every struct member and array element. Compiled functions
+only check values, without tracking where they are. Whenever a compiled function fails, the
+value is passed to the original serializer, which raises the error with its full context
+(or handles a rare input form, like a shortstring felt, that the compiled function doesn't).
+
+Types without a compiled counterpart (enums, options, units, ...) are handled by their
+serializers, so compiled functions always return the same results as serializers.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, List, Tuple
+
+from starknet_py.cairo.felt import CairoData
+from starknet_py.constants import FIELD_PRIME
+from starknet_py.serialization._calldata_reader import CalldataReader
+from starknet_py.serialization._context import (
+    DeserializationContext,
+    SerializationContext,
+)
+from starknet_py.serialization.data_serializers.array_serializer import ArraySerializer
+from starknet_py.serialization.data_serializers.bool_serializer import BoolSerializer
+from starknet_py.serialization.data_serializers.cairo_data_serializer import (
+    CairoDataSerializer,
+)
+from starknet_py.serialization.data_serializers.felt_serializer import FeltSerializer
+from starknet_py.serialization.data_serializers.named_tuple_serializer import (
+    NamedTupleSerializer,
+)
+from starknet_py.serialization.data_serializers.output_serializer import (
+    OutputSerializer,
+)
+from starknet_py.serialization.data_serializers.payload_serializer import (
+    PayloadSerializer,
+)
+from starknet_py.serialization.data_serializers.struct_serializer import (
+    StructSerializer,
+)
+from starknet_py.serialization.data_serializers.tuple_serializer import (
+    TupleSerializer,
+)
+from starknet_py.serialization.data_serializers.uint256_serializer import (
+    Uint256Serializer,
+)
+from starknet_py.serialization.data_serializers.uint_serializer import UintSerializer
+from starknet_py.serialization.tuple_dataclass import TupleDataclass
+
+# Appends serialized value to the list
+Emitter = Callable[[Any, List[int]], None]
+
+# Reads a value from the position in calldata, returns it with the position after it
+Reader = Callable[[List[int], int], Tuple[Any, int]]
+
+_U128_BOUND = 2**128
+_U256_BOUND = 2**256
+
+
+class _InvalidValue(Exception):
+    """
+    Raised by compiled functions when the value has to be handled by the serializer.
+    """
+
+
+def compile_serializer(serializer: CairoDataSerializer) -> Callable[[Any], CairoData]:
+    """
+    :return: Function returning the same calldata as ``serializer.serialize``.
+    """
+    emit = _compile_emitter(serializer)
+
+    def serialize(value: Any) -> CairoData:
+        result = []
+        try:
+            emit(value, result)
+        except Exception:  # pylint: disable=broad-except
+            return serializer.serialize(value)
+        return result
+
+    return serialize
+
+
+def compile_deserializer(serializer: CairoDataSerializer) -> Callable[[List[int]], Any]:
+    """
+    :return: Function returning the same value as ``serializer.deserialize``.
+    """
+    read = _compile_reader(serializer)
+
+    def deserialize(data: List[int]) -> Any:
+        try:
+            value, position = read(data, 0)
+            if position != len(data):
+                raise _InvalidValue()
+        except Exception:  # pylint: disable=broad-except
+            return serializer.deserialize(data)
+        return value
+
+    return deserialize
+
+
+def _compile_emitter(serializer: CairoDataSerializer) -> Emitter:
+    # pylint: disable=too-many-return-statements
+    # Exact types, subclasses may change the serialization
+    serializer_type = type(serializer)
+
+    if serializer_type is FeltSerializer:
+        return _emit_felt
+    if serializer_type is BoolSerializer:
+        return _emit_bool
+    if serializer_type is Uint256Serializer:
+        return _emit_uint256
+    if serializer_type is UintSerializer:
+        assert isinstance(serializer, UintSerializer)
+        if serializer.bits >= 256:
+            return _emit_uint256
+        return _uint_emitter(2**serializer.bits)
+    if serializer_type is ArraySerializer:
+        assert isinstance(serializer, ArraySerializer)
+        return _array_emitter(serializer.inner_serializer)
+    if serializer_type in (StructSerializer, NamedTupleSerializer, PayloadSerializer):
+        return _dict_emitter(serializer.serializers)  # pyright: ignore
+    if serializer_type is TupleSerializer:
+        assert isinstance(serializer, TupleSerializer)
+        return _tuple_emitter(serializer.serializers)
+    return _generic_emitter(serializer)
+
+
+def _emit_felt(value: Any, result: List[int]):
+    if type(value) is not int or not 0 <= value < FIELD_PRIME:
+        raise _InvalidValue()
+    result.append(value)
+
+
+def _emit_bool(value: Any, result: List[int]):
+    if type(value) is not bool:
+        raise _InvalidValue()
+    result.append(int(value))
+
+
+def _emit_uint256(value: Any, result: List[int]):
+    if type(value) is not int or not 0 <= value < _U256_BOUND:
+        raise _InvalidValue()
+    result.append(value % _U128_BOUND)
+    result.append(value >> 128)
+
+
+def _uint_emitter(bound: int) -> Emitter:
+    def emit(value: Any, result: List[int]):
+        if type(value) is not int or not 0 <= value < bound:
+            raise _InvalidValue()
+        result.append(value)
+
+    return emit
+
+
+def _array_emitter(inner_serializer: CairoDataSerializer) -> Emitter:
+    if type(inner_serializer) is FeltSerializer:
+
+        def emit_felts(value: Any, result: List[int]):
+            if type(value) is not list and type(value) is not tuple:
+                raise _InvalidValue()
+            for item in value:
+                if type(item) is not int or not 0 <= item < FIELD_PRIME:
+                    raise _InvalidValue()
+            result.append(len(value))
+            result.extend(value)
+
+        return emit_felts
+
+    emit_item = _compile_emitter(inner_serializer)
+
+    def emit(value: Any, result: List[int]):
+        if type(value) is not list and type(value) is not tuple:
+            raise _InvalidValue()
+        result.append(len(value))
+        for item in value:
+            emit_item(item, result)
+
+    return emit
+
+
+def _dict_emitter(serializers: "OrderedDict[str, CairoDataSerializer]") -> Emitter:
+    members = tuple(
+        (name, _compile_emitter(serializer)) for name, serializer in serializers.items()
+    )
+    size = len(members)
+
+    def emit(value: Any, result: List[int]):
+        # Other mappings, named tuples and TupleDataclasses are left to the serializer
+        if type(value) is not dict or len(value) != size:
+            raise _InvalidValue()
+        for name, emit_member in members:
+            emit_member(value[name], result)
+
+    return emit
+
+
+def _tuple_emitter(serializers: List[CairoDataSerializer]) -> Emitter:
+    members = tuple(_compile_emitter(serializer) for serializer in serializers)
+    size = len(members)
+
+    def emit(value: Any, result: List[int]):
+        if (type(value) is not tuple and type(value) is not list) or len(value) != size:
+            raise _InvalidValue()
+        for item, emit_member in zip(value, members):
+            emit_member(item, result)
+
+    return emit
+
+
+def _generic_emitter(serializer: CairoDataSerializer) -> Emitter:
+    def emit(value: Any, result: List[int]):
+        serialized = serializer.serialize_with_context(SerializationContext(), value)
+        # Units are placeholders, serialize() removes them after serializing the whole value
+        result.extend(serializer.remove_units_from_serialized_data(list(serialized)))
+
+    return emit
+
+
+def _compile_reader(serializer: CairoDataSerializer) -> Reader:
+    # pylint: disable=too-many-return-statements
+    serializer_type = type(serializer)
+
+    if serializer_type is FeltSerializer:
+        return _read_felt
+    if serializer_type is BoolSerializer:
+        return _read_bool
+    if serializer_type is Uint256Serializer:
+        return _read_uint256
+    if serializer_type is UintSerializer:
+        assert isinstance(serializer, UintSerializer)
+        if serializer.bits >= 256:
+            return _read_uint256
+        return _uint_reader(2**serializer.bits)
+    if serializer_type is ArraySerializer:
+        assert isinstance(serializer, ArraySerializer)
+        return _array_reader(serializer.inner_serializer)
+    if serializer_type is StructSerializer:
+        return _dict_reader(serializer.serializers)  # pyright: ignore
+    if serializer_type in (NamedTupleSerializer, PayloadSerializer):
+        read_dict = _dict_reader(serializer.serializers)  # pyright: ignore
+
+        def read_tuple_dataclass(data: List[int], position: int) -> Tuple[Any, int]:
+            value, position = read_dict(data, position)
+            return TupleDataclass.from_dict(value), position
+
+        return read_tuple_dataclass
+    if serializer_type in (TupleSerializer, OutputSerializer):
+        return _tuple_reader(serializer.serializers)  # pyright: ignore
+    return _generic_reader(serializer)
+
+
+def _read_felt(data: List[int], position: int) -> Tuple[Any, int]:
+    value = data[position]
+    if not 0 <= value < FIELD_PRIME:
+        raise _InvalidValue()
+    return value, position + 1
+
+
+def _read_bool(data: List[int], position: int) -> Tuple[Any, int]:
+    value = data[position]
+    if value not in (0, 1):
+        raise _InvalidValue()
+    return bool(value), position + 1
+
+
+def _read_uint256(data: List[int], position: int) -> Tuple[Any, int]:
+    low = data[position]
+    high = data[position + 1]
+    if not 0 <= low < _U128_BOUND or not 0 <= high < _U128_BOUND:
+        raise _InvalidValue()
+    return (high << 128) + low, position + 2
+
+
+def _uint_reader(bound: int) -> Reader:
+    def read(data: List[int], position: int) -> Tuple[Any, int]:
+        value = data[position]
+        if not 0 <= value < bound:
+            raise _InvalidValue()
+        return value, position + 1
+
+    return read
+
+
+def _array_reader(inner_serializer: CairoDataSerializer) -> Reader:
+    if type(inner_serializer) is FeltSerializer:
+
+        def read_felts(data: List[int], position: int) -> Tuple[Any, int]:
+            size = data[position]
+            start = position + 1
+            values = data[start : start + size]
+            if len(values) != size:
+                raise _InvalidValue()
+            if values and (min(values) < 0 or max(values) >= FIELD_PRIME):
+                raise _InvalidValue()
+            return values, start + size
+
+        return read_felts
+
+    read_item = _compile_reader(inner_serializer)
+
+    def read(data: List[int], position: int) -> Tuple[Any, int]:
+        size = data[position]
+        position += 1
+        values = []
+        for _ in range(size):
+            value, position = read_item(data, position)
+            values.append(value)
+        return values, position
+
+    return read
+
+
+def _dict_reader(serializers: "OrderedDict[str, CairoDataSerializer]") -> Reader:
+    members = tuple(
+        (name, _compile_reader(serializer)) for name, serializer in serializers.items()
+    )
+
+    def read(data: List[int], position: int) -> Tuple[Any, int]:
+        result = OrderedDict()
+        for name, read_member in members:
+            result[name], position = read_member(data, position)
+        return result, position
+
+    return read
+
+
+def _tuple_reader(serializers: List[CairoDataSerializer]) -> Reader:
+    members = tuple(_compile_reader(serializer) for serializer in serializers)
+
+    def read(data: List[int], position: int) -> Tuple[Any, int]:
+        result = []
+        for read_member in members:
+            value, position = read_member(data, position)
+            result.append(value)
+        return tuple(result), position
+
+    return read
+
+
+def _generic_reader(serializer: CairoDataSerializer) -> Reader:
+    def read(data: List[int], position: int) -> Tuple[Any, int]:
+        context = DeserializationContext(data)
+        context.reader = CalldataReader(data, position)
+        value = serializer.deserialize_with_context(context)
+        return value, context.reader.position
+
+    return read
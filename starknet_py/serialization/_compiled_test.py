@@ -0,0 +1,214 @@
+from collections import OrderedDict
+
+import pytest
+
+from starknet_py.constants import FIELD_PRIME
+from starknet_py.serialization._compiled import (
+    compile_deserializer,
+    compile_serializer,
+)
+from starknet_py.serialization.data_serializers.array_serializer import ArraySerializer
+from starknet_py.serialization.data_serializers.bool_serializer import BoolSerializer
+from starknet_py.serialization.data_serializers.enum_serializer import EnumSerializer
+from starknet_py.serialization.data_serializers.felt_serializer import FeltSerializer
+from starknet_py.serialization.data_serializers.option_serializer import (
+    OptionSerializer,
+)
+from starknet_py.serialization.data_serializers.output_serializer import (
+    OutputSerializer,
+)
+from starknet_py.serialization.data_serializers.payload_serializer import (
+    PayloadSerializer,
+)
+from starknet_py.serialization.data_serializers.struct_serializer import (
+    StructSerializer,
+)
+from starknet_py.serialization.data_serializers.tuple_serializer import (
+    TupleSerializer,
+)
+from starknet_py.serialization.data_serializers.uint_serializer import UintSerializer
+from starknet_py.serialization.data_serializers.unit_serializer import UnitSerializer
+from starknet_py.serialization.errors import InvalidTypeException, InvalidValueException
+from starknet_py.serialization.tuple_dataclass import TupleDataclass
+
+claim_serializer = PayloadSerializer(
+    OrderedDict(
+        claim_data=StructSerializer(
+            OrderedDict(
+                identity=FeltSerializer(),
+                balance=UintSerializer(bits=256),
+                index=UintSerializer(bits=128),
+                merkle_path=ArraySerializer(FeltSerializer()),
+            )
+        ),
+        recipient=FeltSerializer(),
+        options=ArraySerializer(
+            TupleSerializer([BoolSerializer(), OptionSerializer(UintSerializer(8))])
+        ),
+    )
+)
+
+claim = {
+    "claim_data": {
+        "identity": 0x123,
+        "balance": 2**128 + 5,
+        "index": 7,
+        "merkle_path": [FIELD_PRIME - 1, 0, 3],
+    },
+    "recipient": 0x456,
+    "options": [(True, 4), (False, None)],
+}
+
+
+def test_serialize_same_as_serializer():
+    serialized = compile_serializer(claim_serializer)(claim)
+
+    assert serialized == claim_serializer.serialize(claim)
+    assert serialized == [
+        0x123,
+        5,
+        1,
+        7,
+        3,
+        FIELD_PRIME - 1,
+        0,
+        3,
+        0x456,
+        2,
+        1,
+        0,
+        4,
+        0,
+        1,
+    ]
+
+
+# Members without compiled counterparts inside compiled structs and arrays
+delegated_serializer = PayloadSerializer(
+    OrderedDict(
+        events=ArraySerializer(
+            StructSerializer(
+                OrderedDict(
+                    kind=EnumSerializer(
+                        OrderedDict(
+                            empty=UnitSerializer(),
+                            amount=UintSerializer(bits=256),
+                            nested=OptionSerializer(UnitSerializer()),
+                        )
+                    ),
+                    unit=UnitSerializer(),
+                    limit=OptionSerializer(UintSerializer(bits=128)),
+                    path=ArraySerializer(OptionSerializer(FeltSerializer())),
+                )
+            )
+        ),
+        units=TupleSerializer([UnitSerializer(), FeltSerializer(), UnitSerializer()]),
+    )
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        {"events": [], "units": (None, 1, None)},
+        {
+            "events": [
+                {
+                    "kind": {"empty": None},
+                    "unit": None,
+                    "limit": None,
+                    "path": [None, 2],
+                },
+                {"kind": {"amount": 2**128}, "unit": None, "limit": 5, "path": []},
+                {"kind": {"nested": None}, "unit": None, "limit": 0, "path": [3]},
+            ],
+            "units": [None, 4, None],
+        },
+    ),
+)
+def test_delegated_members_same_as_serializer(value, monkeypatch):
+    serialized = delegated_serializer.serialize(value)
+    deserialized = delegated_serializer.deserialize(serialized)
+
+    def fail(*_):
+        raise AssertionError("Compiled function fell back to the serializer")
+
+    monkeypatch.setattr(delegated_serializer, "serialize", fail)
+    monkeypatch.setattr(delegated_serializer, "deserialize", fail)
+
+    assert compile_serializer(delegated_serializer)(value) == serialized
+    assert None not in serialized
+    assert (
+        compile_deserializer(delegated_serializer)(serialized).as_dict()
+        == deserialized.as_dict()
+    )
+
+
+def test_serialize_values_left_to_serializer():
+    serialize = compile_serializer(claim_serializer)
+    # Shortstrings and uint256 given as a dict are handled only by serializers
+    value = {
+        **claim,
+        "claim_data": {
+            **claim["claim_data"],
+            "balance": {"low": 5, "high": 1},
+            "merkle_path": ["abc"],
+        },
+    }
+
+    with pytest.warns(DeprecationWarning):
+        assert serialize(value) == claim_serializer.serialize(value)
+
+
+@pytest.mark.parametrize(
+    "merkle_path, error, message",
+    (
+        (
+            [1, FIELD_PRIME],
+            InvalidValueException,
+            r"Error at path 'claim_data.merkle_path.\[1\]': invalid value",
+        ),
+        (
+            [1, None],
+            InvalidTypeException,
+            r"Error at path 'claim_data.merkle_path.\[1\]': expected int",
+        ),
+    ),
+)
+def test_serialize_errors_have_path(merkle_path, error, message):
+    value = {**claim, "claim_data": {**claim["claim_data"], "merkle_path": merkle_path}}
+
+    with pytest.raises(error, match=message):
+        compile_serializer(claim_serializer)(value)
+
+
+def test_deserialize_same_as_serializer():
+    data = claim_serializer.serialize(claim)
+    deserialized = compile_deserializer(claim_serializer)(data)
+
+    assert isinstance(deserialized, TupleDataclass)
+    assert isinstance(deserialized.claim_data, OrderedDict)
+    assert deserialized.as_dict() == claim_serializer.deserialize(data).as_dict()
+    assert deserialized.options == [(True, 4), (False, None)]
+
+
+def test_deserialize_output():
+    serializer = OutputSerializer([UintSerializer(bits=256), BoolSerializer()])
+
+    assert compile_deserializer(serializer)([1, 1, 0]) == (2**128 + 1, False)
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    (
+        ([1, 2**128, 0], r"Error at path 'output\[0\].high'"),
+        ([1, 0, 2], r"Error at path 'output\[1\]'"),
+        ([1, 0], r"Can't read 1 values at position 2, 0 available"),
+        ([1, 0, 0, 5], r"Last 1 values '0x5' out of total 4 values were not used"),
+    ),
+)
+def test_deserialize_errors(data, message):
+    serializer = OutputSerializer([UintSerializer(bits=256), BoolSerializer()])
+
+    with pytest.raises(InvalidValueException, match=message):
+        compile_deserializer(serializer)(data)
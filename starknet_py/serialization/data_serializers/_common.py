@@ -1,6 +1,6 @@
 # We have to use parametrised type from typing
 from collections import OrderedDict as _OrderedDict
-from typing import Dict, Generator, List, OrderedDict
+from typing import Dict, Generator, Iterable, List, OrderedDict
 
 from starknet_py.serialization._context import (
     DeserializationContext,
@@ -29,6 +29,20 @@ def deserialize_to_list(
     return result
 
 
+def deserialize_repeated(
+    deserializer: CairoDataSerializer, size: int, context: DeserializationContext
+) -> List:
+    """
+    Deserializes ``size`` values of the same type from context to list. Same as
+    deserialize_to_list with ``[deserializer] * size``, without allocating that list.
+    """
+    result = []
+    for index in range(size):
+        with context.push_entity(f"[{index}]"):
+            result.append(deserializer.deserialize_with_context(context))
+    return result
+
+
 def deserialize_to_dict(
     deserializers: OrderedDict[str, CairoDataSerializer],
     context: DeserializationContext,
@@ -62,6 +76,17 @@ def serialize_from_list(
             yield from serializer.serialize_with_context(context, value)
 
 
+def serialize_repeated(
+    serializer: CairoDataSerializer, context: SerializationContext, values: Iterable
+) -> Generator[int, None, None]:
+    """
+    Serializes values of the same type. Used by arrays, which can have any length.
+    """
+    for index, value in enumerate(values):
+        with context.push_entity(f"[{index}]"):
+            yield from serializer.serialize_with_context(context, value)
+
+
 def serialize_from_dict(
     serializers: OrderedDict[str, CairoDataSerializer],
     context: SerializationContext,
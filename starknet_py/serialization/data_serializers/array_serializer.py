@@ -1,17 +1,19 @@
 from dataclasses import dataclass
 from typing import Generator, Iterable, List
 
+from starknet_py.constants import FIELD_PRIME
 from starknet_py.serialization._context import (
     DeserializationContext,
     SerializationContext,
 )
 from starknet_py.serialization.data_serializers._common import (
-    deserialize_to_list,
-    serialize_from_list,
+    deserialize_repeated,
+    serialize_repeated,
 )
 from starknet_py.serialization.data_serializers.cairo_data_serializer import (
     CairoDataSerializer,
 )
+from starknet_py.serialization.data_serializers.felt_serializer import FeltSerializer
 
 
 @dataclass
@@ -30,14 +32,28 @@ class ArraySerializer(CairoDataSerializer[Iterable, List]):
 
     def deserialize_with_context(self, context: DeserializationContext) -> List:
         with context.push_entity("len"):
-            [size] = context.reader.read(1)
+            size = context.reader.read_one()
 
-        return deserialize_to_list([self.inner_serializer] * size, context)
+        if (
+            type(self.inner_serializer) is FeltSerializer
+            and 0 < size <= context.reader.remaining_len
+        ):
+            return _deserialize_felts(context, size)
+        return deserialize_repeated(self.inner_serializer, size, context)
 
     def serialize_with_context(
         self, context: SerializationContext, value: List
     ) -> Generator[int, None, None]:
         yield len(value)
-        yield from serialize_from_list(
-            [self.inner_serializer] * len(value), context, value
-        )
+        yield from serialize_repeated(self.inner_serializer, context, value)
+
+
+def _deserialize_felts(context: DeserializationContext, size: int) -> List:
+    # Felts are read at once, paths of elements are only needed for the error
+    values = context.reader.read(size)
+    if min(values) < 0 or max(values) >= FIELD_PRIME:
+        for index, value in enumerate(values):
+            with context.push_entity(f"[{index}]"):
+                # pylint: disable=protected-access
+                FeltSerializer._ensure_felt(context, value)
+    return values
@@ -3,6 +3,7 @@ import pytest
 from starknet_py.constants import FIELD_PRIME
 from starknet_py.serialization.data_serializers.array_serializer import ArraySerializer
 from starknet_py.serialization.data_serializers.felt_serializer import FeltSerializer
+from starknet_py.serialization.errors import InvalidValueException
 
 felt_array_serializer = ArraySerializer(FeltSerializer())
 
@@ -26,3 +27,18 @@ def test_valid_values(serializer, value, serialized_value):
 
     assert deserialized == value
     assert serialized == serialized_value
+
+
+@pytest.mark.parametrize(
+    "serialized_value, message",
+    [
+        ([2, 1, FIELD_PRIME], r"Error at path '\[1\]': invalid value"),
+        (
+            [3, 1, 2],
+            r"Not enough data to deserialize '\[2\]'. Can't read 1 values at position 3",
+        ),
+    ],
+)
+def test_invalid_felts(serialized_value, message):
+    with pytest.raises(InvalidValueException, match=message):
+        felt_array_serializer.deserialize(serialized_value)
@@ -18,7 +18,7 @@ class BoolSerializer(CairoDataSerializer[bool, int]):
     """
 
     def deserialize_with_context(self, context: DeserializationContext) -> bool:
-        [val] = context.reader.read(1)
+        val = context.reader.read_one()
         self._ensure_bool(context, val)
         return bool(val)
 
@@ -27,7 +27,7 @@ class OptionSerializer(CairoDataSerializer[Optional[Any], Optional[Any]]):
     def deserialize_with_context(
         self, context: DeserializationContext
     ) -> Optional[Any]:
-        (is_none,) = context.reader.read(1)
+        is_none = context.reader.read_one()
         if is_none == 1:
             return None
 
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple
+from typing import Any, Callable, Dict, List, Set, Tuple
 
 from starknet_py.cairo.felt import CairoData
+from starknet_py.serialization._compiled import (
+    compile_deserializer,
+    compile_serializer,
+)
 from starknet_py.serialization.data_serializers.output_serializer import (
     OutputSerializer,
 )
@@ -25,10 +29,20 @@ class FunctionSerializationAdapter:
 
     expected_args: Tuple[str] = field(init=False)
 
+    # Serializers compiled into plain functions, see ``starknet_py.serialization._compiled``
+    _serialize_inputs: Callable[[Dict], CairoData] = field(
+        init=False, repr=False, compare=False
+    )
+    _deserialize_outputs: Callable[[List[int]], Any] = field(
+        init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         self.expected_args = tuple(
             self.inputs_serializer.serializers.keys()
         )  # pyright: ignore
+        self._serialize_inputs = compile_serializer(self.inputs_serializer)
+        self._deserialize_outputs = compile_deserializer(self.outputs_deserializer)
 
     def serialize(self, *args, **kwargs) -> CairoData:
         """
@@ -37,7 +51,7 @@ class FunctionSerializationAdapter:
         :return: Members serialized separately in SerializedPayload.
         """
         named_arguments = self._merge_arguments(args, kwargs)
-        return self.inputs_serializer.serialize(named_arguments)
+        return self._serialize_inputs(named_arguments)
 
     def deserialize(self, data: List[int]) -> TupleDataclass:
         """
@@ -45,7 +59,7 @@ class FunctionSerializationAdapter:
 
         :return: cairo data.
         """
-        return self.outputs_deserializer.deserialize(data)
+        return self._deserialize_outputs(data)
 
     def _merge_arguments(self, args: Tuple, kwargs: Dict) -> Dict:
         """
@@ -107,4 +121,4 @@ class FunctionSerializationAdapterV1(FunctionSerializationAdapter):
 
         :return: cairo data.
         """
-        return self.outputs_deserializer.deserialize(data)
+        return self._deserialize_outputs(data)
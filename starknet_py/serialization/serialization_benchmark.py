@@ -0,0 +1,109 @@
+"""
+Compares serializers with their compiled functions used by ``prepare_call`` and ``call``::
+
+    python -m starknet_py.serialization.serialization_benchmark
+"""
+
+import json
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+from starknet_py.constants import FIELD_PRIME
+from starknet_py.contract import Contract
+from starknet_py.net.full_node_client import FullNodeClient
+
+ABI_DIR = Path(__file__).parents[2] / "abi"
+
+
+def _measure(func: Callable[[], Any], number: int) -> float:
+    """
+    :return: Mean time in microseconds of a single call.
+    """
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def _load_contract(name: str) -> Contract:
+    abi = json.loads((ABI_DIR / f"{name}.json").read_text())
+    return Contract(
+        address=0x1,
+        # The parser doesn't accept several l1 handlers, they aren't needed here anyway
+        abi=[entry for entry in abi if entry["type"] != "l1_handler"],
+        provider=FullNodeClient(node_url="http://127.0.0.1:5050"),
+        cairo_version=1,
+    )
+
+
+def main(number: int = 2000):
+    # pylint: disable=protected-access
+    erc20 = _load_contract("STARKNET_ERC20")
+    claim = _load_contract("Claim")
+
+    transfer = erc20.functions["transfer"]
+    balance_of = erc20.functions["balance_of"]
+    claim_as_caller = claim.functions["claim_as_caller"]
+
+    cases = [
+        (
+            "u256 transfer",
+            transfer,
+            {"recipient": FIELD_PRIME - 1, "amount": 10**24},
+        ),
+    ]
+    for path_length in (16, 1000):
+        cases.append(
+            (
+                f"claim_as_caller, merkle_path of {path_length}",
+                claim_as_caller,
+                {
+                    "claim_data": {
+                        "identity": 0x123,
+                        "balance": 10**21,
+                        "index": 42,
+                        "merkle_path": [
+                            FIELD_PRIME - 1 - index for index in range(path_length)
+                        ],
+                    },
+                    "recipient": FIELD_PRIME - 1,
+                },
+            )
+        )
+
+    for name, function, arguments in cases:
+        adapter = function._payload_transformer
+        number_of_calls = max(number // len(json.dumps(arguments)) * 100, 10)
+        print(f"{name}:")
+        for label, serialize in (
+            (
+                "serializer",
+                lambda adapter=adapter, arguments=arguments: (
+                    adapter.inputs_serializer.serialize(arguments)
+                ),
+            ),
+            (
+                "compiled",
+                lambda adapter=adapter, arguments=arguments: (
+                    adapter._serialize_inputs(arguments)
+                ),
+            ),
+            (
+                "prepare_call",
+                lambda function=function, arguments=arguments: (
+                    function.prepare_call(**arguments)
+                ),
+            ),
+        ):
+            print(f"  {label:<15} {_measure(serialize, number_of_calls):10.1f} us")
+
+    adapter = balance_of._payload_transformer
+    response = [10**24 % 2**128, 10**24 >> 128]
+    print("balance_of response:")
+    for label, deserialize in (
+        ("serializer", lambda: adapter.outputs_deserializer.deserialize(response)),
+        ("compiled", lambda: adapter.deserialize(response)),
+    ):
+        print(f"  {label:<15} {_measure(deserialize, number):10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, fields, make_dataclass
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 
 @dataclass(frozen=True, eq=False)
@@ -49,11 +50,18 @@ class TupleDataclass:
 
     @staticmethod
     def from_dict(data: Dict, *, name: Optional[str] = None) -> TupleDataclass:
-        result_class = make_dataclass(
-            name or "TupleDataclass",
-            fields=[(key, type(value)) for key, value in data.items()],
-            bases=(TupleDataclass,),
-            frozen=True,
-            eq=False,
-        )
+        result_class = _make_tuple_dataclass(name or "TupleDataclass", tuple(data))
         return result_class(**data)
+
+
+# Creating a dataclass takes much longer than deserializing its values, so classes are reused
+# for the same names and fields, e.g. results of the same function.
+@lru_cache(maxsize=4096)
+def _make_tuple_dataclass(name: str, field_names: Tuple[str, ...]) -> type:
+    return make_dataclass(
+        name,
+        fields=[(field_name, Any) for field_name in field_names],
+        bases=(TupleDataclass,),
+        frozen=True,
+        eq=False,
+    )
@@ -34,3 +34,15 @@ def test_wrapped_named_tuple():
         AttributeError, match="object has no attribute 'unknown_attribute'"
     ):
         result.unknown_attribute()
+
+
+def test_classes_are_reused():
+    first = TupleDataclass.from_dict({"low": 1, "high": [2]})
+    second = TupleDataclass.from_dict({"low": "a", "high": 3})
+
+    assert type(first) is type(second)
+    assert type(first) is not type(TupleDataclass.from_dict({"high": 1, "low": 2}))
+    assert type(first) is not type(
+        TupleDataclass.from_dict({"low": 1, "high": 2}, name="Uint256")
+    )
+    assert second.as_dict() == {"low": "a", "high": 3}
@@ -106,3 +106,4 @@ CONTRACTS_COMPILED_V1_DIR = MOCK_DIR / "contracts_compiled_v1"
 CONTRACTS_COMPILED_V2_DIR = MOCK_DIR / "contracts_compiled_v2"
 CONTRACTS_PRECOMPILED_DIR = CONTRACTS_COMPILED_V0_DIR / "precompiled"
 ACCOUNT_DIR = MOCK_DIR / "account"
+RPC_RESPONSES_DIR = MOCK_DIR / "rpc_responses"
@@ -0,0 +1,184 @@
+import json
+import os
+import typing
+from pathlib import Path
+
+from logger import logging
+
+
+class StateJournal:
+    """
+    Append-only set of addresses stored as a JSON-lines journal.
+
+    Every added address is appended to the journal as a single line, membership checks are
+    served from an in-memory set. On open, the journal is replayed: lines left incomplete by a
+    crash are dropped and the journal is compacted. Addresses from ``legacy_path`` (old JSON
+    array files) are imported on first open.
+
+    With ``fsync`` every line is flushed to disk before ``add`` returns, so an acknowledged
+    address survives a crash. Without it, a crash of the machine may lose the last addresses.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        legacy_path: str | Path | None = None,
+        fsync: bool = True
+    ):
+        self.path = Path(path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self.fsync = fsync
+        self._addresses: set[str] = set()
+        self._file = None
+
+        self.recover()
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._addresses
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def __iter__(self):
+        return iter(self._addresses)
+
+    def _read_legacy(self) -> list[str]:
+        if self.legacy_path is None or not self.legacy_path.exists():
+            return []
+
+        with open(self.legacy_path) as file:
+            addresses = json.load(file)
+
+        logging.info(f'[State] Imported {len(addresses)} addresses from "{self.legacy_path.name}"')
+        return addresses
+
+    def recover(self) -> int:
+        """
+        Replays the journal into memory, dropping corrupted lines.
+
+        :return: Number of dropped lines.
+        """
+        self.close()
+        self._addresses = set()
+
+        if not self.path.exists():
+            self._addresses.update(self._read_legacy())
+            self.compact()
+            return 0
+
+        dropped = 0
+        terminated = True
+        with open(self.path) as file:
+            for line in file:
+                terminated = line.endswith('\n')
+                if not line.strip():
+                    continue
+                try:
+                    self._addresses.add(json.loads(line))
+                except json.JSONDecodeError:
+                    dropped += 1
+
+        if dropped:
+            logging.warning(f'[State] Dropped {dropped} corrupted lines from "{self.path.name}"')
+
+        if dropped or not terminated:
+            self.compact()
+
+        return dropped
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.path, 'a')
+        return self._file
+
+    def add(self, address: str) -> bool:
+        """
+        Appends an address to the journal, durably if ``fsync`` is set.
+
+        :return: False if the address was already present.
+        """
+        if address in self._addresses:
+            return False
+
+        file = self._open()
+        file.write(json.dumps(address) + '\n')
+        file.flush()
+        if self.fsync:
+            os.fsync(file.fileno())
+
+        self._addresses.add(address)
+        return True
+
+    def compact(self):
+        """
+        Atomically rewrites the journal to contain every address exactly once.
+        """
+        self.close()
+
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w') as file:
+            file.writelines(json.dumps(address) + '\n' for address in sorted(self._addresses))
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, self.path)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ComissionLedger:
+    """
+    Tracks accounts whose comission is already paid.
+
+    Unpaid accounts are kept sorted by amount (largest first) and consumed through a cursor,
+    so recording a payment costs O(accounts covered by it). Methods never await, so the
+    ledger can be shared between workers without a lock.
+    """
+
+    def __init__(
+        self,
+        accounts: typing.Iterable[typing.Any],
+        paid: StateJournal,
+        rate: float
+    ):
+        self.paid = paid
+        self.rate = rate
+        self._unpaid = sorted(
+            (account for account in accounts if account.address not in paid),
+            key=lambda account: account.amount,
+            reverse=True
+        )
+        self._cursor = 0
+        self.total_unpaid = sum(account.amount for account in self._unpaid) * rate
+        self.total_paid = 0
+
+    def record_payment(self, amount: float) -> list[typing.Any]:
+        """
+        Marks unpaid accounts as paid until their comission covers ``amount``.
+
+        :return: Accounts covered by the payment.
+        """
+        covered = []
+        credited = 0
+
+        while self._cursor < len(self._unpaid):
+            account = self._unpaid[self._cursor]
+            self._cursor += 1
+
+            if account.address in self.paid:
+                continue
+
+            comission = account.amount * self.rate
+            credited += comission
+            self.total_unpaid -= comission
+            self.paid.add(account.address)
+            covered.append(account)
+
+            if credited >= amount:
+                break
+
+        self.total_paid += credited
+        return covered
@@ -0,0 +1,103 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from state import ComissionLedger, StateJournal
+
+
+def test_added_addresses_are_replayed(tmp_path):
+    journal = StateJournal(tmp_path / 'claimed.jsonl')
+
+    assert journal.add('0x1')
+    assert journal.add('0x2')
+    assert not journal.add('0x1')
+    journal.close()
+
+    reopened = StateJournal(tmp_path / 'claimed.jsonl')
+    assert set(reopened) == {'0x1', '0x2'}
+    assert (tmp_path / 'claimed.jsonl').read_text() == '"0x1"\n"0x2"\n'
+
+
+def test_recovers_after_partial_write(tmp_path):
+    path = tmp_path / 'claimed.jsonl'
+    path.write_text('"0x1"\nnot json\n"0x2"\n"0x3')
+
+    journal = StateJournal(path)
+
+    assert set(journal) == {'0x1', '0x2'}
+    assert path.read_text() == '"0x1"\n"0x2"\n'
+    journal.add('0x4')
+    journal.close()
+    assert set(StateJournal(path)) == {'0x1', '0x2', '0x4'}
+
+
+def test_imports_legacy_file(tmp_path):
+    legacy_path = tmp_path / 'claimed.json'
+    legacy_path.write_text(json.dumps(['0x1', '0x2', '0x1']))
+
+    journal = StateJournal(tmp_path / 'claimed.jsonl', legacy_path)
+
+    assert set(journal) == {'0x1', '0x2'}
+    assert (tmp_path / 'claimed.jsonl').read_text() == '"0x1"\n"0x2"\n'
+
+    # The journal takes precedence once it exists
+    legacy_path.write_text(json.dumps(['0x3']))
+    journal.close()
+    assert set(StateJournal(tmp_path / 'claimed.jsonl', legacy_path)) == {'0x1', '0x2'}
+
+
+def test_compaction_round_trip(tmp_path):
+    path = tmp_path / 'claimed.jsonl'
+    path.write_text('"0x2"\n\n"0x1"\n"0x2"\n')
+    journal = StateJournal(path, fsync=False)
+
+    journal.compact()
+
+    assert path.read_text() == '"0x1"\n"0x2"\n'
+    assert not path.with_name('claimed.jsonl.tmp').exists()
+    assert set(StateJournal(path)) == set(journal) == {'0x1', '0x2'}
+
+
+def _account(address: str, amount: float) -> SimpleNamespace:
+    return SimpleNamespace(address=address, amount=amount)
+
+
+def test_ledger_skips_paid_accounts(tmp_path):
+    paid = StateJournal(tmp_path / 'paid.jsonl', fsync=False)
+    paid.add('0x1')
+
+    ledger = ComissionLedger([_account('0x1', 100), _account('0x2', 50)], paid, rate=0.1)
+
+    assert ledger.total_unpaid == pytest.approx(5)
+    assert ledger.total_paid == 0
+
+
+def test_ledger_records_payments(tmp_path):
+    paid = StateJournal(tmp_path / 'paid.jsonl', fsync=False)
+    accounts = [_account('0x1', 10), _account('0x2', 30), _account('0x3', 20)]
+    ledger = ComissionLedger(accounts, paid, rate=0.1)
+    assert ledger.total_unpaid == pytest.approx(6)
+
+    # Largest accounts are covered first, until their comission covers the payment
+    covered = ledger.record_payment(4)
+
+    assert [account.address for account in covered] == ['0x2', '0x3']
+    assert ledger.total_unpaid == pytest.approx(1)
+    assert ledger.total_paid == pytest.approx(5)
+    assert set(paid) == {'0x2', '0x3'}
+
+    # Accounts paid elsewhere are passed by the cursor without being credited
+    paid.add('0x1')
+    assert ledger.record_payment(1) == []
+    assert ledger.total_paid == pytest.approx(5)
+
+
+def test_ledger_payment_larger_than_unpaid(tmp_path):
+    paid = StateJournal(tmp_path / 'paid.jsonl', fsync=False)
+    ledger = ComissionLedger([_account('0x1', 10), _account('0x2', 30)], paid, rate=0.1)
+
+    assert len(ledger.record_payment(100)) == 2
+    assert ledger.total_unpaid == pytest.approx(0)
+    assert ledger.total_paid == pytest.approx(4)
+    assert ledger.record_payment(1) == []
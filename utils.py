@@ -1,22 +1,169 @@
+import asyncio
 import json
 import random
 import time
+from functools import cache
 from pathlib import Path
 
 import aiohttp
+from aiohttp import web
 
 from config import Config
 from logger import logging
 from starknet_py.contract import Contract
 from starknet_py.net.account.account import Account
+from starknet_py.net.account.cairo_version_cache import CairoVersionCache
+from starknet_py.net.account.fee_estimator import FeeEstimator
+from starknet_py.net.client_errors import ClientError
 from starknet_py.net.client_models import TransactionReceipt
 from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import SessionPool
+from starknet_py.net.metrics import Metrics
 from starknet_py.net.models import StarknetChainId
+from starknet_py.net.multi_node_client import EndpointPool, MultiNodeClient
+from starknet_py.net.rate_limiter import RateLimiter
+from starknet_py.net.receipt_watcher import ReceiptWatcher
+from starknet_py.net.retry_policy import CircuitOpenError, RetryPolicy, is_http_error, is_transient_error
 from starknet_py.net.signer.stark_curve_signer import KeyPair, StarkCurveSigner
 from starknet_py.transaction_errors import TransactionNotReceivedError, TransactionRejectedError, TransactionRevertedError
 
 config = Config.load()
 
+# Contract not found, class hash not found, insufficient account balance
+PERMANENT_RPC_ERROR_CODES = {20, 28, 54}
+
+session_pool = SessionPool(limit_per_host=config.connections_per_host)
+
+cairo_version_cache = CairoVersionCache('cairo_versions.json')
+
+
+def is_retryable_error(e: BaseException) -> bool:
+    if isinstance(e, CircuitOpenError):
+        return False
+    if isinstance(e, aiohttp.ClientResponseError) or is_http_error(e):
+        return is_transient_error(e)
+    if isinstance(e, ClientError):
+        return e.code not in PERMANENT_RPC_ERROR_CODES
+    return True
+
+
+http_retry_policy = RetryPolicy(
+    max_attempts=config.http_max_attempts,
+    base_delay=config.retry_base_delay,
+    max_delay=config.retry_max_delay,
+    breaker_threshold=config.breaker_threshold or None,
+    breaker_reset_timeout=config.breaker_reset_timeout
+)
+
+account_retry_policy = RetryPolicy(
+    max_attempts=max(config.max_retries, 1),
+    base_delay=config.retry_base_delay,
+    max_delay=config.retry_max_delay,
+    is_transient=is_retryable_error
+)
+
+rpc_metrics = Metrics('starknet_rpc')
+
+app_metrics = Metrics('claimer')
+
+endpoint_pool = EndpointPool([config.rpc_url, *config.rpc_urls])
+
+rate_limiter = RateLimiter(
+    endpoint_rate=config.rpc_rate_limit or None,
+    proxy_rate=config.proxy_rate_limit or None
+)
+
+
+def get_client(proxy: str | None = None) -> FullNodeClient:
+    if len(endpoint_pool.endpoints) > 1:
+        return MultiNodeClient(
+            endpoint_pool,
+            proxy=proxy,
+            session_pool=session_pool,
+            timeout=config.rpc_timeout,
+            rate_limiter=rate_limiter,
+            retry_policy=http_retry_policy,
+            metrics=rpc_metrics,
+            trusted_node=config.rpc_trusted
+        )
+
+    return FullNodeClient(
+        config.rpc_url,
+        proxy=proxy,
+        session_pool=session_pool,
+        rate_limiter=rate_limiter,
+        retry_policy=http_retry_policy,
+        metrics=rpc_metrics,
+        trusted_node=config.rpc_trusted
+    )
+
+
+def log_rate_limits():
+    stats = rate_limiter.stats()
+
+    for url, bucket in stats['endpoints'].items():
+        logging.info(
+            f'[Rate Limit] {url}: {bucket.utilization:.0%} used, {bucket.waiting} waiting, '
+            f'{bucket.acquired} requests, {bucket.total_wait:.1f}s waited'
+        )
+
+    if stats['proxies']:
+        proxies = stats['proxies'].values()
+        logging.info(
+            f'[Rate Limit] {len(proxies)} proxies: {max(bucket.utilization for bucket in proxies):.0%} max used, '
+            f'{sum(bucket.waiting for bucket in proxies)} waiting, '
+            f'{sum(bucket.acquired for bucket in proxies)} requests'
+        )
+
+
+def dump_metrics(path: str | Path):
+    path = Path(path)
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'w') as file:
+        json.dump(
+            {
+                'rpc': rpc_metrics.to_dict(),
+                'app': app_metrics.to_dict()
+            },
+            file,
+            indent=4
+        )
+    temp_path.replace(path)
+
+
+def report_progress():
+    log_rate_limits()
+
+    if config.metrics_path:
+        dump_metrics(config.metrics_path)
+
+
+async def start_metrics_server(port: int) -> web.AppRunner:
+    async def handle(request: web.Request) -> web.Response:
+        return web.Response(
+            text=rpc_metrics.to_prometheus() + app_metrics.to_prometheus(),
+            content_type='text/plain'
+        )
+
+    runner = web.AppRunner(web.Application())
+    runner.app.router.add_get('/metrics', handle)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', port).start()
+    logging.info(f'[Metrics] Serving metrics at http://127.0.0.1:{port}/metrics')
+    return runner
+
+
+rpc_client = get_client()
+
+receipt_watcher = ReceiptWatcher(rpc_client)
+
+fee_estimator = FeeEstimator(
+    client=rpc_client,
+    chunk_size=config.fee_estimate_chunk_size,
+    template_ttl=config.fee_template_ttl,
+    cairo_version_cache=cairo_version_cache
+) if config.fee_estimate_chunk_size > 0 else None
+
 
 def get_account(
     private_key: str,
@@ -24,10 +171,7 @@ def get_account(
     proxy: dict[str, str] = None,
     signer_class=None
 ) -> Account:
-    client = FullNodeClient(
-        config.rpc_url,
-        proxy=proxy if proxy is None else proxy['http']
-    )
+    client = get_client(proxy=proxy if proxy is None else proxy['http'])
 
     key_pair = KeyPair.from_private_key(
         key=private_key
@@ -48,7 +192,10 @@ def get_account(
         client=client,
         address=address,
         signer=signer,
-        chain=chain_id
+        chain=chain_id,
+        manage_nonce=True,
+        cairo_version_cache=cairo_version_cache,
+        fee_estimator=fee_estimator
     )
 
 
@@ -80,58 +227,72 @@ def random_sleep():
     sleep(sleep_time)
 
 
-async def test_proxy(proxy: dict[str, str]) -> str | bool:
-    try:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-            response = await session.get(
-                url='https://geo.geosurf.io/',
-                proxy=proxy
-            )
-    except KeyboardInterrupt:
-        raise
-    except Exception:
-        try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-                response = await session.get(
-                    url='https://google.com',
-                    proxy=proxy
-                )
-        except KeyboardInterrupt:
-            raise
-        except Exception as e:
-            return False
-        else:
-            return True
-    else:
-        ip_json = await response.json()
-        if 'ip' in ip_json:
-            ip = ip_json['ip']
-            country = ip_json['country']
-            return f'{ip} ({country})'
-        else:
-            return True
-
-
 def extend_hex(hex_str: str | int, length: int) -> str:
     if isinstance(hex_str, int):
         hex_str = hex(hex_str)
     return hex_str.replace('0x', '0x' + '0' * (length - len(hex_str) + 2))
 
 
+@cache
+def load_abi(name: str) -> list:
+    with open(Path(__file__).parent / 'abi' / f'{name}.json') as file:
+        return json.load(file)
+
+
 def get_starknet_erc20_contract(
     token_address: str,
     provider: Account
 ) -> Contract:
-    with open(Path(__file__).parent / 'abi' / 'STARKNET_ERC20.json') as file:
-        erc20_abi = json.load(file)
-
     return get_starknet_contract(
         address=token_address,
-        abi=erc20_abi,
+        abi=load_abi('STARKNET_ERC20'),
         provider=provider
     )
 
 
+async def prefetch_balances(
+    token_address: str,
+    addresses: list[str],
+    chunk_size: int = 100,
+    concurrency: int = 5
+) -> dict[str, int]:
+    balance_of = get_starknet_contract(
+        address=token_address,
+        abi=load_abi('STARKNET_ERC20'),
+        provider=rpc_client
+    ).functions['balance_of']
+
+    semaphore = asyncio.Semaphore(concurrency)
+    balances = {}
+
+    async def fetch_chunk(chunk: list[str]):
+        async with semaphore:
+            try:
+                async with rpc_client.batch() as batch:
+                    calls = {
+                        address: batch.call_contract(balance_of.prepare_call(int(address, 16)))
+                        for address in chunk
+                    }
+            except Exception as e:
+                logging.warning(f'[Balances] Failed to fetch balances of {len(chunk)} accounts: {e}')
+                return
+
+        for address, call in calls.items():
+            if call.exception() is not None:
+                logging.warning(f'[Balances] Failed to fetch balance of {address}: {call.exception()}')
+                continue
+            # balance_of returns u256 as (low, high)
+            low, high = call.result()
+            balances[address] = low + (high << 128)
+
+    await asyncio.gather(*[
+        fetch_chunk(addresses[start:start + chunk_size])
+        for start in range(0, len(addresses), chunk_size)
+    ])
+
+    return balances
+
+
 def int_hash_to_hex(hast_int: int, hash_lenght: int = 64) -> str:
     hash_hex = hex(hast_int)[2:]
     hash_hex = hash_hex.rjust(hash_lenght, '0')
@@ -139,23 +300,22 @@ def int_hash_to_hex(hast_int: int, hash_lenght: int = 64) -> str:
 
 
 async def wait_for_starknet_receipt(
-    client: FullNodeClient,
     transaction_hash: int,
     wait_seconds: float = 300,
     logging_prefix: str = 'Receipt'
 ) -> TransactionReceipt:
     start_time = time.time()
-    while True:
-        try:
-            return await client.wait_for_tx(transaction_hash)
-        except (TransactionRejectedError, TransactionNotReceivedError, TransactionRevertedError):
-            raise
-        except BaseException as e:
-            if time.time() - start_time > wait_seconds:
-                input(f'[{logging_prefix}] Failed to get transaction receipt. Press Enter when transaction will be processed')
-                try:
-                    return await client.wait_for_tx(transaction_hash)
-                except BaseException as new_e:
-                    logging.error(f'[{logging_prefix}] Failed to get transaction receipt: {new_e}')
-                    raise
-            logging.warning(f'[{logging_prefix}] Error while getting transaction receipt: {e}')
+    attempt = 0
+    with app_metrics.time('receipt_wait'):
+        while True:
+            try:
+                return await receipt_watcher.wait_for_tx(transaction_hash)
+            except (TransactionRejectedError, TransactionNotReceivedError, TransactionRevertedError):
+                raise
+            except Exception as e:
+                if time.time() - start_time > wait_seconds:
+                    logging.error(f'[{logging_prefix}] Failed to get transaction receipt: {e}')
+                    raise TransactionNotReceivedError() from e
+                logging.warning(f'[{logging_prefix}] Error while getting transaction receipt: {e}')
+                await asyncio.sleep(account_retry_policy.backoff(attempt))
+                attempt += 1